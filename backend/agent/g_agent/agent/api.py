@@ -68,7 +68,7 @@ class Agent:
         """Build default provider from config routing settings."""
         api_key = route.api_key
         if not api_key and route.provider not in {"vllm", "bedrock"}:
-            api_key = self.config.get_api_key(route.model)
+            api_key = self.config.fallback_api_key()
         model = self.config.agents.defaults.model
         is_bedrock = route.provider == "bedrock" or model.startswith("bedrock/")
         if (
@@ -3,11 +3,12 @@
 import hashlib
 import json
 import re
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from g_agent.utils.helpers import ensure_dir, today_date
+from g_agent.utils.helpers import ensure_dir, today_date, write_bytes_atomic
 
 
 class MemoryStore:
@@ -83,6 +84,7 @@ class MemoryStore:
         ("time zone", "timezone"),
         ("zona waktu", "timezone"),
     )
+    SUMMARY_FRAGMENT_RE = re.compile(r"([a-zA-Z0-9_ \-]{2,40}\s*[:=]\s*[^;,.|]+)")
     SEMANTIC_TOKEN_MAP = {
         "jadwal": "schedule",
         "schedule": "schedule",
@@ -115,6 +117,7 @@ class MemoryStore:
         self.projects_file = self.memory_dir / "PROJECTS.md"
         self.summaries_file = self.memory_dir / "SUMMARIES.md"
         self.facts_file = self.memory_dir / "FACTS.md"
+        self._fact_index_lock = threading.Lock()
         self._ensure_scaffold()
 
     def _ensure_scaffold(self) -> None:
@@ -212,9 +215,9 @@ class MemoryStore:
         return ""
 
     def _safe_write(self, path: Path, content: str) -> bool:
-        """Write file safely."""
+        """Write file safely; readers never see a half-written file (write-then-rename)."""
         try:
-            path.write_text(content, encoding="utf-8")
+            write_bytes_atomic(path, content.encode("utf-8"))
             return True
         except OSError:
             return False
@@ -249,11 +252,11 @@ class MemoryStore:
             return fallback_iso
         return parsed.astimezone(timezone.utc).replace(microsecond=0).isoformat()
 
-    def _age_days(self, iso_value: str | None) -> int:
+    def _age_days(self, iso_value: str | None, now: datetime | None = None) -> int:
         parsed = self._parse_timestamp(iso_value)
         if not parsed:
             return 30
-        delta = datetime.now(timezone.utc) - parsed.astimezone(timezone.utc)
+        delta = (now or datetime.now(timezone.utc)) - parsed.astimezone(timezone.utc)
         return max(0, int(delta.total_seconds() // 86400))
 
     def _clamp_confidence(self, value: Any) -> float:
@@ -436,8 +439,7 @@ class MemoryStore:
 
         return records
 
-    def _load_fact_index(self) -> list[dict[str, Any]]:
-        """Load schema-based fact index; bootstrap from MEMORY.md if missing."""
+    def _read_fact_records(self) -> list[dict[str, Any]]:
         records: list[dict[str, Any]] = []
         for raw_line in self._safe_read(self.facts_file).splitlines():
             line = raw_line.strip()
@@ -449,13 +451,22 @@ class MemoryStore:
                 continue
             if isinstance(item, dict):
                 records.append(item)
+        return records
 
+    def _load_fact_index(self) -> list[dict[str, Any]]:
+        """Load schema-based fact index; bootstrap from MEMORY.md if missing."""
+        records = self._read_fact_records()
         if records:
             return records
 
-        bootstrapped = self._bootstrap_fact_index_from_long_term()
-        if bootstrapped:
-            self._write_fact_index(bootstrapped)
+        with self._fact_index_lock:
+            # Another reader may have bootstrapped the index while we waited.
+            records = self._read_fact_records()
+            if records:
+                return records
+            bootstrapped = self._bootstrap_fact_index_from_long_term()
+            if bootstrapped:
+                self._write_fact_index(bootstrapped)
         return bootstrapped
 
     def get_today_file(self) -> Path:
@@ -836,6 +847,7 @@ class MemoryStore:
 
         if "long-term" in active_scopes:
             records = self._load_fact_index()
+            now_utc = datetime.now(timezone.utc)
             for item in records:
                 if item.get("status", "active") != "active":
                     continue
@@ -845,7 +857,10 @@ class MemoryStore:
                 add_candidate(
                     source_label="long-term",
                     text=fact_text,
-                    age_days=self._age_days(item.get("last_seen") or item.get("created_at")),
+                    age_days=self._age_days(
+                        item.get("last_seen") or item.get("created_at"),
+                        now=now_utc,
+                    ),
                     source_type="long-term",
                     confidence=self._clamp_confidence(item.get("confidence")),
                     metadata={
@@ -1127,11 +1142,12 @@ class MemoryStore:
             entries = by_key[key]
             if len(entries) < 2:
                 continue
-            unique_values = {item["value_normalized"] for item in entries}
-            if len(unique_values) < 2:
-                continue
-            involved_scopes = {item["scope"] for item in entries}
-            if len(involved_scopes) < 2:
+            unique_values: set[str] = set()
+            involved_scopes: set[str] = set()
+            for item in entries:
+                unique_values.add(item["value_normalized"])
+                involved_scopes.add(item["scope"])
+            if len(unique_values) < 2 or len(involved_scopes) < 2:
                 continue
 
             ordered = sorted(
@@ -1187,7 +1203,8 @@ class MemoryStore:
         - fact_id
         - summary_line
         """
-        active_by_key: dict[str, dict[str, Any]] = {}
+        # Normalize each active fact once up front instead of per summary fragment.
+        active_by_key: dict[str, tuple[dict[str, Any], str, str]] = {}
         for item in self._load_fact_index():
             if item.get("status", "active") != "active":
                 continue
@@ -1195,7 +1212,8 @@ class MemoryStore:
             text = str(item.get("text", "")).strip()
             if not key or not text:
                 continue
-            active_by_key[key] = item
+            active_value = self._extract_fact_value(text) or text
+            active_by_key[key] = (item, text, self._normalize_fact_value(active_value))
 
         if not active_by_key:
             return []
@@ -1218,8 +1236,7 @@ class MemoryStore:
 
             fragments: list[str] = []
             fragments.extend(
-                match.group(1).strip()
-                for match in re.finditer(r"([a-zA-Z0-9_ \-]{2,40}\s*[:=]\s*[^;,.|]+)", body)
+                match.group(1).strip() for match in self.SUMMARY_FRAGMENT_RE.finditer(body)
             )
             if not fragments:
                 fragments = [body]
@@ -1228,15 +1245,13 @@ class MemoryStore:
                 key = self._extract_fact_key(fragment)
                 if not key:
                     continue
-                active = active_by_key.get(key)
-                if not active:
+                active_entry = active_by_key.get(key)
+                if not active_entry:
                     continue
+                active, active_text, active_norm = active_entry
 
                 summary_value = self._extract_fact_value(fragment) or fragment
                 summary_norm = self._normalize_fact_value(summary_value)
-                active_text = str(active.get("text", "")).strip()
-                active_value = self._extract_fact_value(active_text) or active_text
-                active_norm = self._normalize_fact_value(active_value)
                 if not summary_norm or not active_norm:
                     continue
                 if summary_norm == active_norm:
@@ -1,8 +1,12 @@
 """Google Workspace tools (Gmail/Calendar/Drive/Docs/Sheets/Contacts) via REST API."""
 
+import asyncio
 import base64
 import json
 import os
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from typing import Any
 from urllib.parse import quote
@@ -18,6 +22,23 @@ def _env(name: str, default: str = "") -> str:
     return os.environ.get(f"G_AGENT_{key}", default)
 
 
+# Cap on in-flight Google API calls per event loop, shared by every client in the
+# process (tools, calendar watch) so bursts stay under per-project QPS limits.
+_MAX_CONCURRENT_REQUESTS = 5
+_request_slots_by_loop: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _request_slots() -> asyncio.Semaphore:
+    """Return the running loop's request semaphore (semaphores are loop-bound)."""
+    loop = asyncio.get_running_loop()
+    slots = _request_slots_by_loop.get(loop)
+    if slots is None:
+        slots = _request_slots_by_loop[loop] = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
+    return slots
+
+
 def _extract_google_error_reason(payload: dict[str, Any]) -> tuple[str, str, list[str]]:
     """Extract message/status/reasons from Google error payload."""
     error_obj = payload.get("error")
@@ -109,12 +130,15 @@ class GoogleWorkspaceClient:
         refresh_token: str = "",
         access_token: str = "",
         calendar_id: str = "primary",
+        http_client: httpx.AsyncClient | None = None,
     ):
         self.client_id = client_id or _env("GOOGLE_CLIENT_ID", "")
         self.client_secret = client_secret or _env("GOOGLE_CLIENT_SECRET", "")
         self.refresh_token = refresh_token or _env("GOOGLE_REFRESH_TOKEN", "")
         self.access_token = access_token or _env("GOOGLE_ACCESS_TOKEN", "")
         self.calendar_id = calendar_id or _env("GOOGLE_CALENDAR_ID", "primary")
+        # Optional long-lived pooled client owned by the caller (never closed here).
+        self.http_client = http_client
 
         self._cached_token = self.access_token
         if self._can_refresh():
@@ -125,6 +149,15 @@ class GoogleWorkspaceClient:
         else:
             self._token_expiry = None
 
+    @asynccontextmanager
+    async def _client(self) -> AsyncIterator[httpx.AsyncClient]:
+        """Yield the injected client, or a short-lived one when none was given."""
+        if self.http_client is not None:
+            yield self.http_client
+            return
+        async with httpx.AsyncClient(timeout=20.0) as client:
+            yield client
+
     def is_configured(self) -> bool:
         """Return True if at least one workable auth path exists."""
         if self._cached_token:
@@ -152,7 +185,7 @@ class GoogleWorkspaceClient:
             return False, "Google credentials not configured."
 
         try:
-            async with httpx.AsyncClient(timeout=20.0) as client:
+            async with self._client() as client, _request_slots():
                 response = await client.post(
                     "https://oauth2.googleapis.com/token",
                     data={
@@ -189,15 +222,17 @@ class GoogleWorkspaceClient:
         token = token_or_error
 
         try:
-            async with httpx.AsyncClient(timeout=20.0) as client:
+            async with self._client() as client:
                 for attempt in range(2):
-                    response = await client.request(
-                        method=method.upper(),
-                        url=url,
-                        params=params,
-                        json=json_body,
-                        headers={"Authorization": f"Bearer {token}"},
-                    )
+                    # Slot held per send only: the 401 path below refreshes, which takes its own.
+                    async with _request_slots():
+                        response = await client.request(
+                            method=method.upper(),
+                            url=url,
+                            params=params,
+                            json=json_body,
+                            headers={"Authorization": f"Bearer {token}"},
+                        )
 
                     payload = {}
                     try:
@@ -696,7 +731,7 @@ class DriveReadTextTool(Tool):
             url = f"https://www.googleapis.com/drive/v3/files/{quote(file_id, safe='')}?alt=media"
 
         try:
-            async with httpx.AsyncClient(timeout=20.0) as client:
+            async with self.client._client() as client, _request_slots():
                 response = await client.get(url, headers={"Authorization": f"Bearer {token}"})
             if response.status_code >= 400:
                 return f"Error: HTTP {response.status_code} while reading file."
@@ -1,19 +1,29 @@
 """CLI commands for g-agent."""
 
-import asyncio
 import json
+import os
+import sys
+from collections import Counter
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from time import perf_counter
-from typing import Any
-from urllib.parse import quote
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+from urllib.parse import quote, quote_plus
 
 import typer
-from rich.console import Console
+from rich.console import Console, Group
+from rich.markup import escape
 from rich.table import Table
+from rich.text import Text
 
 from g_agent import __brand__, __logo__, __version__
 
+if TYPE_CHECKING:
+    import httpx
+
+    from g_agent.cron.types import CronSchedule
+
 app = typer.Typer(
     name="g-agent",
     help=f"{__logo__} {__brand__} - Personal AI Assistant",
@@ -22,6 +32,47 @@ app = typer.Typer(
 
 console = Console()
 
+_FEEDBACK_SEVERITIES = ("low", "medium", "high")
+_FIX_OK_STATUSES = ("applied", "unchanged")
+_APPROVAL_MODES = ("off", "confirm")
+_CHECK_MARKS = {
+    "pass": "[green]PASS[/green]",
+    "warn": "[yellow]WARN[/yellow]",
+    "fail": "[red]FAIL[/red]",
+}
+# Status cells parsed from markup once; Text.assemble/Table copy them, never mutate.
+_OK_CELL = Text.from_markup("[green]✓[/green]")
+_MISSING_CELL = Text.from_markup("[yellow]missing[/yellow]")
+_NOT_CACHED_CELL = Text.from_markup("[dim]not cached[/dim]")
+_NOT_CONFIGURED_CELL = Text.from_markup("[dim]not configured[/dim]")
+_PROACTIVE_JOB_NAMES = frozenset({"daily-digest", "weekly-lessons-distill", "calendar-watch"})
+_PROACTIVE_JOB_PREFIX = "pd-"
+# Backslash escapes keep tabs/newlines inside a TSV field from breaking the row layout.
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+# Doctor's memory-file rows in display order: (filename, check label, fix hint).
+# "{today}" in a filename is today's date; hints may use {memory_dir} and {path}.
+_DOCTOR_MEMORY_CHECKS: tuple[tuple[str, str, str], ...] = (
+    (
+        "MEMORY.md",
+        "Memory file",
+        "Run: mkdir -p {memory_dir} && printf '# Long-term Memory\\n' > {path}",
+    ),
+    ("FACTS.md", "Fact index", "Create by using remember tool once (or run g-agent onboard)"),
+    ("PROFILE.md", "Profile memory", "Create with: g-agent onboard (or create memory/PROFILE.md)"),
+    (
+        "RELATIONSHIPS.md",
+        "Relationships memory",
+        "Create with: g-agent onboard (or create memory/RELATIONSHIPS.md)",
+    ),
+    (
+        "PROJECTS.md",
+        "Projects memory",
+        "Create with: g-agent onboard (or create memory/PROJECTS.md)",
+    ),
+    ("{today}.md", "Today memory note", "Create by chatting once (or write file manually)"),
+    ("LESSONS.md", "Lessons memory", 'Create with: g-agent feedback "<lesson>"'),
+)
+
 
 def _cli_fail(cause: str, fix: str | None = None, *, exit_code: int = 1) -> None:
     """Print a consistent CLI error block and exit."""
@@ -31,6 +82,106 @@ def _cli_fail(cause: str, fix: str | None = None, *, exit_code: int = 1) -> None
     raise typer.Exit(exit_code)
 
 
+def _emit_json(payload: Any) -> None:
+    """Write a JSON payload straight to stdout (no Rich markup/wrapping) in one write."""
+    from g_agent.utils.helpers import json_dumps_pretty
+
+    data = json_dumps_pretty(payload, ensure_ascii=False) + b"\n"
+    stdout = sys.stdout
+    buffer = getattr(stdout, "buffer", None)
+    if buffer is not None and (stdout.encoding or "").lower().replace("-", "") == "utf8":
+        # Already UTF-8: skip the decode/re-encode round trip through the text layer.
+        stdout.flush()
+        buffer.write(data)
+        buffer.flush()
+        return
+    stdout.write(data.decode("utf-8"))
+    stdout.flush()
+
+
+def _emit_tsv(rows: list[tuple[str, ...]]) -> None:
+    """Write plain tab-separated rows to stdout (used instead of tables when piped)."""
+    escapes = _TSV_ESCAPES
+    sys.stdout.write(
+        "".join("\t".join(field.translate(escapes) for field in row) + "\n" for row in rows)
+    )
+    sys.stdout.flush()
+
+
+def _is_proactive_job_name(name: str) -> bool:
+    """Return True for built-in proactive cron jobs and `pd-` prefixed ones."""
+    return name in _PROACTIVE_JOB_NAMES or name.startswith(_PROACTIVE_JOB_PREFIX)
+
+
+def _run_event_loop(coro: Any) -> Any:
+    """Run a long-lived coroutine, on uvloop when the optional `fast` extra is installed."""
+    import asyncio
+
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(coro)
+
+
+async def _run_sibling_tasks(*coros: Any) -> None:
+    """Run coroutines in a TaskGroup so the first failure cancels the others.
+
+    The first underlying exception is re-raised unwrapped, so callers keep
+    handling plain exception types instead of ExceptionGroup.
+    """
+    import asyncio
+
+    try:
+        async with asyncio.TaskGroup() as group:
+            for coro in coros:
+                group.create_task(coro)
+    except BaseExceptionGroup as eg:
+        raise eg.exceptions[0] from None
+
+
+def _check_results_table(title: str, results: list[tuple[str, str, str, str]]) -> Table:
+    """Build the Check/Status/Details/Fix Hint table shared by the doctor commands."""
+    table = Table(title=title)
+    table.add_column("Check", style="cyan")
+    table.add_column("Status")
+    table.add_column("Details", style="yellow")
+    table.add_column("Fix Hint", style="magenta")
+    marks = _CHECK_MARKS
+    for check, level, detail, fix in results:
+        table.add_row(check, marks.get(level, marks["fail"]), detail, fix or "-")
+    return table
+
+
+def _print_check_summary(results: list[tuple[str, str, str, str]], title: str | None = None) -> int:
+    """Print pass/warn/fail totals in one pass over results; return the fail count.
+
+    With ``title``, the results table is rendered together with the summary line in
+    a single console write.
+    """
+    levels = Counter(level for _, level, _, _ in results)
+    fail_count = levels["fail"]
+    warn_count = levels["warn"]
+    pass_count = len(results) - fail_count - warn_count
+    summary = (
+        f"Summary: [green]{pass_count} pass[/green], "
+        f"[yellow]{warn_count} warn[/yellow], [red]{fail_count} fail[/red]"
+    )
+    if title is None:
+        console.print(summary)
+    else:
+        console.print(Group(_check_results_table(title, results), Text.from_markup(summary)))
+    return fail_count
+
+
+def _print_markup_lines(lines: list[str]) -> None:
+    """Print markup lines in one console write, parsing each line's markup on its own."""
+    console.print(Group(*(console.render_str(line) for line in lines)))
+
+
 def _missing_api_key_fix(provider: str, config_path: Path) -> str:
     """Build actionable API-key guidance for the resolved route provider."""
     if provider in {"vllm", "proxy"}:
@@ -100,6 +251,70 @@ def _plugin_hooks(plugin: Any) -> str:
     return ", ".join(hooks) if hooks else "-"
 
 
+def _dir_entry_names(directory: Path) -> set[str]:
+    """List entry names in a directory with one scandir call (empty if missing)."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+
+@lru_cache(maxsize=4)
+def _bridge_endpoint(bridge_url: str) -> tuple[str, int]:
+    """Return (host, port) for a ws:// or wss:// bridge URL; raise ValueError if invalid."""
+    from urllib.parse import urlparse
+
+    parsed = urlparse(bridge_url)
+    if parsed.scheme not in {"ws", "wss"} or not parsed.hostname:
+        raise ValueError("bridgeUrl must be a valid ws:// or wss:// URL")
+    return parsed.hostname, parsed.port or (443 if parsed.scheme == "wss" else 80)
+
+
+@lru_cache(maxsize=1)
+def _httpx_proxy_kwarg() -> str:
+    """Name of httpx's client proxy argument: `proxy` (0.26+) or the older `proxies`."""
+    import inspect
+
+    import httpx
+
+    params = inspect.signature(httpx.AsyncClient.__init__).parameters
+    return "proxy" if "proxy" in params else "proxies"
+
+
+@lru_cache(maxsize=256)
+def _path_exists(path: str) -> bool:
+    """Memoized os.path.exists for one diagnostics pass (cleared on command entry)."""
+    return os.path.exists(path)
+
+
+@lru_cache(maxsize=8)
+def _calendar_events_url(calendar_id: str) -> str:
+    """Google Calendar events endpoint, quoted once per calendar for the process."""
+    return (
+        "https://www.googleapis.com/calendar/v3/calendars/"
+        f"{quote(calendar_id or 'primary', safe='')}/events"
+    )
+
+
+def _detect_memory_issues(
+    store: Any,
+    limit: int,
+    scopes: list[str] | None = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Run summary-drift and cross-scope conflict detection side by side."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        drift_future = executor.submit(store.detect_summary_fact_drift, limit=limit)
+        conflict_future = executor.submit(
+            store.detect_cross_scope_fact_conflicts,
+            scopes=scopes,
+            limit=limit,
+        )
+        return drift_future.result(), conflict_future.result()
+
+
 def version_callback(value: bool):
     if value:
         console.print(f"{__logo__} {__brand__} v{__version__}")
@@ -238,23 +453,8 @@ Information about the user goes here.
 """,
     }
 
-    for filename, content in templates.items():
-        file_path = workspace / filename
-        if not file_path.exists():
-            file_path.write_text(content)
-            console.print(f"  [dim]Created {filename}[/dim]")
-
-    # Create memory directory and MEMORY.md
-    memory_dir = workspace / "memory"
-    memory_dir.mkdir(exist_ok=True)
-
-    # Create skills directory for custom user skills
-    skills_dir = workspace / "skills"
-    skills_dir.mkdir(exist_ok=True)
-
-    memory_file = memory_dir / "MEMORY.md"
-    if not memory_file.exists():
-        memory_file.write_text("""# Long-term Memory
+    memory_templates = {
+        "MEMORY.md": """# Long-term Memory
 
 This file stores important information that should persist across sessions.
 
@@ -269,28 +469,16 @@ This file stores important information that should persist across sessions.
 ## Important Notes
 
 (Things to remember)
-""")
-        console.print("  [dim]Created memory/MEMORY.md[/dim]")
-
-    facts_file = memory_dir / "FACTS.md"
-    if not facts_file.exists():
-        facts_file.write_text("""# Fact Index (Machine-readable)
+""",
+        "FACTS.md": """# Fact Index (Machine-readable)
 
 JSON lines with fields: id, type, confidence, source, last_seen, supersedes.
-""")
-        console.print("  [dim]Created memory/FACTS.md[/dim]")
-
-    lessons_file = memory_dir / "LESSONS.md"
-    if not lessons_file.exists():
-        lessons_file.write_text("""# Lessons Learned
+""",
+        "LESSONS.md": """# Lessons Learned
 
 Actionable feedback and mistakes to avoid repeating.
-""")
-        console.print("  [dim]Created memory/LESSONS.md[/dim]")
-
-    profile_file = memory_dir / "PROFILE.md"
-    if not profile_file.exists():
-        profile_file.write_text("""# Profile
+""",
+        "PROFILE.md": """# Profile
 
 ## Identity
 - name:
@@ -300,27 +488,44 @@ Actionable feedback and mistakes to avoid repeating.
 ## Preferences
 - communication_style:
 - notification_style:
-""")
-        console.print("  [dim]Created memory/PROFILE.md[/dim]")
-
-    relationships_file = memory_dir / "RELATIONSHIPS.md"
-    if not relationships_file.exists():
-        relationships_file.write_text("""# Relationships
+""",
+        "RELATIONSHIPS.md": """# Relationships
 
 - [name] role, context, preference
-""")
-        console.print("  [dim]Created memory/RELATIONSHIPS.md[/dim]")
-
-    projects_file = memory_dir / "PROJECTS.md"
-    if not projects_file.exists():
-        projects_file.write_text("""# Projects
+""",
+        "PROJECTS.md": """# Projects
 
 ## Active
 - [project] status: ; next:
 
 ## Backlog
-""")
-        console.print("  [dim]Created memory/PROJECTS.md[/dim]")
+""",
+    }
+
+    # Create memory directory and skills directory for custom user skills
+    memory_dir = workspace / "memory"
+    memory_dir.mkdir(exist_ok=True)
+    (workspace / "skills").mkdir(exist_ok=True)
+
+    # One directory scan per target instead of an exists() call per file.
+    workspace_entries = _dir_entry_names(workspace)
+    memory_entries = _dir_entry_names(memory_dir)
+    pending: list[tuple[str, Path, str]] = [
+        (filename, workspace / filename, content)
+        for filename, content in templates.items()
+        if filename not in workspace_entries
+    ]
+    pending.extend(
+        (f"memory/{filename}", memory_dir / filename, content)
+        for filename, content in memory_templates.items()
+        if filename not in memory_entries
+    )
+    if not pending:
+        return
+
+    for _, path, content in pending:
+        path.write_text(content)
+    console.print("\n".join(f"  [dim]Created {label}[/dim]" for label, _, _ in pending))
 
 
 # ============================================================================
@@ -352,6 +557,10 @@ def gateway(
     ),
 ):
     """Start the g-agent gateway."""
+    import asyncio
+
+    import httpx
+
     from g_agent.agent.loop import AgentLoop
     from g_agent.agent.tools.google_workspace import GoogleWorkspaceClient
     from g_agent.bus.events import OutboundMessage
@@ -397,7 +606,7 @@ def gateway(
     route = config.resolve_model_route()
     api_key = route.api_key
     if not api_key and route.provider not in {"vllm", "bedrock"}:
-        api_key = config.get_api_key()
+        api_key = config.fallback_api_key()
     model = config.agents.defaults.model
     is_bedrock = route.provider == "bedrock" or model.startswith("bedrock/")
 
@@ -449,21 +658,29 @@ def gateway(
     data_dir = get_data_dir()
     proactive_state = ProactiveStateStore(data_dir / "proactive" / "state.json")
     metrics = MetricsStore(config.workspace_path / "state" / "metrics" / "events.jsonl")
-    proactive_job_names = {"daily-digest", "weekly-lessons-distill", "calendar-watch"}
-
-    def _is_proactive_job(job: CronJob) -> bool:
-        return job.name in proactive_job_names or job.name.startswith("pd-")
+    google_cfg = config.integrations.google
+    google = GoogleWorkspaceClient(
+        client_id=google_cfg.client_id,
+        client_secret=google_cfg.client_secret,
+        refresh_token=google_cfg.refresh_token,
+        access_token=google_cfg.access_token,
+        calendar_id=google_cfg.calendar_id,
+    )
+    # Pooled across calendar-watch firings; closed when the gateway shuts down.
+    google_http: httpx.AsyncClient | None = None
+    calendar_horizon = max(10, int(config.proactive.calendar_watch_horizon_minutes))
+    calendar_scan_minutes = max(1, int(config.proactive.calendar_watch_every_minutes))
 
-    def _is_quiet_hours_blocked(job: CronJob) -> bool:
+    def _is_quiet_hours_blocked(job: CronJob, now_utc: datetime) -> bool:
         quiet = config.proactive.quiet_hours
         if not quiet.enabled:
             return False
         if not job.payload.deliver:
             return False
-        if not _is_proactive_job(job):
+        if not _is_proactive_job_name(job.name):
             return False
         tzinfo = resolve_timezone(quiet.timezone)
-        now_local = datetime.now(timezone.utc).astimezone(tzinfo)
+        now_local = now_utc.astimezone(tzinfo)
         return is_quiet_hours_now(
             now_local=now_local,
             start_hhmm=quiet.start,
@@ -471,31 +688,24 @@ def gateway(
             enabled=quiet.enabled,
         )
 
-    async def _run_calendar_watch(job: CronJob) -> str:
+    async def _run_calendar_watch(job: CronJob, now_utc: datetime) -> str:
         if not (job.payload.deliver and job.payload.channel and job.payload.to):
             return "calendar_watch skipped: missing delivery target."
 
-        google_cfg = config.integrations.google
-        google = GoogleWorkspaceClient(
-            client_id=google_cfg.client_id,
-            client_secret=google_cfg.client_secret,
-            refresh_token=google_cfg.refresh_token,
-            access_token=google_cfg.access_token,
-            calendar_id=google_cfg.calendar_id,
-        )
         if not google.is_configured():
             return "calendar_watch skipped: Google Workspace not configured."
 
-        now_utc = datetime.now(timezone.utc)
-        horizon = max(10, int(config.proactive.calendar_watch_horizon_minutes))
+        nonlocal google_http
+        if google_http is None:
+            google_http = google.http_client = httpx.AsyncClient(timeout=20.0)
         ok, data = await google.request(
             "GET",
-            f"https://www.googleapis.com/calendar/v3/calendars/{quote(google.calendar_id or 'primary', safe='')}/events",
+            _calendar_events_url(google.calendar_id),
             params={
                 "singleEvents": "true",
                 "orderBy": "startTime",
                 "timeMin": now_utc.isoformat(),
-                "timeMax": (now_utc + timedelta(minutes=horizon)).isoformat(),
+                "timeMax": (now_utc + timedelta(minutes=calendar_horizon)).isoformat(),
                 "maxResults": 25,
             },
         )
@@ -506,8 +716,8 @@ def gateway(
             data.get("items", []) or [],
             now_utc=now_utc,
             lead_minutes=config.proactive.calendar_watch_lead_minutes,
-            scan_minutes=max(1, int(config.proactive.calendar_watch_every_minutes)),
-            horizon_minutes=horizon,
+            scan_minutes=calendar_scan_minutes,
+            horizon_minutes=calendar_horizon,
             state_store=proactive_state,
         )
         if not due:
@@ -527,11 +737,7 @@ def gateway(
                 channel=job.payload.channel,
                 chat_id=job.payload.to,
                 content="\n".join(lines),
-                metadata={
-                    "idempotency_key": (
-                        f"cron:{job.id}:{now_utc.strftime('%Y%m%d%H%M')}:{len(due)}"
-                    )
-                },
+                metadata={"idempotency_key": f"cron:{job.id}:{now_utc:%Y%m%d%H%M}:{len(due)}"},
             )
         )
         return f"calendar_watch: sent {len(due)} reminder(s)."
@@ -539,16 +745,17 @@ def gateway(
     # Set cron callback (needs agent)
     async def on_cron_job(job: CronJob) -> str | None:
         """Execute a cron job through the agent."""
-        started = perf_counter()
+        started_ns = perf_counter_ns()
+        now_utc = datetime.now(timezone.utc)
         error_message = ""
         success = True
         try:
-            if _is_quiet_hours_blocked(job):
+            if _is_quiet_hours_blocked(job, now_utc):
                 return f"Skipped '{job.name}' due quiet hours."
 
             if job.payload.kind == "system_event":
                 if (job.payload.message or "").strip().lower() == "calendar_watch":
-                    return await _run_calendar_watch(job)
+                    return await _run_calendar_watch(job, now_utc)
                 return f"Skipped unknown system_event payload: {job.payload.message}"
 
             response = await agent.process_direct(
@@ -563,11 +770,7 @@ def gateway(
                         channel=job.payload.channel or "cli",
                         chat_id=job.payload.to,
                         content=response or "",
-                        metadata={
-                            "idempotency_key": (
-                                f"cron:{job.id}:{datetime.now(timezone.utc).strftime('%Y%m%d%H%M')}"
-                            )
-                        },
+                        metadata={"idempotency_key": f"cron:{job.id}:{now_utc:%Y%m%d%H%M}"},
                     )
                 )
             return response
@@ -580,9 +783,9 @@ def gateway(
                 name=job.name,
                 payload_kind=job.payload.kind,
                 success=success,
-                latency_ms=(perf_counter() - started) * 1000.0,
+                latency_ms=(perf_counter_ns() - started_ns) // 1_000_000,
                 delivered=bool(job.payload.deliver and job.payload.to),
-                proactive=_is_proactive_job(job),
+                proactive=_is_proactive_job_name(job.name),
                 error=error_message,
             )
 
@@ -635,14 +838,15 @@ def gateway(
                 )
             await cron.start()
             await heartbeat.start()
-            await asyncio.gather(
-                agent.run(),
-                channels.start_all(),
-            )
+            await _run_sibling_tasks(agent.run(), channels.start_all())
         except OSError as e:
             start_error = str(e)
         except KeyboardInterrupt:
             console.print("\nShutting down...")
+        except asyncio.CancelledError:
+            # Ctrl+C under asyncio.run cancels this task rather than raising here.
+            console.print("\nShutting down...")
+            raise
         finally:
             heartbeat.stop()
             cron.stop()
@@ -650,11 +854,13 @@ def gateway(
             await channels.stop_all()
             if metrics_server:
                 await metrics_server.stop()
+            if google_http is not None:
+                await google_http.aclose()
             if start_error:
                 console.print(f"[red]Gateway startup failed:[/red] {start_error}")
                 raise typer.Exit(1)
 
-    asyncio.run(run())
+    _run_event_loop(run())
 
 
 # ============================================================================
@@ -679,7 +885,7 @@ def agent(
     route = config.resolve_model_route()
     api_key = route.api_key
     if not api_key and route.provider not in {"vllm", "bedrock"}:
-        api_key = config.get_api_key()
+        api_key = config.fallback_api_key()
     model = config.agents.defaults.model
     is_bedrock = route.provider == "bedrock" or model.startswith("bedrock/")
 
@@ -736,11 +942,12 @@ def agent(
             response = await agent_loop.process_direct(message, session_id)
             console.print(f"\n{__logo__} {response}")
 
-        asyncio.run(run_once())
+        _run_event_loop(run_once())
     else:
         # Interactive mode
         from prompt_toolkit import PromptSession
         from prompt_toolkit.history import FileHistory
+        from prompt_toolkit.patch_stdout import patch_stdout
         from prompt_toolkit.styles import Style
 
         history_dir = config.workspace_path / "state"
@@ -755,7 +962,9 @@ def agent(
         async def run_interactive():
             while True:
                 try:
-                    user_input = await session.prompt_async("You: ", style=style)
+                    # Output from background tasks lands above the prompt instead of through it.
+                    with patch_stdout():
+                        user_input = await session.prompt_async("You: ", style=style)
                     if not user_input.strip():
                         continue
 
@@ -765,7 +974,7 @@ def agent(
                     console.print("\nGoodbye!")
                     break
 
-        asyncio.run(run_interactive())
+        _run_event_loop(run_interactive())
 
 
 # ============================================================================
@@ -865,7 +1074,7 @@ def channels_status():
 
     # Telegram
     tg = config.channels.telegram
-    tg_config = f"token: {tg.token[:10]}..." if tg.token else "[dim]not configured[/dim]"
+    tg_config = f"token: {tg.token[:10]}..." if tg.token else _NOT_CONFIGURED_CELL
     table.add_row("Telegram", "✓" if tg.enabled else "✗", tg_config)
 
     console.print(table)
@@ -892,6 +1101,104 @@ def _bridge_source_signature(source: Path) -> str:
     return digest.hexdigest()
 
 
+async def _stream_subprocess(
+    cmd: list[str], *, cwd: Path, label: str, tail_lines: int = 50
+) -> None:
+    """Run a build step, showing its latest output line instead of buffering all of it.
+
+    Only the last `tail_lines` lines are kept, for the error report; raises
+    CalledProcessError (with that tail as `output`) on a non-zero exit. If the
+    caller is cancelled (Ctrl+C), the child is terminated and reaped first.
+    """
+    import asyncio
+    import subprocess
+    from collections import deque
+    from contextlib import nullcontext
+
+    tail: deque[str] = deque(maxlen=tail_lines)
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.STDOUT,
+        limit=1 << 20,
+    )
+    status = console.status(f"  {label}") if console.is_terminal else nullcontext()
+    try:
+        with status as spinner:
+            async for raw_line in proc.stdout:
+                line = raw_line.decode(errors="replace").rstrip()
+                if not line:
+                    continue
+                tail.append(line)
+                if spinner is not None:
+                    spinner.update(f"  {label} [dim]{escape(line[:80])}[/dim]")
+        returncode = await proc.wait()
+    except BaseException:
+        if proc.returncode is None:
+            proc.terminate()
+            await proc.wait()
+        raise
+    if returncode:
+        raise subprocess.CalledProcessError(returncode, cmd, output="\n".join(tail))
+
+
+def _run_streamed(cmd: list[str], *, cwd: Path, label: str, tail_lines: int = 50) -> None:
+    """Synchronous entry point for `_stream_subprocess` on a fresh event loop."""
+    _run_event_loop(_stream_subprocess(cmd, cwd=cwd, label=label, tail_lines=tail_lines))
+
+
+_BRIDGE_SYNC_SKIP = frozenset({"node_modules", "dist"})
+
+
+def _sync_tree(source: Path, target: Path, *, skip: frozenset[str] = frozenset()) -> int:
+    """Mirror `source` into `target`, copying only files whose size or mtime differ.
+
+    Entries named in `skip` are neither copied nor removed, at any depth.
+    Returns the number of files copied.
+    """
+    import shutil
+
+    target.mkdir(parents=True, exist_ok=True)
+    with os.scandir(target) as entries:
+        existing = {entry.name: entry for entry in entries}
+
+    copied = 0
+    with os.scandir(source) as entries:
+        for entry in entries:
+            if entry.name in skip:
+                continue
+            dest = target / entry.name
+            current = existing.pop(entry.name, None)
+            if entry.is_dir(follow_symlinks=False):
+                if current is not None and not current.is_dir(follow_symlinks=False):
+                    os.unlink(current.path)
+                copied += _sync_tree(Path(entry.path), dest, skip=skip)
+                continue
+            if current is not None:
+                if current.is_dir(follow_symlinks=False):
+                    shutil.rmtree(current.path)
+                elif current.is_file(follow_symlinks=False):
+                    src_stat = entry.stat()
+                    dst_stat = current.stat()
+                    if (
+                        src_stat.st_size == dst_stat.st_size
+                        and src_stat.st_mtime_ns == dst_stat.st_mtime_ns
+                    ):
+                        continue
+            shutil.copy2(entry.path, dest)
+            copied += 1
+
+    for name, stale in existing.items():
+        if name in skip:
+            continue
+        if stale.is_dir(follow_symlinks=False):
+            shutil.rmtree(stale.path)
+        else:
+            os.unlink(stale.path)
+    return copied
+
+
 def _bridge_build_id_path(bridge_dir: Path) -> Path:
     """Marker file storing bridge source signature used for local build."""
     return bridge_dir / ".g_agent_bridge_build_id"
@@ -955,26 +1262,29 @@ def _get_bridge_dir(force_rebuild: bool = False) -> Path:
 
     console.print(f"{__logo__} Setting up bridge...")
 
-    # Copy to user directory
+    # Sync into user directory. A forced rebuild starts from a clean slate; a
+    # source change only recopies changed files and keeps node_modules, so
+    # `npm install` is incremental. dist is always rebuilt from scratch.
     user_bridge.parent.mkdir(parents=True, exist_ok=True)
-    if user_bridge.exists():
+    if force_rebuild and user_bridge.exists():
         shutil.rmtree(user_bridge)
-    shutil.copytree(source, user_bridge, ignore=shutil.ignore_patterns("node_modules", "dist"))
+    shutil.rmtree(user_bridge / "dist", ignore_errors=True)
+    _sync_tree(source, user_bridge, skip=_BRIDGE_SYNC_SKIP)
 
     # Install and build
     try:
         console.print("  Installing dependencies...")
-        subprocess.run(["npm", "install"], cwd=user_bridge, check=True, capture_output=True)
+        _run_streamed(["npm", "install"], cwd=user_bridge, label="npm install")
 
         console.print("  Building...")
-        subprocess.run(["npm", "run", "build"], cwd=user_bridge, check=True, capture_output=True)
+        _run_streamed(["npm", "run", "build"], cwd=user_bridge, label="npm run build")
 
         _bridge_build_id_path(user_bridge).write_text(expected_build_id, encoding="utf-8")
         console.print("[green]✓[/green] Bridge ready\n")
     except subprocess.CalledProcessError as e:
         console.print(f"[red]Build failed: {e}[/red]")
-        if e.stderr:
-            console.print(f"[dim]{e.stderr.decode()[:500]}[/dim]")
+        if e.output:
+            console.print(f"[dim]{escape(e.output[-500:])}[/dim]")
         raise typer.Exit(1)
 
     return user_bridge
@@ -1133,7 +1443,6 @@ def channels_login(
     import errno
     import os
     import subprocess
-    from urllib.parse import urlparse
 
     from g_agent.config.loader import get_data_dir, load_config
 
@@ -1145,15 +1454,14 @@ def channels_login(
             "Run: g-agent channels login --restart-existing --force-kill",
         )
 
-    parsed = urlparse(bridge_url)
-    if parsed.scheme not in {"ws", "wss"} or not parsed.hostname:
+    try:
+        host, port = _bridge_endpoint(bridge_url)
+    except ValueError:
         _cli_fail(
             f"Invalid channels.whatsapp.bridgeUrl: {bridge_url}",
             "Use ws://host:port or wss://host:port in config "
             f"({Path.home() / '.g-agent' / 'config.json'}).",
         )
-    host = parsed.hostname or "localhost"
-    port = parsed.port or (443 if parsed.scheme == "wss" else 80)
 
     pids = _bridge_port_pids(port)
     if pids and restart_existing:
@@ -1326,13 +1634,6 @@ def plugins_doctor(
     from g_agent.config.loader import load_config
     from g_agent.plugins.loader import filter_plugins, load_installed_plugins, plugin_label
 
-    def _mark(level: str) -> str:
-        if level == "pass":
-            return "[green]PASS[/green]"
-        if level == "warn":
-            return "[yellow]WARN[/yellow]"
-        return "[red]FAIL[/red]"
-
     results: list[tuple[str, str, str, str]] = []
 
     def add(check: str, level: str, detail: str, fix: str = "") -> None:
@@ -1430,22 +1731,7 @@ def plugins_doctor(
             "Set tools.plugins.enabled=true to enable plugin loading",
         )
 
-    table = Table(title="Plugin Doctor")
-    table.add_column("Check", style="cyan")
-    table.add_column("Status")
-    table.add_column("Details", style="yellow")
-    table.add_column("Fix Hint", style="magenta")
-
-    for check, level, detail, fix in results:
-        table.add_row(check, _mark(level), detail, fix or "-")
-    console.print(table)
-
-    fail_count = sum(1 for _, level, _, _ in results if level == "fail")
-    warn_count = sum(1 for _, level, _, _ in results if level == "warn")
-    pass_count = len(results) - fail_count - warn_count
-    console.print(
-        f"Summary: [green]{pass_count} pass[/green], [yellow]{warn_count} warn[/yellow], [red]{fail_count} fail[/red]"
-    )
+    fail_count = _print_check_summary(results, title="Plugin Doctor")
 
     if strict and fail_count > 0:
         raise typer.Exit(1)
@@ -1479,17 +1765,17 @@ def google_status():
     has_refresh = bool(google_cfg.refresh_token)
     has_access = bool(google_cfg.access_token)
 
-    console.print("Google Workspace status")
-    console.print(
-        f"- Client credentials: {'[green]✓[/green]' if has_client else '[yellow]missing[/yellow]'}"
-    )
     console.print(
-        f"- Refresh token: {'[green]✓[/green]' if has_refresh else '[yellow]missing[/yellow]'}"
-    )
-    console.print(
-        f"- Access token: {'[green]✓[/green]' if has_access else '[dim]not cached[/dim]'}"
+        Text("\n").join(
+            [
+                Text("Google Workspace status"),
+                Text.assemble("- Client credentials: ", _OK_CELL if has_client else _MISSING_CELL),
+                Text.assemble("- Refresh token: ", _OK_CELL if has_refresh else _MISSING_CELL),
+                Text.assemble("- Access token: ", _OK_CELL if has_access else _NOT_CACHED_CELL),
+                Text(f"- Calendar ID: {google_cfg.calendar_id or 'primary'}"),
+            ]
+        )
     )
-    console.print(f"- Calendar ID: {google_cfg.calendar_id or 'primary'}")
 
 
 @google_app.command("configure")
@@ -1519,26 +1805,48 @@ def google_configure(
         console.print("[yellow]Saved, but client credentials are still incomplete.[/yellow]")
 
 
+_GOOGLE_DEFAULT_SCOPES = (
+    "openid email "
+    "https://www.googleapis.com/auth/gmail.modify "
+    "https://www.googleapis.com/auth/calendar "
+    "https://www.googleapis.com/auth/drive.readonly "
+    "https://www.googleapis.com/auth/documents "
+    "https://www.googleapis.com/auth/spreadsheets "
+    "https://www.googleapis.com/auth/contacts.readonly"
+)
+# Fixed consent parameters, already in urlencode() form.
+_GOOGLE_AUTH_STATIC_QUERY = "response_type=code&access_type=offline&prompt=consent"
+
+
+@lru_cache(maxsize=4)
+def _google_scope_query(redirect_uri: str, scopes: str) -> str:
+    """Encoded redirect_uri/scope pair; the default scope string is only quoted once."""
+    return (
+        f"redirect_uri={quote_plus(redirect_uri)}&{_GOOGLE_AUTH_STATIC_QUERY}"
+        f"&scope={quote_plus(scopes)}"
+    )
+
+
+def _google_auth_url(client_id: str, redirect_uri: str, scopes: str) -> str:
+    """Google OAuth consent URL, parameter-for-parameter what urlencode() would build."""
+    return (
+        "https://accounts.google.com/o/oauth2/v2/auth"
+        f"?client_id={quote_plus(client_id)}&{_google_scope_query(redirect_uri, scopes)}"
+    )
+
+
 @google_app.command("auth-url")
 def google_auth_url(
     redirect_uri: str = typer.Option(
         "http://localhost", "--redirect-uri", help="OAuth redirect URI"
     ),
     scopes: str = typer.Option(
-        "openid email "
-        "https://www.googleapis.com/auth/gmail.modify "
-        "https://www.googleapis.com/auth/calendar "
-        "https://www.googleapis.com/auth/drive.readonly "
-        "https://www.googleapis.com/auth/documents "
-        "https://www.googleapis.com/auth/spreadsheets "
-        "https://www.googleapis.com/auth/contacts.readonly",
+        _GOOGLE_DEFAULT_SCOPES,
         "--scopes",
         help="Space-separated OAuth scopes",
     ),
 ):
     """Generate Google OAuth consent URL."""
-    from urllib.parse import urlencode
-
     from g_agent.config.loader import get_config_path, load_config
 
     config = load_config()
@@ -1549,19 +1857,60 @@ def google_auth_url(
             f"Set integrations.google.clientId in {get_config_path()}",
         )
 
-    params = {
-        "client_id": google_cfg.client_id,
-        "redirect_uri": redirect_uri,
-        "response_type": "code",
-        "access_type": "offline",
-        "prompt": "consent",
-        "scope": scopes,
-    }
-    url = f"https://accounts.google.com/o/oauth2/v2/auth?{urlencode(params)}"
+    url = _google_auth_url(google_cfg.client_id, redirect_uri, scopes)
     console.print("Open this URL, authorize, then copy the `code`:")
     console.print(url)
 
 
+def _now_ms() -> int:
+    return int(datetime.now(timezone.utc).timestamp() * 1000)
+
+
+def _google_token_expiry_ms(token_response: dict[str, Any]) -> int:
+    """Absolute expiry (epoch ms) of a Google token response; defaults to Google's 1h."""
+    try:
+        expires_in = int(token_response.get("expires_in", 3600))
+    except (TypeError, ValueError):
+        expires_in = 3600
+    return _now_ms() + expires_in * 1000
+
+
+_GOOGLE_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+async def _google_send(
+    send: Callable[[], Awaitable["httpx.Response"]],
+    *,
+    replay_safe: bool = True,
+    attempts: int = 3,
+) -> "httpx.Response":
+    """Run one Google HTTP call with a bounded retry budget.
+
+    Failed connects are always retried. Rate-limit/5xx responses and mid-request
+    transport errors are retried only when `replay_safe` (an OAuth code is
+    single-use, so its exchange is not). Backoff is exponential with full
+    jitter, capped at 8s; the final attempt's error or response is passed through.
+    """
+    import asyncio
+    import random
+
+    import httpx
+
+    for attempt in range(attempts - 1):
+        try:
+            response = await send()
+        except (httpx.ConnectError, httpx.ConnectTimeout):
+            pass
+        except httpx.TransportError:
+            if not replay_safe:
+                raise
+        else:
+            if not replay_safe or response.status_code not in _GOOGLE_RETRY_STATUSES:
+                return response
+        await asyncio.sleep(random.uniform(0, min(8.0, 0.5 * 2**attempt)))
+    return await send()
+
+
 @google_app.command("exchange")
 def google_exchange(
     code: str = typer.Option(
@@ -1591,9 +1940,16 @@ def google_exchange(
         "redirect_uri": redirect_uri,
         "grant_type": "authorization_code",
     }
+
+    async def exchange() -> httpx.Response:
+        async with httpx.AsyncClient(timeout=20.0) as client:
+            return await _google_send(
+                lambda: client.post("https://oauth2.googleapis.com/token", data=payload),
+                replay_safe=False,
+            )
+
     try:
-        with httpx.Client(timeout=20.0) as client:
-            response = client.post("https://oauth2.googleapis.com/token", data=payload)
+        response = _run_event_loop(exchange())
     except Exception as e:
         _cli_fail(
             f"Token exchange failed: {e}",
@@ -1616,6 +1972,7 @@ def google_exchange(
         )
 
     config.integrations.google.access_token = access_token
+    config.integrations.google.access_token_expires_at_ms = _google_token_expiry_ms(data)
     if refresh_token:
         config.integrations.google.refresh_token = refresh_token
     save_config(config)
@@ -1627,28 +1984,93 @@ def google_exchange(
         console.print("[yellow]Note:[/yellow] refresh_token not returned; existing value kept.")
 
 
+_GOOGLE_PROFILE_CACHE_TTL_S = 60.0
+
+
+def _google_profile_cache_key(google_cfg: Any) -> str:
+    """Digest of the credentials a cached profile was verified with (never the tokens)."""
+    import hashlib
+
+    material = "\0".join([google_cfg.client_id, google_cfg.refresh_token, google_cfg.access_token])
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _read_google_profile_cache(path: Path, key: str) -> dict[str, Any] | None:
+    """Return a profile cached for `key` within the TTL, else None."""
+    from g_agent.utils.helpers import json_loads
+
+    try:
+        age_s = datetime.now().timestamp() - path.stat().st_mtime
+        if not 0 <= age_s < _GOOGLE_PROFILE_CACHE_TTL_S:
+            return None
+        entry = json_loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return None
+    profile = entry.get("profile")
+    return profile if isinstance(profile, dict) else None
+
+
+def _write_google_profile_cache(path: Path, key: str, profile: dict[str, Any]) -> None:
+    """Best-effort: a failed cache write must not fail verification.
+
+    The profile names the Google account behind the token, so it is kept 0600 like config.json.
+    """
+    from g_agent.utils.helpers import write_bytes_atomic
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps({"key": key, "profile": profile}).encode("utf-8")
+        write_bytes_atomic(path, payload, mode=0o600)
+    except (OSError, TypeError, ValueError):
+        pass
+
+
+def _print_google_profile(profile: dict[str, Any], *, cached_result: bool = False) -> None:
+    email_address = profile.get("emailAddress", "(unknown)")
+    total_messages = profile.get("messagesTotal", "n/a")
+    suffix = " [dim](cached, use --no-cache to recheck)[/dim]" if cached_result else ""
+    console.print(
+        f"[green]✓[/green] Google auth verified for {email_address} (messages: {total_messages})"
+        f"{suffix}"
+    )
+
+
 @google_app.command("verify")
-def google_verify(timeout: float = typer.Option(10.0, "--timeout", help="HTTP timeout seconds")):
+def google_verify(
+    timeout: float = typer.Option(10.0, "--timeout", help="HTTP timeout seconds"),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Always call Google, ignoring a profile verified in the last minute",
+    ),
+):
     """Verify Google auth by calling Gmail profile endpoint."""
-    import httpx
-
-    from g_agent.config.loader import load_config, save_config
+    from g_agent.config.loader import get_data_dir, load_config, save_config
 
     config = load_config()
     google_cfg = config.integrations.google
+    profile_cache = get_data_dir() / "cache" / "google_profile.json"
+
+    if not no_cache:
+        cached = _read_google_profile_cache(profile_cache, _google_profile_cache_key(google_cfg))
+        if cached is not None:
+            _print_google_profile(cached, cached_result=True)
+            return
+
+    import httpx
 
     has_refresh_creds = bool(
         google_cfg.client_id and google_cfg.client_secret and google_cfg.refresh_token
     )
     access_token = (google_cfg.access_token or "").strip()
 
-    def refresh_access_token() -> tuple[bool, str, str]:
+    async def refresh_access_token(client: httpx.AsyncClient) -> tuple[bool, str, str]:
         """Refresh Google access token from refresh token."""
-        if not has_refresh_creds:
-            return False, "", "Google refresh credentials are incomplete."
         try:
-            with httpx.Client(timeout=timeout) as client:
-                refresh_resp = client.post(
+            refresh_resp = await _google_send(
+                lambda: client.post(
                     "https://oauth2.googleapis.com/token",
                     data={
                         "client_id": google_cfg.client_id,
@@ -1657,67 +2079,84 @@ def google_verify(timeout: float = typer.Option(10.0, "--timeout", help="HTTP ti
                         "grant_type": "refresh_token",
                     },
                 )
+            )
             if refresh_resp.status_code != 200:
                 return False, "", f"Refresh token failed (HTTP {refresh_resp.status_code})."
-            token = refresh_resp.json().get("access_token", "")
+            refresh_data = refresh_resp.json()
+            token = refresh_data.get("access_token", "")
             if not token:
                 return False, "", "Refresh token response missing access_token."
+            remember_access_token(token, _google_token_expiry_ms(refresh_data))
             return True, token, ""
         except Exception as e:
             return False, "", f"Google token refresh failed: {e}"
 
-    if has_refresh_creds:
-        refreshed, refreshed_token, refresh_error = refresh_access_token()
-        if refreshed:
-            access_token = refreshed_token
-            config.integrations.google.access_token = access_token
-            save_config(config)
-        elif not access_token:
-            _cli_fail(
-                refresh_error,
-                "Run `g-agent google auth-url`, then `g-agent google exchange --code ...`.",
-            )
-
-    if not access_token:
-        _cli_fail(
-            "Google auth not configured.",
-            "Run `g-agent google configure`, then `g-agent google auth-url` and `g-agent google exchange --code ...`.",
-        )
-
-    try:
-        with httpx.Client(timeout=timeout) as client:
-            profile_resp = client.get(
-                "https://gmail.googleapis.com/gmail/v1/users/me/profile",
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-    except Exception as e:
-        _cli_fail(
-            f"Google API request failed: {e}",
-            "Check network connectivity, then run `g-agent google verify` again.",
-        )
-
-    if profile_resp.status_code == 401 and has_refresh_creds:
-        refreshed, refreshed_token, refresh_error = refresh_access_token()
-        if not refreshed:
-            _cli_fail(
-                refresh_error,
-                "Re-run `g-agent google auth-url` and `g-agent google exchange --code ...`.",
-            )
-        access_token = refreshed_token
-        config.integrations.google.access_token = access_token
-        save_config(config)
+    async def fetch_profile(client: httpx.AsyncClient, token: str) -> httpx.Response:
         try:
-            with httpx.Client(timeout=timeout) as client:
-                profile_resp = client.get(
+            return await _google_send(
+                lambda: client.get(
                     "https://gmail.googleapis.com/gmail/v1/users/me/profile",
-                    headers={"Authorization": f"Bearer {access_token}"},
+                    headers={"Authorization": f"Bearer {token}"},
                 )
+            )
         except Exception as e:
             _cli_fail(
                 f"Google API request failed: {e}",
                 "Check network connectivity, then run `g-agent google verify` again.",
             )
 
+    token_updated = False
+
+    def remember_access_token(token: str, expires_at_ms: int) -> None:
+        # Persisted once when the command finishes, however many refreshes happened.
+        nonlocal token_updated
+        config.integrations.google.access_token = token
+        config.integrations.google.access_token_expires_at_ms = expires_at_ms
+        token_updated = True
+
+    async def verify() -> httpx.Response:
+        # One keep-alive client for the whole flow: a retry after 401 reuses the
+        # already-open oauth2/gmail connections instead of new TLS handshakes.
+        async with httpx.AsyncClient(timeout=timeout) as client:
+            if not has_refresh_creds:
+                if not access_token:
+                    _cli_fail(
+                        "Google auth not configured.",
+                        "Run `g-agent google configure`, then `g-agent google auth-url` and `g-agent google exchange --code ...`.",
+                    )
+                return await fetch_profile(client, access_token)
+
+            # Refresh upfront only when there is no token or it is known to be
+            # (nearly) expired; otherwise the stored token is tried first and a
+            # refresh is paid for only if Google rejects it.
+            expires_at_ms = google_cfg.access_token_expires_at_ms
+            if not access_token or (expires_at_ms and _now_ms() > expires_at_ms - 30_000):
+                refreshed, refreshed_token, refresh_error = await refresh_access_token(client)
+                if not refreshed:
+                    _cli_fail(
+                        refresh_error,
+                        "Run `g-agent google auth-url`, then `g-agent google exchange --code ...`.",
+                    )
+                return await fetch_profile(client, refreshed_token)
+
+            profile_resp = await fetch_profile(client, access_token)
+            if profile_resp.status_code != 401:
+                return profile_resp
+            refreshed, refreshed_token, refresh_error = await refresh_access_token(client)
+            if not refreshed:
+                _cli_fail(
+                    refresh_error,
+                    "Re-run `g-agent google auth-url` and `g-agent google exchange --code ...`.",
+                )
+            return await fetch_profile(client, refreshed_token)
+
+    try:
+        profile_resp = _run_event_loop(verify())
+    finally:
+        # Keep a refreshed token even when verification itself then fails.
+        if token_updated:
+            save_config(config)
+
     if profile_resp.status_code != 200:
         _cli_fail(
             f"Google verify failed (HTTP {profile_resp.status_code}).",
@@ -1725,11 +2164,8 @@ def google_verify(timeout: float = typer.Option(10.0, "--timeout", help="HTTP ti
         )
 
     profile = profile_resp.json()
-    email_address = profile.get("emailAddress", "(unknown)")
-    total_messages = profile.get("messagesTotal", "n/a")
-    console.print(
-        f"[green]✓[/green] Google auth verified for {email_address} (messages: {total_messages})"
-    )
+    _write_google_profile_cache(profile_cache, _google_profile_cache_key(google_cfg), profile)
+    _print_google_profile(profile)
 
 
 @google_app.command("clear")
@@ -1743,6 +2179,7 @@ def google_clear(
 
     config = load_config()
     config.integrations.google.access_token = ""
+    config.integrations.google.access_token_expires_at_ms = 0
     config.integrations.google.refresh_token = ""
     if clear_client:
         config.integrations.google.client_id = ""
@@ -1767,6 +2204,18 @@ def cron_main(ctx: typer.Context):
         raise typer.Exit(0)
 
 
+def _one_time_label(schedule: "CronSchedule") -> str:
+    return "one-time"
+
+
+# Schedule column text per CronSchedule.kind; unknown kinds read as one-time ("at").
+_SCHEDULE_LABELS: dict[str, Callable[["CronSchedule"], str]] = {
+    "every": lambda schedule: f"every {(schedule.every_ms or 0) // 1000}s",
+    "cron": lambda schedule: schedule.expr or "",
+    "at": _one_time_label,
+}
+
+
 @cron_app.command("list")
 def cron_list(
     all: bool = typer.Option(False, "--all", "-a", help="Include disabled jobs"),
@@ -1793,26 +2242,32 @@ def cron_list(
 
     import time
 
-    for job in jobs:
-        # Format schedule
-        if job.schedule.kind == "every":
-            sched = f"every {(job.schedule.every_ms or 0) // 1000}s"
-        elif job.schedule.kind == "cron":
-            sched = job.schedule.expr or ""
-        else:
-            sched = "one-time"
-
-        # Format next run
-        next_run = ""
-        if job.state.next_run_at_ms:
-            next_time = time.strftime(
-                "%Y-%m-%d %H:%M", time.localtime(job.state.next_run_at_ms / 1000)
-            )
-            next_run = next_time
+    # Jobs often share a next-run minute (e.g. several 09:00 crons); format each
+    # minute once. Still per-timestamp localtime so DST shifts stay correct.
+    next_run_labels: dict[int, str] = {}
 
-        status = "[green]enabled[/green]" if job.enabled else "[dim]disabled[/dim]"
+    def _next_run_label(next_run_at_ms: int) -> str:
+        minute = next_run_at_ms // 60_000
+        label = next_run_labels.get(minute)
+        if label is None:
+            label = time.strftime("%Y-%m-%d %H:%M", time.localtime(minute * 60))
+            next_run_labels[minute] = label
+        return label
 
-        table.add_row(job.id, job.name, sched, status, next_run)
+    schedule_label = _SCHEDULE_LABELS.get
+    rows = [
+        (
+            job.id,
+            job.name,
+            schedule_label(job.schedule.kind, _one_time_label)(job.schedule),
+            "[green]enabled[/green]" if job.enabled else "[dim]disabled[/dim]",
+            _next_run_label(next_ms) if (next_ms := job.state.next_run_at_ms) else "",
+        )
+        for job in jobs
+    ]
+    add_row = table.add_row
+    for row in rows:
+        add_row(*row)
 
     console.print(table)
 
@@ -1924,10 +2379,7 @@ def cron_run(
     store_path = get_data_dir() / "cron" / "jobs.json"
     service = CronService(store_path)
 
-    async def run():
-        return await service.run_job(job_id, force=force)
-
-    if asyncio.run(run()):
+    if _run_event_loop(service.run_job(job_id, force=force)):
         console.print("[green]✓[/green] Job executed")
     else:
         _cli_fail(
@@ -1967,17 +2419,18 @@ def digest(
     from g_agent.providers.factory import build_provider, collect_provider_factories, has_provider_factory
 
     config = load_config()
+    tools, integrations, defaults = config.tools, config.integrations, config.agents.defaults
     route = config.resolve_model_route()
     api_key = route.api_key
     if not api_key and route.provider not in {"vllm", "bedrock"}:
-        api_key = config.get_api_key()
-    model = config.agents.defaults.model
+        api_key = config.fallback_api_key()
+    model = defaults.model
     is_bedrock = route.provider == "bedrock" or model.startswith("bedrock/")
     plugins = filter_plugins(
         load_installed_plugins(),
-        enabled=config.tools.plugins.enabled,
-        allow=config.tools.plugins.allow,
-        deny=config.tools.plugins.deny,
+        enabled=tools.plugins.enabled,
+        allow=tools.plugins.allow,
+        deny=tools.plugins.deny,
     )
     provider_factories = collect_provider_factories(config, plugins)
     if (
@@ -2002,19 +2455,19 @@ def digest(
         provider=provider,
         workspace=config.workspace_path,
         model=route.model,
-        max_iterations=config.agents.defaults.max_tool_iterations,
-        brave_api_key=config.tools.web.search.api_key or None,
-        exec_config=config.tools.exec,
-        restrict_to_workspace=config.tools.restrict_to_workspace,
-        slack_webhook_url=config.integrations.slack.webhook_url or None,
-        smtp_config=config.integrations.smtp,
-        google_config=config.integrations.google,
-        browser_config=config.tools.browser,
-        tool_policy=config.tools.policy,
-        risky_tools=config.tools.risky_tools,
-        approval_mode=config.tools.approval_mode,
-        enable_reflection=config.agents.defaults.enable_reflection,
-        summary_interval=config.agents.defaults.summary_interval,
+        max_iterations=defaults.max_tool_iterations,
+        brave_api_key=tools.web.search.api_key or None,
+        exec_config=tools.exec,
+        restrict_to_workspace=tools.restrict_to_workspace,
+        slack_webhook_url=integrations.slack.webhook_url or None,
+        smtp_config=integrations.smtp,
+        google_config=integrations.google,
+        browser_config=tools.browser,
+        tool_policy=tools.policy,
+        risky_tools=tools.risky_tools,
+        approval_mode=tools.approval_mode,
+        enable_reflection=defaults.enable_reflection,
+        summary_interval=defaults.summary_interval,
         fallback_models=route.fallback_models,
         plugins=plugins,
     )
@@ -2027,10 +2480,21 @@ def digest(
             chat_id="digest",
         )
 
-    response = asyncio.run(run_digest())
+    response = _run_event_loop(run_digest())
     console.print(f"\n{__logo__} {response}")
 
 
+def _parse_lead_minutes(raw: str) -> list[int]:
+    """Positive whole minutes from a comma-separated list, deduplicated, largest first.
+
+    Tokens that are not plain digits (e.g. "-10", "1.5", "soon") are ignored.
+    """
+    tokens = (token.strip() for token in raw.split(","))
+    values = {int(token) for token in tokens if token.isascii() and token.isdigit()}
+    values.discard(0)
+    return sorted(values, reverse=True)
+
+
 @app.command("proactive-enable")
 def proactive_enable(
     daily_cron: str = typer.Option("0 8 * * *", "--daily-cron", help="Cron for daily digest"),
@@ -2071,72 +2535,67 @@ def proactive_enable(
     if calendar_horizon is not None:
         proactive_cfg.calendar_watch_horizon_minutes = max(10, int(calendar_horizon))
     if calendar_leads is not None:
-        parsed_leads = []
-        for token in calendar_leads.split(","):
-            raw = token.strip()
-            if not raw:
-                continue
-            try:
-                value = int(raw)
-            except ValueError:
-                continue
-            if value > 0:
-                parsed_leads.append(value)
+        parsed_leads = _parse_lead_minutes(calendar_leads)
         if parsed_leads:
-            proactive_cfg.calendar_watch_lead_minutes = sorted(set(parsed_leads), reverse=True)
+            proactive_cfg.calendar_watch_lead_minutes = parsed_leads
     save_config(config)
 
     store_path = get_data_dir() / "cron" / "jobs.json"
     service = CronService(store_path)
     existing = {job.name: job for job in service.list_jobs(include_disabled=True)}
 
-    created: list[str] = []
-    if "daily-digest" not in existing:
-        job = service.add_job(
-            name="daily-digest",
-            schedule=CronSchedule(kind="cron", expr=daily_cron),
-            message=DAILY_DIGEST_PROMPT,
-            deliver=deliver,
-            channel=channel,
-            to=to,
-        )
-        created.append(f"daily-digest ({job.id})")
-
-    if "weekly-lessons-distill" not in existing:
-        job = service.add_job(
-            name="weekly-lessons-distill",
-            schedule=CronSchedule(kind="cron", expr=weekly_cron),
-            message=WEEKLY_LESSONS_PROMPT,
-            deliver=deliver,
-            channel=channel,
-            to=to,
-        )
-        created.append(f"weekly-lessons-distill ({job.id})")
-
-    if include_calendar_watch and "calendar-watch" not in existing:
-        if deliver and channel and to:
+    created: list[tuple[str, str]] = []
+    with service.batch():
+        if "daily-digest" not in existing:
             job = service.add_job(
-                name="calendar-watch",
-                schedule=CronSchedule(
-                    kind="every",
-                    every_ms=max(1, int(proactive_cfg.calendar_watch_every_minutes)) * 60 * 1000,
-                ),
-                message="calendar_watch",
-                kind="system_event",
-                deliver=True,
+                name="daily-digest",
+                schedule=CronSchedule(kind="cron", expr=daily_cron),
+                message=DAILY_DIGEST_PROMPT,
+                deliver=deliver,
                 channel=channel,
                 to=to,
             )
-            created.append(f"calendar-watch ({job.id})")
-        else:
-            console.print(
-                "[yellow]Calendar watch skipped: requires --deliver --channel --to target.[/yellow]"
+            created.append(("daily-digest", job.id))
+
+        if "weekly-lessons-distill" not in existing:
+            job = service.add_job(
+                name="weekly-lessons-distill",
+                schedule=CronSchedule(kind="cron", expr=weekly_cron),
+                message=WEEKLY_LESSONS_PROMPT,
+                deliver=deliver,
+                channel=channel,
+                to=to,
             )
+            created.append(("weekly-lessons-distill", job.id))
+
+        if include_calendar_watch and "calendar-watch" not in existing:
+            # The --deliver guard above already guarantees channel and to here.
+            if deliver:
+                job = service.add_job(
+                    name="calendar-watch",
+                    schedule=CronSchedule(
+                        kind="every",
+                        every_ms=60_000 * max(1, int(proactive_cfg.calendar_watch_every_minutes)),
+                    ),
+                    message="calendar_watch",
+                    kind="system_event",
+                    deliver=True,
+                    channel=channel,
+                    to=to,
+                )
+                created.append(("calendar-watch", job.id))
+            else:
+                console.print(
+                    "[yellow]Calendar watch skipped: requires --deliver --channel --to target.[/yellow]"
+                )
 
     if created:
-        console.print("[green]✓[/green] Proactive jobs created:")
-        for item in created:
-            console.print(f"  - {item}")
+        console.print(
+            "\n".join(
+                ["[green]✓[/green] Proactive jobs created:"]
+                + [f"  - {name} ({job_id})" for name, job_id in created]
+            )
+        )
     else:
         console.print("[yellow]Proactive jobs already exist. No changes made.[/yellow]")
 
@@ -2148,12 +2607,7 @@ def proactive_disable():
     from g_agent.cron.service import CronService
 
     store_path = get_data_dir() / "cron" / "jobs.json"
-    service = CronService(store_path)
-    targets = {"daily-digest", "weekly-lessons-distill", "calendar-watch"}
-    removed = 0
-    for job in service.list_jobs(include_disabled=True):
-        if job.name in targets and service.remove_job(job.id):
-            removed += 1
+    removed = CronService(store_path).remove_jobs_by_name(_PROACTIVE_JOB_NAMES)
 
     if removed:
         console.print(f"[green]✓[/green] Removed {removed} proactive job(s).")
@@ -2188,8 +2642,9 @@ def policy_list():
     table.add_column("Description")
     table.add_column("Rules", justify="right")
 
-    for preset in list_presets():
-        table.add_row(preset.name, preset.description, str(len(preset.rules)))
+    add_row = table.add_row
+    for row in [(p.name, p.description, str(len(p.rules))) for p in list_presets()]:
+        add_row(*row)
 
     console.print(table)
 
@@ -2262,13 +2717,16 @@ def policy_status():
     from g_agent.config.loader import load_config
 
     config = load_config()
-    policy = dict(config.tools.policy)
+    policy = config.tools.policy
     if not policy:
         console.print("No policy rules configured.")
         return
 
-    global_rules = {k: v for k, v in policy.items() if ":" not in k}
-    scoped_rules = {k: v for k, v in policy.items() if ":" in k}
+    # One sort and one pass: both partitions come out already in key order.
+    global_rules: list[tuple[str, str]] = []
+    scoped_rules: list[tuple[str, str]] = []
+    for key, decision in sorted(policy.items()):
+        (scoped_rules if ":" in key else global_rules).append((key, decision))
 
     console.print(f"Approval mode: {config.tools.approval_mode}")
     console.print(
@@ -2281,16 +2739,18 @@ def policy_status():
         table = Table(title="Global Policy Rules")
         table.add_column("Key", style="cyan")
         table.add_column("Decision")
-        for key in sorted(global_rules):
-            table.add_row(key, global_rules[key])
+        add_row = table.add_row
+        for row in global_rules:
+            add_row(*row)
         console.print(table)
 
     if scoped_rules:
         table = Table(title="Scoped Policy Rules")
         table.add_column("Key", style="cyan")
         table.add_column("Decision")
-        for key in sorted(scoped_rules):
-            table.add_row(key, scoped_rules[key])
+        add_row = table.add_row
+        for row in scoped_rules:
+            add_row(*row)
         console.print(table)
 
 
@@ -2309,7 +2769,7 @@ def feedback(
     from g_agent.agent.memory import MemoryStore
     from g_agent.config.loader import load_config
 
-    if severity not in {"low", "medium", "high"}:
+    if severity not in _FEEDBACK_SEVERITIES:
         console.print("[red]Severity must be one of: low, medium, high[/red]")
         raise typer.Exit(1)
 
@@ -2348,10 +2808,10 @@ def memory_audit(
 
     config = load_config()
     store = MemoryStore(config.workspace_path)
-    summary_drifts = store.detect_summary_fact_drift(limit=max_items)
-    cross_scope_conflicts = store.detect_cross_scope_fact_conflicts(
-        scopes=scoped,
+    summary_drifts, cross_scope_conflicts = _detect_memory_issues(
+        store,
         limit=max_items,
+        scopes=scoped,
     )
 
     payload: dict[str, Any] = {
@@ -2366,7 +2826,7 @@ def memory_audit(
     }
 
     if as_json:
-        console.print(json.dumps(payload, indent=2, ensure_ascii=False))
+        _emit_json(payload)
     else:
         console.print(f"{__logo__} Memory Audit\n")
         console.print(f"Summary drift: {len(summary_drifts)}")
@@ -2418,7 +2878,26 @@ def security_audit(
     )
 
     if as_json:
-        console.print(json.dumps(report, indent=2, ensure_ascii=False))
+        _emit_json(report)
+    elif not console.is_terminal:
+        _emit_tsv(
+            [
+                (
+                    str(item.get("name", "")),
+                    str(item.get("level", "warn")).upper(),
+                    str(item.get("detail", "")),
+                    str(item.get("remediation", "") or "-"),
+                )
+                for item in report.get("checks", [])
+            ]
+        )
+        summary = report.get("summary", {})
+        console.print(
+            "Summary: "
+            f"pass={summary.get('pass', 0)}, "
+            f"warn={summary.get('warn', 0)}, "
+            f"fail={summary.get('fail', 0)}"
+        )
     else:
         table = Table(title=f"{__logo__} Security Audit")
         table.add_column("Check", style="cyan")
@@ -2481,27 +2960,39 @@ def security_fix(
     )
 
     if as_json:
-        console.print(json.dumps(report, indent=2, ensure_ascii=False))
+        _emit_json(report)
         return
 
-    table = Table(title=f"{__logo__} Security Fix ({'apply' if apply else 'dry-run'})")
-    table.add_column("Action", style="cyan")
-    table.add_column("Status")
-    table.add_column("Details", style="yellow")
+    if not console.is_terminal:
+        _emit_tsv(
+            [
+                (
+                    str(item.get("name", "")),
+                    str(item.get("status", "skipped")).upper(),
+                    str(item.get("detail", "")),
+                )
+                for item in report.get("actions", [])
+            ]
+        )
+    else:
+        table = Table(title=f"{__logo__} Security Fix ({'apply' if apply else 'dry-run'})")
+        table.add_column("Action", style="cyan")
+        table.add_column("Status")
+        table.add_column("Details", style="yellow")
 
-    for item in report.get("actions", []):
-        status = str(item.get("status", "skipped"))
-        if status in {"applied", "unchanged"}:
-            mark = "[green]APPLIED[/green]" if status == "applied" else "[green]OK[/green]"
-        elif status == "planned":
-            mark = "[yellow]PLAN[/yellow]"
-        elif status == "failed":
-            mark = "[red]FAILED[/red]"
-        else:
-            mark = "[yellow]SKIP[/yellow]"
-        table.add_row(str(item.get("name", "")), mark, str(item.get("detail", "")))
+        for item in report.get("actions", []):
+            status = str(item.get("status", "skipped"))
+            if status in _FIX_OK_STATUSES:
+                mark = "[green]APPLIED[/green]" if status == "applied" else "[green]OK[/green]"
+            elif status == "planned":
+                mark = "[yellow]PLAN[/yellow]"
+            elif status == "failed":
+                mark = "[red]FAILED[/red]"
+            else:
+                mark = "[yellow]SKIP[/yellow]"
+            table.add_row(str(item.get("name", "")), mark, str(item.get("detail", "")))
 
-    console.print(table)
+        console.print(table)
     before = report.get("before", {}).get("summary", {})
     after = report.get("after", {}).get("summary", {})
     console.print(
@@ -2529,7 +3020,7 @@ def metrics_cmd(
     export: str = typer.Option(
         "",
         "--export",
-        help="Optional output path (.json, .prom, .dashboard.json)",
+        help="Optional output path (.json, .prom, .dashboard.json; append .gz to compress)",
     ),
     export_format: str = typer.Option(
         "auto",
@@ -2585,6 +3076,7 @@ def metrics_cmd(
             Path(export.strip()),
             hours=hours,
             output_format=export_format,
+            snapshot=snapshot,
         )
         if not export_result.get("ok"):
             console.print(
@@ -2593,16 +3085,16 @@ def metrics_cmd(
             raise typer.Exit(1)
 
     if dashboard_json:
-        payload = store.dashboard_summary(hours=hours)
+        payload = store.dashboard_summary(hours=hours, snapshot=snapshot)
         if prune_result:
             payload["prune"] = prune_result
-        console.print(json.dumps(payload, indent=2, ensure_ascii=False))
+        _emit_json(payload)
     elif as_json:
         payload = dict(snapshot)
         payload["alerts"] = alerts
         if prune_result:
             payload["prune"] = prune_result
-        console.print(json.dumps(payload, indent=2, ensure_ascii=False))
+        _emit_json(payload)
     else:
         llm = snapshot["llm"]
         tools = snapshot["tools"]
@@ -2610,46 +3102,47 @@ def metrics_cmd(
         cron = snapshot["cron"]
         totals = snapshot["totals"]
 
-        console.print(f"{__logo__} Metrics ({snapshot['window_hours']}h)\n")
-        console.print(f"Events file: {snapshot['events_file']}")
-        console.print(f"Total events: {totals['events']}")
-        console.print(
+        lines = [f"{__logo__} Metrics ({snapshot['window_hours']}h)\n"]
+        lines.append(f"Events file: {escape(str(snapshot['events_file']))}")
+        lines.append(f"Total events: {totals['events']}")
+        lines.append(
             f"LLM calls: {llm['calls']} | success: {llm['success_rate']}% | p95: {llm['latency_ms_p95']}ms"
         )
-        console.print(
+        lines.append(
             f"Tool calls: {tools['calls']} | success: {tools['success_rate']}% | p95: {tools['latency_ms_p95']}ms"
         )
-        console.print(
+        lines.append(
             f"Recall hit-rate: {recall['hit_rate']}% ({recall['hit_queries']}/{recall['queries']}) | avg hits: {recall['avg_hits']}"
         )
-        console.print(
+        lines.append(
             f"Cron runs: {cron['runs']} | success: {cron['success_rate']}% | proactive: {cron['proactive_runs']}"
         )
-        console.print(
+        lines.append(
             f"Alerts: {alerts['overall']} | warn: {alerts['warn_count']} | ok: {alerts['ok_count']} | na: {alerts['na_count']}"
         )
         if alerts["warn_count"] > 0:
-            console.print("Alert checks:")
+            lines.append("Alert checks:")
             for item in alerts["checks"]:
                 if item["status"] != "warn":
                     continue
-                console.print(
-                    f"  - {item['key']}: {item['actual']} {item['operator']} {item['threshold']} "
+                lines.append(
+                    f"  - {escape(str(item['key']))}: {item['actual']} {item['operator']} {item['threshold']} "
                     f"(samples: {item['samples']})"
                 )
         top_tools = tools.get("top_tools", [])
         if top_tools:
-            console.print("Top tools:")
+            lines.append("Top tools:")
             for item in top_tools[:8]:
-                console.print(
-                    f"  - {item['tool']}: {item['calls']} call(s), {item['errors']} error(s)"
+                lines.append(
+                    f"  - {escape(str(item['tool']))}: {item['calls']} call(s), {item['errors']} error(s)"
                 )
         if prune_result:
-            console.print(
+            lines.append(
                 f"Prune: removed {prune_result['removed_total']} event(s), "
                 f"kept {prune_result['after']} (age={prune_result['removed_by_age']}, cap={prune_result['removed_by_cap']}, "
                 f"dry-run={prune_result['dry_run']})"
             )
+        _print_markup_lines(lines)
 
     if export_result:
         console.print(
@@ -2665,31 +3158,34 @@ def status():
 
     from g_agent.config.loader import get_config_path, get_data_dir, load_config
 
+    _path_exists.cache_clear()
     data_dir = get_data_dir()
     config_path = get_config_path()
     config = load_config()
     workspace = config.workspace_path
 
-    console.print(f"{__logo__} {__brand__} Status\n")
+    # Collected and printed once, so the whole report goes out in a single write.
+    lines = [f"{__logo__} {__brand__} Status\n"]
 
-    console.print(
-        f"Data dir: {data_dir} {'[green]✓[/green]' if data_dir.exists() else '[red]✗[/red]'}"
+    lines.append(
+        f"Data dir: {escape(str(data_dir))} {'[green]✓[/green]' if _path_exists(str(data_dir)) else '[red]✗[/red]'}"
     )
-    console.print(
-        f"Config: {config_path} {'[green]✓[/green]' if config_path.exists() else '[red]✗[/red]'}"
+    lines.append(
+        f"Config: {escape(str(config_path))} {'[green]✓[/green]' if _path_exists(str(config_path)) else '[red]✗[/red]'}"
     )
-    console.print(
-        f"Workspace: {workspace} {'[green]✓[/green]' if workspace.exists() else '[red]✗[/red]'}"
+    lines.append(
+        f"Workspace: {escape(str(workspace))} {'[green]✓[/green]' if _path_exists(str(workspace)) else '[red]✗[/red]'}"
     )
 
-    if config_path.exists():
+    if _path_exists(str(config_path)):
         route = config.resolve_model_route()
-        console.print(f"Model: {route.model}")
-        console.print(
-            f"Routing: mode={route.mode}, provider={route.provider}, base={route.api_base or 'none'}"
+        lines.append(f"Model: {escape(route.model)}")
+        lines.append(
+            f"Routing: mode={route.mode}, provider={escape(route.provider)}, "
+            f"base={escape(route.api_base or 'none')}"
         )
         if route.fallback_models:
-            console.print(f"Fallback models: {', '.join(route.fallback_models)}")
+            lines.append(f"Fallback models: {escape(', '.join(route.fallback_models))}")
 
         # Check API keys
         has_openrouter = bool(config.providers.openrouter.api_key)
@@ -2699,45 +3195,45 @@ def status():
         has_vllm = bool(config.providers.vllm.api_base)
         has_brave = bool(config.tools.web.search.api_key)
 
-        console.print(
+        lines.append(
             f"OpenRouter API: {'[green]✓[/green]' if has_openrouter else '[dim]not set[/dim]'}"
         )
-        console.print(
+        lines.append(
             f"Anthropic API: {'[green]✓[/green]' if has_anthropic else '[dim]not set[/dim]'}"
         )
-        console.print(f"OpenAI API: {'[green]✓[/green]' if has_openai else '[dim]not set[/dim]'}")
-        console.print(f"Gemini API: {'[green]✓[/green]' if has_gemini else '[dim]not set[/dim]'}")
+        lines.append(f"OpenAI API: {'[green]✓[/green]' if has_openai else '[dim]not set[/dim]'}")
+        lines.append(f"Gemini API: {'[green]✓[/green]' if has_gemini else '[dim]not set[/dim]'}")
         vllm_status = (
-            f"[green]✓ {config.providers.vllm.api_base}[/green]"
+            f"[green]✓ {escape(config.providers.vllm.api_base)}[/green]"
             if has_vllm
             else "[dim]not set[/dim]"
         )
-        console.print(f"vLLM/Local: {vllm_status}")
-        console.print(
+        lines.append(f"vLLM/Local: {vllm_status}")
+        lines.append(
             f"Brave Search API: {'[green]✓[/green]' if has_brave else '[dim]not set[/dim]'}"
         )
-        console.print(
+        lines.append(
             f"Security (restrictToWorkspace): {'[green]✓ enabled[/green]' if config.tools.restrict_to_workspace else '[yellow]disabled[/yellow]'}"
         )
-        console.print(
+        lines.append(
             f"Reasoning reflection: {'[green]✓ enabled[/green]' if config.agents.defaults.enable_reflection else '[dim]disabled[/dim]'}"
         )
-        console.print(f"Session summary interval: {config.agents.defaults.summary_interval} turns")
+        lines.append(f"Session summary interval: {config.agents.defaults.summary_interval} turns")
 
         tg = config.channels.telegram
         wa = config.channels.whatsapp
-        console.print(
+        lines.append(
             f"Telegram channel: {'[green]✓ enabled[/green]' if tg.enabled else '[dim]disabled[/dim]'} (allowFrom: {len(tg.allow_from)})"
         )
-        console.print(
+        lines.append(
             f"WhatsApp channel: {'[green]✓ enabled[/green]' if wa.enabled else '[dim]disabled[/dim]'} (allowFrom: {len(wa.allow_from)})"
         )
 
-        console.print(
+        lines.append(
             f"Slack webhook: {'[green]✓[/green]' if config.integrations.slack.webhook_url else '[dim]not set[/dim]'}"
         )
         has_smtp = bool(config.integrations.smtp.host)
-        console.print(
+        lines.append(
             f"SMTP integration: {'[green]✓[/green]' if has_smtp else '[dim]not set[/dim]'}"
         )
         has_google = bool(
@@ -2748,92 +3244,95 @@ def status():
                 and config.integrations.google.refresh_token
             )
         )
-        console.print(
+        lines.append(
             f"Google Workspace: {'[green]✓[/green]' if has_google else '[dim]not set[/dim]'}"
         )
         google_has_client = bool(
             config.integrations.google.client_id and config.integrations.google.client_secret
         )
         google_has_refresh = bool(config.integrations.google.refresh_token)
-        console.print(
+        lines.append(
             f"Google OAuth parts: client={'✓' if google_has_client else '✗'}, refresh={'✓' if google_has_refresh else '✗'}"
         )
         browser_allow = len(config.tools.browser.allow_domains)
         browser_deny = len(config.tools.browser.deny_domains)
         policy_global = sum(1 for key in config.tools.policy if ":" not in key)
         policy_scoped = len(config.tools.policy) - policy_global
-        console.print(
+        lines.append(
             f"Browser policy: allow={browser_allow}, deny={browser_deny}, timeout={config.tools.browser.timeout_seconds}s"
         )
-        console.print(f"Tool policy rules: {len(config.tools.policy)}")
-        console.print(f"Tool policy scope: global={policy_global}, scoped={policy_scoped}")
-        console.print(f"Approval mode: {config.tools.approval_mode}")
+        lines.append(f"Tool policy rules: {len(config.tools.policy)}")
+        lines.append(f"Tool policy scope: global={policy_global}, scoped={policy_scoped}")
+        lines.append(f"Approval mode: {escape(config.tools.approval_mode)}")
         quiet_cfg = config.proactive.quiet_hours
         quiet_desc = (
             f"{quiet_cfg.start}-{quiet_cfg.end} ({quiet_cfg.timezone})"
             if quiet_cfg.enabled
             else "disabled"
         )
-        console.print(f"Quiet hours: {quiet_desc}")
+        lines.append(f"Quiet hours: {escape(quiet_desc)}")
         try:
             from g_agent.cron.service import CronService
 
-            proactive_names = {"daily-digest", "weekly-lessons-distill", "calendar-watch"}
-            cron_service = CronService(get_data_dir() / "cron" / "jobs.json")
-            proactive_count = sum(
-                1
-                for job in cron_service.list_jobs(include_disabled=True)
-                if job.name in proactive_names
-            )
-            console.print(f"Proactive jobs: {proactive_count}")
+            cron_service = CronService(data_dir / "cron" / "jobs.json")
+            proactive_count = cron_service.count_jobs_by_name(_PROACTIVE_JOB_NAMES)
+            lines.append(f"Proactive jobs: {proactive_count}")
         except Exception:
-            console.print("Proactive jobs: [dim]unknown[/dim]")
-        try:
-            from g_agent.observability.metrics import MetricsStore
+            lines.append("Proactive jobs: [dim]unknown[/dim]")
+        metrics_file = workspace / "state" / "metrics" / "events.jsonl"
+        if not _path_exists(str(metrics_file)):
+            lines.append("Metrics (24h): [dim]no data[/dim]")
+        else:
+            try:
+                from g_agent.observability.metrics import MetricsStore
+
+                metrics_store = MetricsStore(metrics_file)
+                metrics_snapshot = metrics_store.snapshot_tail(hours=24)
+                metrics_alerts = metrics_store.alert_compact(hours=24, snapshot=metrics_snapshot)
+                lines.append(
+                    "Metrics (24h): "
+                    f"events={metrics_snapshot['totals']['events']}, "
+                    f"llm={metrics_snapshot['llm']['calls']}, "
+                    f"tools={metrics_snapshot['tools']['calls']}, "
+                    f"recall-hit={metrics_snapshot['recall']['hit_rate']}%"
+                )
+                lines.append(f"Metrics alerts (24h): {escape(metrics_alerts['brief'])}")
+            except Exception:
+                lines.append("Metrics (24h): [dim]unknown[/dim]")
 
-            metrics_store = MetricsStore(workspace / "state" / "metrics" / "events.jsonl")
-            metrics_snapshot = metrics_store.snapshot(hours=24)
-            metrics_alerts = metrics_store.alert_compact(hours=24, snapshot=metrics_snapshot)
-            console.print(
-                "Metrics (24h): "
-                f"events={metrics_snapshot['totals']['events']}, "
-                f"llm={metrics_snapshot['llm']['calls']}, "
-                f"tools={metrics_snapshot['tools']['calls']}, "
-                f"recall-hit={metrics_snapshot['recall']['hit_rate']}%"
-            )
-            console.print(f"Metrics alerts (24h): {metrics_alerts['brief']}")
-        except Exception:
-            console.print("Metrics (24h): [dim]unknown[/dim]")
-
-        memory_file = workspace / "memory" / "MEMORY.md"
-        facts_file = workspace / "memory" / "FACTS.md"
-        lessons_file = workspace / "memory" / "LESSONS.md"
-        profile_file = workspace / "memory" / "PROFILE.md"
-        relationships_file = workspace / "memory" / "RELATIONSHIPS.md"
-        projects_file = workspace / "memory" / "PROJECTS.md"
-        today_file = workspace / "memory" / f"{datetime.now().strftime('%Y-%m-%d')}.md"
-        console.print(
-            f"Long-term memory: {'[green]✓[/green]' if memory_file.exists() else '[yellow]missing[/yellow]'} ({memory_file})"
+        memory_dir = workspace / "memory"
+        memory_entries = _dir_entry_names(memory_dir)
+        memory_file = memory_dir / "MEMORY.md"
+        facts_file = memory_dir / "FACTS.md"
+        lessons_file = memory_dir / "LESSONS.md"
+        profile_file = memory_dir / "PROFILE.md"
+        relationships_file = memory_dir / "RELATIONSHIPS.md"
+        projects_file = memory_dir / "PROJECTS.md"
+        today_file = memory_dir / f"{datetime.now().strftime('%Y-%m-%d')}.md"
+        lines.append(
+            f"Long-term memory: {'[green]✓[/green]' if memory_file.name in memory_entries else '[yellow]missing[/yellow]'} ({escape(str(memory_file))})"
         )
-        console.print(
-            f"Fact index memory: {'[green]✓[/green]' if facts_file.exists() else '[dim]not created yet[/dim]'} ({facts_file})"
+        lines.append(
+            f"Fact index memory: {'[green]✓[/green]' if facts_file.name in memory_entries else '[dim]not created yet[/dim]'} ({escape(str(facts_file))})"
         )
-        console.print(
-            f"Lessons memory: {'[green]✓[/green]' if lessons_file.exists() else '[dim]not created yet[/dim]'} ({lessons_file})"
+        lines.append(
+            f"Lessons memory: {'[green]✓[/green]' if lessons_file.name in memory_entries else '[dim]not created yet[/dim]'} ({escape(str(lessons_file))})"
         )
-        console.print(
-            f"Profile memory: {'[green]✓[/green]' if profile_file.exists() else '[dim]not created yet[/dim]'} ({profile_file})"
+        lines.append(
+            f"Profile memory: {'[green]✓[/green]' if profile_file.name in memory_entries else '[dim]not created yet[/dim]'} ({escape(str(profile_file))})"
         )
-        console.print(
-            f"Relationships memory: {'[green]✓[/green]' if relationships_file.exists() else '[dim]not created yet[/dim]'} ({relationships_file})"
+        lines.append(
+            f"Relationships memory: {'[green]✓[/green]' if relationships_file.name in memory_entries else '[dim]not created yet[/dim]'} ({escape(str(relationships_file))})"
         )
-        console.print(
-            f"Projects memory: {'[green]✓[/green]' if projects_file.exists() else '[dim]not created yet[/dim]'} ({projects_file})"
+        lines.append(
+            f"Projects memory: {'[green]✓[/green]' if projects_file.name in memory_entries else '[dim]not created yet[/dim]'} ({escape(str(projects_file))})"
         )
-        console.print(
-            f"Today memory note: {'[green]✓[/green]' if today_file.exists() else '[dim]not created yet[/dim]'}"
+        lines.append(
+            f"Today memory note: {'[green]✓[/green]' if today_file.name in memory_entries else '[dim]not created yet[/dim]'}"
         )
 
+    _print_markup_lines(lines)
+
 
 @app.command()
 def doctor(
@@ -2844,36 +3343,27 @@ def doctor(
     strict: bool = typer.Option(False, "--strict", help="Exit with code 1 if any check fails"),
 ):
     """Run diagnostics for model, channels, memory, and tool configuration."""
-    import socket
-    from datetime import datetime
-    from urllib.parse import urlparse
-
-    import httpx
+    import asyncio
 
     from g_agent.config.loader import get_config_path, get_data_dir, load_config
 
-    def _mark(level: str) -> str:
-        if level == "pass":
-            return "[green]PASS[/green]"
-        if level == "warn":
-            return "[yellow]WARN[/yellow]"
-        return "[red]FAIL[/red]"
-
     results: list[tuple[str, str, str, str]] = []
 
     def add(check: str, level: str, detail: str, fix: str = "") -> None:
         results.append((check, level, detail, fix))
 
+    _path_exists.cache_clear()
+    data_dir = get_data_dir()
     config_path = get_config_path()
     config = load_config()
     workspace = config.workspace_path
 
-    if config_path.exists():
+    if _path_exists(str(config_path)):
         add("Config file", "pass", str(config_path))
     else:
         add("Config file", "fail", str(config_path), "Run: g-agent onboard")
 
-    if workspace.exists():
+    if _path_exists(str(workspace)):
         add("Workspace", "pass", str(workspace))
     else:
         add("Workspace", "fail", str(workspace), f"Run: mkdir -p {workspace}")
@@ -2891,7 +3381,7 @@ def doctor(
 
         security_report = run_security_audit(
             config=config,
-            data_dir=get_data_dir(),
+            data_dir=data_dir,
             config_path=config_path,
             workspace_path=workspace,
         )
@@ -2920,7 +3410,7 @@ def doctor(
     route = config.resolve_model_route(model)
     model_key = route.api_key
     if not model_key and route.provider not in {"vllm", "bedrock"}:
-        model_key = config.get_api_key(model)
+        model_key = config.fallback_api_key()
     is_bedrock = route.provider == "bedrock" or model.startswith("bedrock/")
     if is_bedrock or model_key:
         provider_detail = (
@@ -3021,10 +3511,10 @@ def doctor(
         )
     add(
         "Tool approval mode",
-        "pass" if config.tools.approval_mode in {"off", "confirm"} else "warn",
+        "pass" if config.tools.approval_mode in _APPROVAL_MODES else "warn",
         config.tools.approval_mode,
         ""
-        if config.tools.approval_mode in {"off", "confirm"}
+        if config.tools.approval_mode in _APPROVAL_MODES
         else "Use tools.approvalMode = off|confirm",
     )
     add(
@@ -3046,11 +3536,8 @@ def doctor(
     try:
         from g_agent.cron.service import CronService
 
-        proactive_names = {"daily-digest", "weekly-lessons-distill", "calendar-watch"}
-        cron_store_path = get_data_dir() / "cron" / "jobs.json"
-        cron_service = CronService(cron_store_path)
-        jobs = cron_service.list_jobs(include_disabled=True)
-        proactive_count = sum(1 for job in jobs if job.name in proactive_names)
+        cron_service = CronService(data_dir / "cron" / "jobs.json")
+        proactive_count = cron_service.count_jobs_by_name(_PROACTIVE_JOB_NAMES)
         add(
             "Proactive jobs",
             "pass" if proactive_count >= 1 else "warn",
@@ -3077,85 +3564,39 @@ def doctor(
         "" if quiet_ok else "Set proactive.quietHours.start/end (HH:MM)",
     )
 
+    workspace_entries = _dir_entry_names(workspace)
     calendar_dir = workspace / "calendar"
+    calendar_ok = calendar_dir.name in workspace_entries
     add(
         "Calendar integration",
-        "pass" if calendar_dir.exists() else "warn",
+        "pass" if calendar_ok else "warn",
         str(calendar_dir),
-        "" if calendar_dir.exists() else "Will be created on first create_calendar_event tool call",
+        "" if calendar_ok else "Will be created on first create_calendar_event tool call",
     )
 
-    memory_file = workspace / "memory" / "MEMORY.md"
-    facts_file = workspace / "memory" / "FACTS.md"
-    lessons_file = workspace / "memory" / "LESSONS.md"
-    profile_file = workspace / "memory" / "PROFILE.md"
-    relationships_file = workspace / "memory" / "RELATIONSHIPS.md"
-    projects_file = workspace / "memory" / "PROJECTS.md"
-    today_file = workspace / "memory" / f"{datetime.now().strftime('%Y-%m-%d')}.md"
-    add(
-        "Memory file",
-        "pass" if memory_file.exists() else "warn",
-        str(memory_file),
-        ""
-        if memory_file.exists()
-        else f"Run: mkdir -p {workspace / 'memory'} && printf '# Long-term Memory\\n' > {memory_file}",
-    )
-    add(
-        "Fact index",
-        "pass" if facts_file.exists() else "warn",
-        str(facts_file),
-        ""
-        if facts_file.exists()
-        else "Create by using remember tool once (or run g-agent onboard)",
-    )
-    add(
-        "Profile memory",
-        "pass" if profile_file.exists() else "warn",
-        str(profile_file),
-        ""
-        if profile_file.exists()
-        else "Create with: g-agent onboard (or create memory/PROFILE.md)",
-    )
-    add(
-        "Relationships memory",
-        "pass" if relationships_file.exists() else "warn",
-        str(relationships_file),
-        ""
-        if relationships_file.exists()
-        else "Create with: g-agent onboard (or create memory/RELATIONSHIPS.md)",
-    )
-    add(
-        "Projects memory",
-        "pass" if projects_file.exists() else "warn",
-        str(projects_file),
-        ""
-        if projects_file.exists()
-        else "Create with: g-agent onboard (or create memory/PROJECTS.md)",
-    )
-    add(
-        "Today memory note",
-        "pass" if today_file.exists() else "warn",
-        str(today_file),
-        "" if today_file.exists() else "Create by chatting once (or write file manually)",
-    )
-    add(
-        "Lessons memory",
-        "pass" if lessons_file.exists() else "warn",
-        str(lessons_file),
-        "" if lessons_file.exists() else 'Create with: g-agent feedback "<lesson>"',
-    )
+    memory_dir = workspace / "memory"
+    memory_entries = _dir_entry_names(memory_dir)
+    today = datetime.now().strftime("%Y-%m-%d")
+    for filename, check, fix in _DOCTOR_MEMORY_CHECKS:
+        path = memory_dir / filename.format(today=today)
+        present = path.name in memory_entries
+        add(
+            check,
+            "pass" if present else "warn",
+            str(path),
+            "" if present else fix.format(memory_dir=memory_dir, path=path),
+        )
     try:
         from g_agent.agent.memory import MemoryStore
 
         memory_store = MemoryStore(workspace)
-        summary_drifts = memory_store.detect_summary_fact_drift(limit=50)
+        summary_drifts, cross_scope_conflicts = _detect_memory_issues(memory_store, limit=50)
         add(
             "Memory summary drift",
             "pass" if not summary_drifts else "warn",
             f"{len(summary_drifts)} issue(s)",
             "" if not summary_drifts else "Review with: g-agent memory-audit",
         )
-        cross_scope_conflicts = memory_store.detect_cross_scope_fact_conflicts(limit=50)
         add(
             "Memory cross-scope conflicts",
             "pass" if not cross_scope_conflicts else "warn",
@@ -3171,12 +3612,12 @@ def doctor(
         )
 
     metrics_file = workspace / "state" / "metrics" / "events.jsonl"
-    if metrics_file.exists():
+    if _path_exists(str(metrics_file)):
         try:
             from g_agent.observability.metrics import MetricsStore
 
             metrics_store = MetricsStore(metrics_file)
-            metrics_snapshot = metrics_store.snapshot(hours=24)
+            metrics_snapshot = metrics_store.snapshot_tail(hours=24)
             metrics_alerts = metrics_store.alert_compact(hours=24, snapshot=metrics_snapshot)
             add(
                 "Observability metrics",
@@ -3206,229 +3647,212 @@ def doctor(
             "Metrics file appears after first tool/LLM activity",
         )
 
-    if config.providers.vllm.api_base:
+    async def _probe_vllm(client: "httpx.AsyncClient") -> tuple[str, str, str, str]:
+        if not config.providers.vllm.api_base:
+            return (
+                "vLLM /models",
+                "warn",
+                "providers.vllm.apiBase not configured",
+                f"Set providers.vllm.apiBase in {config_path}",
+            )
         url = f"{config.providers.vllm.api_base.rstrip('/')}/models"
         headers = {}
         if config.providers.vllm.api_key:
             headers["Authorization"] = f"Bearer {config.providers.vllm.api_key}"
         try:
-            with httpx.Client(timeout=timeout) as client:
-                response = client.get(url, headers=headers)
+            response = await client.get(url, headers=headers)
             if response.status_code == 200:
                 count = len(response.json().get("data", []))
-                add("vLLM /models", "pass", f"{url} ({count} models)")
-            else:
-                add(
-                    "vLLM /models",
-                    "fail",
-                    f"{url} (HTTP {response.status_code})",
-                    f"Test manually: curl -sS {url} -H 'Authorization: Bearer <api-key>'",
-                )
+                return ("vLLM /models", "pass", f"{url} ({count} models)", "")
+            return (
+                "vLLM /models",
+                "fail",
+                f"{url} (HTTP {response.status_code})",
+                f"Test manually: curl -sS {url} -H 'Authorization: Bearer <api-key>'",
+            )
         except Exception as e:
-            add(
+            return (
                 "vLLM /models",
                 "fail",
                 f"{url} ({type(e).__name__}: {e})",
                 "Start your local proxy/server and ensure apiBase points to it",
             )
-    else:
-        add(
-            "vLLM /models",
-            "warn",
-            "providers.vllm.apiBase not configured",
-            f"Set providers.vllm.apiBase in {config_path}",
-        )
 
-    tg = config.channels.telegram
-    if tg.enabled:
+    async def _probe_telegram(client: "httpx.AsyncClient") -> tuple[str, str, str, str]:
+        tg = config.channels.telegram
+        if not tg.enabled:
+            return (
+                "Telegram channel",
+                "warn",
+                "disabled",
+                "Enable channels.telegram.enabled=true and set allowFrom",
+            )
         if not tg.token:
-            add(
+            return (
                 "Telegram bot token",
                 "fail",
                 "telegram enabled but token empty",
                 f"Set channels.telegram.token in {config_path}",
             )
-        elif not network:
-            add("Telegram API", "warn", "skipped (--no-network)", "Run again with --network")
-        else:
-            url = f"https://api.telegram.org/bot{tg.token}/getMe"
-            client_kwargs = {"timeout": timeout}
+        if not network:
+            return ("Telegram API", "warn", "skipped (--no-network)", "Run again with --network")
+
+        import httpx
+
+        url = f"https://api.telegram.org/bot{tg.token}/getMe"
+        fail_hint = "Verify token: curl -sS https://api.telegram.org/bot<TOKEN>/getMe"
+        try:
             if tg.proxy:
-                client_kwargs["proxy"] = tg.proxy
-            try:
-                with httpx.Client(**client_kwargs) as client:
-                    response = client.get(url)
-                if response.status_code == 200 and response.json().get("ok"):
-                    username = response.json().get("result", {}).get("username", "unknown")
-                    add("Telegram API", "pass", f"@{username}")
-                else:
-                    add(
-                        "Telegram API",
-                        "fail",
-                        f"HTTP {response.status_code}",
-                        "Verify token: curl -sS https://api.telegram.org/bot<TOKEN>/getMe",
-                    )
-            except TypeError:
-                try:
-                    with httpx.Client(timeout=timeout) as client:
-                        response = client.get(url)
-                    if response.status_code == 200 and response.json().get("ok"):
-                        username = response.json().get("result", {}).get("username", "unknown")
-                        add("Telegram API", "pass", f"@{username}")
-                    else:
-                        add(
-                            "Telegram API",
-                            "fail",
-                            f"HTTP {response.status_code}",
-                            "Verify token and network route to api.telegram.org:443",
-                        )
-                except Exception as e:
-                    add(
-                        "Telegram API",
-                        "fail",
-                        f"{type(e).__name__}: {e}",
-                        "Check internet/proxy and token validity",
-                    )
-            except Exception as e:
-                add(
-                    "Telegram API",
-                    "fail",
-                    f"{type(e).__name__}: {e}",
-                    "Check internet/proxy and token validity",
-                )
-    else:
-        add(
-            "Telegram channel",
-            "warn",
-            "disabled",
-            "Enable channels.telegram.enabled=true and set allowFrom",
-        )
+                proxy_kwargs = {_httpx_proxy_kwarg(): tg.proxy}
+                async with httpx.AsyncClient(timeout=timeout, **proxy_kwargs) as proxy_client:
+                    response = await proxy_client.get(url)
+            else:
+                response = await client.get(url)
+            if response.status_code == 200:
+                data = response.json()
+                if data.get("ok"):
+                    username = data.get("result", {}).get("username", "unknown")
+                    return ("Telegram API", "pass", f"@{username}", "")
+            return ("Telegram API", "fail", f"HTTP {response.status_code}", fail_hint)
+        except Exception as e:
+            return (
+                "Telegram API",
+                "fail",
+                f"{type(e).__name__}: {e}",
+                "Check internet/proxy and token validity",
+            )
 
-    wa = config.channels.whatsapp
-    if wa.enabled:
+    async def _probe_whatsapp() -> tuple[str, str, str, str]:
+        wa = config.channels.whatsapp
+        if not wa.enabled:
+            return (
+                "WhatsApp channel",
+                "warn",
+                "disabled",
+                "Enable channels.whatsapp.enabled=true and set allowFrom",
+            )
         try:
-            parsed = urlparse(wa.bridge_url)
-            if parsed.scheme not in {"ws", "wss"} or not parsed.hostname:
-                raise ValueError("bridgeUrl must be a valid ws:// or wss:// URL")
-
-            default_port = 443 if parsed.scheme == "wss" else 80
-            port = parsed.port or default_port
-            with socket.create_connection((parsed.hostname, port), timeout=timeout):
-                pass
-            add("WhatsApp bridge", "pass", wa.bridge_url)
+            host, port = _bridge_endpoint(wa.bridge_url)
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port),
+                timeout=timeout,
+            )
+            writer.close()
+            await writer.wait_closed()
+            return ("WhatsApp bridge", "pass", wa.bridge_url, "")
         except Exception as e:
-            add(
+            return (
                 "WhatsApp bridge",
                 "fail",
                 f"{wa.bridge_url} ({type(e).__name__}: {e})",
                 "Start bridge with: g-agent channels login (keep it running)",
             )
-    else:
-        add(
-            "WhatsApp channel",
-            "warn",
-            "disabled",
-            "Enable channels.whatsapp.enabled=true and set allowFrom",
-        )
 
-    brave_key = config.tools.web.search.api_key
-    if brave_key:
+    async def _probe_brave(client: "httpx.AsyncClient") -> tuple[str, str, str, str]:
+        brave_key = config.tools.web.search.api_key
+        if not brave_key:
+            return (
+                "Brave Search API",
+                "warn",
+                "tools.web.search.apiKey not set",
+                f"Set tools.web.search.apiKey in {config_path}",
+            )
         if not network:
-            add(
+            return (
                 "Brave Search API",
                 "warn",
                 "key set, skipped (--no-network)",
                 "Run again with --network",
             )
-        else:
-            try:
-                with httpx.Client(timeout=timeout) as client:
-                    response = client.get(
-                        "https://api.search.brave.com/res/v1/web/search",
-                        params={"q": "g-agent health check", "count": 1},
-                        headers={
-                            "Accept": "application/json",
-                            "X-Subscription-Token": brave_key,
-                        },
-                    )
-                if response.status_code == 200:
-                    add("Brave Search API", "pass", "search endpoint reachable")
-                else:
-                    add(
-                        "Brave Search API",
-                        "fail",
-                        f"HTTP {response.status_code}",
-                        "Verify key at Brave dashboard and retry",
-                    )
-            except Exception as e:
-                add(
-                    "Brave Search API",
-                    "fail",
-                    f"{type(e).__name__}: {e}",
-                    "Check internet access and Brave API key",
-                )
-    else:
-        add(
-            "Brave Search API",
-            "warn",
-            "tools.web.search.apiKey not set",
-            f"Set tools.web.search.apiKey in {config_path}",
-        )
+        try:
+            response = await client.get(
+                "https://api.search.brave.com/res/v1/web/search",
+                params={"q": "g-agent health check", "count": 1},
+                headers={
+                    "Accept": "application/json",
+                    "X-Subscription-Token": brave_key,
+                },
+            )
+            if response.status_code == 200:
+                return ("Brave Search API", "pass", "search endpoint reachable", "")
+            return (
+                "Brave Search API",
+                "fail",
+                f"HTTP {response.status_code}",
+                "Verify key at Brave dashboard and retry",
+            )
+        except Exception as e:
+            return (
+                "Brave Search API",
+                "fail",
+                f"{type(e).__name__}: {e}",
+                "Check internet access and Brave API key",
+            )
 
-    if has_google_token or has_google_refresh:
+    async def _probe_google(client: "httpx.AsyncClient") -> tuple[str, str, str, str] | None:
+        if not (has_google_token or has_google_refresh):
+            return None
         if not network:
-            add("Google API network", "warn", "skipped (--no-network)", "Run again with --network")
-        else:
-            try:
-                from g_agent.agent.tools.google_workspace import GoogleWorkspaceClient
-
-                google_client = GoogleWorkspaceClient(
-                    client_id=google_cfg.client_id,
-                    client_secret=google_cfg.client_secret,
-                    refresh_token=google_cfg.refresh_token,
-                    access_token=google_cfg.access_token,
-                    calendar_id=google_cfg.calendar_id,
-                )
-                ok, payload = asyncio.run(
-                    google_client.request(
-                        "GET",
-                        "https://gmail.googleapis.com/gmail/v1/users/me/profile",
-                    )
-                )
-                if ok:
-                    mode = "refresh-token flow" if has_google_refresh else "access token"
-                    add("Google API network", "pass", f"reachable ({mode})")
-                else:
-                    detail = payload.get("error", payload) if isinstance(payload, dict) else payload
-                    add(
-                        "Google API network",
-                        "fail",
-                        str(detail),
-                        "Verify Google token/refresh credentials",
-                    )
-            except Exception as e:
-                add(
-                    "Google API network",
-                    "fail",
-                    f"{type(e).__name__}: {e}",
-                    "Check internet access and Google credentials",
-                )
+            return (
+                "Google API network",
+                "warn",
+                "skipped (--no-network)",
+                "Run again with --network",
+            )
+        try:
+            from g_agent.agent.tools.google_workspace import GoogleWorkspaceClient
+
+            google_client = GoogleWorkspaceClient(
+                client_id=google_cfg.client_id,
+                client_secret=google_cfg.client_secret,
+                refresh_token=google_cfg.refresh_token,
+                access_token=google_cfg.access_token,
+                calendar_id=google_cfg.calendar_id,
+                http_client=client,
+            )
+            ok, payload = await google_client.request(
+                "GET",
+                "https://gmail.googleapis.com/gmail/v1/users/me/profile",
+            )
+            if ok:
+                mode = "refresh-token flow" if has_google_refresh else "access token"
+                return ("Google API network", "pass", f"reachable ({mode})", "")
+            detail = payload.get("error", payload) if isinstance(payload, dict) else payload
+            return (
+                "Google API network",
+                "fail",
+                str(detail),
+                "Verify Google token/refresh credentials",
+            )
+        except Exception as e:
+            return (
+                "Google API network",
+                "fail",
+                f"{type(e).__name__}: {e}",
+                "Check internet access and Google credentials",
+            )
 
-    table = Table(title=f"{__brand__} Doctor")
-    table.add_column("Check", style="cyan")
-    table.add_column("Status")
-    table.add_column("Details", style="yellow")
-    table.add_column("Fix Hint", style="magenta")
-    for check, level, detail, fix in results:
-        table.add_row(check, _mark(level), detail, fix or "-")
-    console.print(table)
+    async def _run_probes() -> list[tuple[str, str, str, str]]:
+        import httpx
+
+        # Independent checks: overlap their round-trips; gather keeps row order.
+        # One pooled client serves every HTTP probe (keep-alive + TLS reuse).
+        async with httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+        ) as client:
+            rows = await asyncio.gather(
+                _probe_vllm(client),
+                _probe_telegram(client),
+                _probe_whatsapp(),
+                _probe_brave(client),
+                _probe_google(client),
+            )
+        return [row for row in rows if row is not None]
 
-    fail_count = sum(1 for _, level, _, _ in results if level == "fail")
-    warn_count = sum(1 for _, level, _, _ in results if level == "warn")
-    pass_count = len(results) - fail_count - warn_count
-    console.print(
-        f"Summary: [green]{pass_count} pass[/green], [yellow]{warn_count} warn[/yellow], [red]{fail_count} fail[/red]"
-    )
+    results.extend(_run_event_loop(_run_probes()))
+
+    fail_count = _print_check_summary(results, title=f"{__brand__} Doctor")
 
     if strict and fail_count > 0:
         raise typer.Exit(1)
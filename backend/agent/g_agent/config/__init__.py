@@ -1,6 +1,16 @@
 """Configuration module for Galyarder Agent."""
 
-from g_agent.config.loader import get_config_path, load_config
-from g_agent.config.schema import Config
-
 __all__ = ["Config", "load_config", "get_config_path"]
+
+
+def __getattr__(name: str):
+    # Resolved on first access so importing a submodule (e.g. presets) does not load the schema.
+    if name == "Config":
+        from g_agent.config.schema import Config
+
+        return Config
+    if name in ("load_config", "get_config_path"):
+        from g_agent.config import loader
+
+        return getattr(loader, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
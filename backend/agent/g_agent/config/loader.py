@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Any
 
 from g_agent.config.schema import Config
-from g_agent.utils.helpers import get_data_path
+from g_agent.utils.helpers import get_data_path, json_dumps_pretty, json_loads, write_bytes_atomic
 
 
 def deep_merge_config(existing: dict[str, Any], defaults: dict[str, Any]) -> dict[str, Any]:
@@ -29,10 +29,29 @@ def get_data_dir() -> Path:
     return get_data_path()
 
 
+# Deprecated default model names that _migrate_config rewrites on load.
+_LEGACY_DEFAULT_MODELS = frozenset(
+    {
+        "anthropic/claude-opus-4-5",
+        "anthropic/claude-opus-4-5-thinking",
+        "claude-opus-4-5",
+        "claude-opus-4-5-thinking",
+        "gemini-claude-opus-4-5-thinking",
+        "anthropic/claude-opus-4-6-thinking",
+    }
+)
+
+# Validated configs keyed by path, stamped with (mtime_ns, size) of the file they came from.
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], Config]] = {}
+
+
 def load_config(config_path: Path | None = None) -> Config:
     """
     Load configuration from file or create default.
 
+    Parsed configs are cached per path until the file's mtime or size changes;
+    callers always receive their own copy, so mutating it never leaks.
+
     Args:
         config_path: Optional path to config file. Uses default if not provided.
 
@@ -40,23 +59,36 @@ def load_config(config_path: Path | None = None) -> Config:
         Loaded configuration object.
     """
     path = config_path or get_config_path()
-    if path.exists():
-        try:
-            with open(path) as f:
-                data = json.load(f)
-            data = _migrate_config(data)
-            return Config.model_validate(convert_keys(data))
-        except (json.JSONDecodeError, ValueError) as e:
-            print(f"Warning: Failed to load config from {path}: {e}")
-            print("Using default configuration.")
+    try:
+        stat = path.stat()
+    except OSError:
+        return Config()
 
-    return Config()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1].model_copy(deep=True)
+
+    try:
+        data = json_loads(path.read_bytes())
+        data = _migrate_config(data)
+        config = Config.model_validate(convert_keys(data))
+    except (json.JSONDecodeError, ValueError) as e:
+        print(f"Warning: Failed to load config from {path}: {e}")
+        print("Using default configuration.")
+        return Config()
+
+    _CONFIG_CACHE[path] = (stamp, config)
+    return config.model_copy(deep=True)
 
 
 def save_config(config: Config, config_path: Path | None = None) -> None:
     """
     Save configuration to file.
 
+    The file is replaced atomically, and left untouched (mtime included) when
+    its current contents already match, so no-op saves keep the load cache warm.
+
     Args:
         config: Configuration to save.
         config_path: Optional path to save to. Uses default if not provided.
@@ -67,9 +99,25 @@ def save_config(config: Config, config_path: Path | None = None) -> None:
     # Convert to camelCase format
     data = config.model_dump()
     data = convert_to_camel(data)
-
-    with open(path, "w") as f:
-        json.dump(data, f, indent=2)
+    payload = json_dumps_pretty(data)
+
+    try:
+        if path.read_bytes() == payload:
+            return
+    except OSError:
+        pass
+
+    write_bytes_atomic(path, payload)
+    # Same-size rewrites can land within one mtime tick; never trust the old entry.
+    _CONFIG_CACHE.pop(path, None)
+    if config.agents.defaults.model in _LEGACY_DEFAULT_MODELS:
+        return  # load_config would migrate it, so the saved object is not what it returns
+    try:
+        stat = path.stat()
+    except OSError:
+        return
+    # Prime with what was just written so a save -> load in one process skips re-parsing.
+    _CONFIG_CACHE[path] = ((stat.st_mtime_ns, stat.st_size), config.model_copy(deep=True))
 
 
 def _migrate_config(data: dict) -> dict:
@@ -82,15 +130,7 @@ def _migrate_config(data: dict) -> dict:
 
     # Migrate deprecated default model names.
     defaults = data.get("agents", {}).get("defaults", {})
-    legacy_models = {
-        "anthropic/claude-opus-4-5",
-        "anthropic/claude-opus-4-5-thinking",
-        "claude-opus-4-5",
-        "claude-opus-4-5-thinking",
-        "gemini-claude-opus-4-5-thinking",
-        "anthropic/claude-opus-4-6-thinking",
-    }
-    if defaults.get("model") in legacy_models:
+    if defaults.get("model") in _LEGACY_DEFAULT_MODELS:
         defaults["model"] = "claude-opus-4-6-thinking"
 
     return data
@@ -2,76 +2,91 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterable
-
-from g_agent.config.schema import Config
-
-GUEST_SAFE_TOOLS = {
-    "recall",
-    "web_search",
-    "web_fetch",
-    "browser_open",
-    "browser_snapshot",
-    "browser_extract",
-    "browser_screenshot",
-    "read_file",
-    "list_dir",
-    "gmail_list_threads",
-    "gmail_read_thread",
-    "calendar_list_events",
-    "drive_list_files",
-    "drive_read_text",
-    "docs_get_document",
-    "sheets_get_values",
-    "contacts_list",
-    "contacts_get",
-}
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterable, Mapping
+
+if TYPE_CHECKING:
+    from g_agent.config.schema import Config
+
+GUEST_SAFE_TOOLS = frozenset(
+    {
+        "recall",
+        "web_search",
+        "web_fetch",
+        "browser_open",
+        "browser_snapshot",
+        "browser_extract",
+        "browser_screenshot",
+        "read_file",
+        "list_dir",
+        "gmail_list_threads",
+        "gmail_read_thread",
+        "calendar_list_events",
+        "drive_list_files",
+        "drive_read_text",
+        "docs_get_document",
+        "sheets_get_values",
+        "contacts_list",
+        "contacts_get",
+    }
+)
 
 
-GUEST_LIMITED_EXTRA_TOOLS = {
-    "browser_click",
-    "browser_type",
-    "remember",
-    "log_feedback",
-    "gmail_draft",
-    "message",
-}
+GUEST_LIMITED_EXTRA_TOOLS = frozenset(
+    {
+        "browser_click",
+        "browser_type",
+        "remember",
+        "log_feedback",
+        "gmail_draft",
+        "message",
+    }
+)
+
+
+PERSONAL_ASK_TOOLS = frozenset(
+    {
+        "exec",
+        "write_file",
+        "edit_file",
+        "send_email",
+        "gmail_send",
+        "calendar_create_event",
+        "calendar_update_event",
+        "docs_append_text",
+        "sheets_append_values",
+        "slack_webhook_send",
+        "message",
+    }
+)
 
 
-PERSONAL_ASK_TOOLS = {
-    "exec",
-    "write_file",
-    "edit_file",
-    "send_email",
-    "gmail_send",
-    "calendar_create_event",
-    "calendar_update_event",
-    "docs_append_text",
-    "sheets_append_values",
-    "slack_webhook_send",
-    "message",
-}
+_GUEST_SAFE_SORTED = tuple(sorted(GUEST_SAFE_TOOLS))
+_PERSONAL_ASK_RULES = dict.fromkeys(sorted(PERSONAL_ASK_TOOLS), "ask")
 
 
 @dataclass(frozen=True)
 class PolicyPreset:
-    """Preset definition."""
+    """Preset definition; ``rules`` is frozen read-only at construction."""
 
     name: str
     description: str
-    rules: dict[str, str]
+    rules: Mapping[str, str]
     approval_mode: str | None = None
     restrict_to_workspace: bool | None = None
+    rules_items: tuple[tuple[str, str], ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        rules = MappingProxyType(dict(self.rules))
+        object.__setattr__(self, "rules", rules)
+        object.__setattr__(self, "rules_items", tuple(rules.items()))
 
 
 def _build_guest_rules(extra_allowed: Iterable[str] | None = None) -> dict[str, str]:
-    allowed = set(GUEST_SAFE_TOOLS)
-    if extra_allowed:
-        allowed.update(extra_allowed)
+    allowed = sorted(GUEST_SAFE_TOOLS.union(extra_allowed)) if extra_allowed else _GUEST_SAFE_SORTED
     rules = {"*": "deny"}
-    for tool in sorted(allowed):
-        rules[tool] = "allow"
+    rules.update(dict.fromkeys(allowed, "allow"))
     return rules
 
 
@@ -79,7 +94,7 @@ PRESETS: dict[str, PolicyPreset] = {
     "personal_full": PolicyPreset(
         name="personal_full",
         description="Personal owner mode: full capabilities with explicit approval on risky writes/sends.",
-        rules={tool: "ask" for tool in sorted(PERSONAL_ASK_TOOLS)},
+        rules=_PERSONAL_ASK_RULES,
         approval_mode="confirm",
         restrict_to_workspace=True,
     ),
@@ -99,43 +114,43 @@ PRESETS: dict[str, PolicyPreset] = {
     ),
 }
 
+_SORTED_PRESETS = tuple(PRESETS[name] for name in sorted(PRESETS))
+_PRESET_NAMES_TEXT = ", ".join(preset.name for preset in _SORTED_PRESETS)
+
 
 def list_presets() -> list[PolicyPreset]:
     """Return available policy presets."""
-    return [PRESETS[name] for name in sorted(PRESETS)]
+    return list(_SORTED_PRESETS)
 
 
 def get_preset(name: str) -> PolicyPreset:
     """Resolve preset by name."""
-    key = (name or "").strip().lower()
-    if key not in PRESETS:
-        valid = ", ".join(sorted(PRESETS))
-        raise ValueError(f"Unknown preset '{name}'. Valid: {valid}")
-    return PRESETS[key]
+    preset = PRESETS.get(name.strip().lower()) if name else None
+    if preset is None:
+        raise ValueError(f"Unknown preset '{name}'. Valid: {_PRESET_NAMES_TEXT}")
+    return preset
 
 
-def _scope_rule_key(base_key: str, channel: str | None, sender: str | None) -> str:
-    if not channel:
-        return base_key
-    if base_key == "*":
-        return f"{channel}:{sender or '*'}:*"
-    if sender:
-        return f"{channel}:{sender}:{base_key}"
-    return f"{channel}:*:{base_key}"
+def _scoped_items(
+    items: Iterable[tuple[str, str]],
+    channel: str | None,
+    sender: str | None,
+) -> dict[str, str]:
+    channel_text = (channel or "").strip()
+    if not channel_text:
+        return dict(items)
+    # Both tool keys and the "*" wildcard land under the same channel:sender: prefix.
+    prefix = f"{channel_text}:{(sender or '').strip() or '*'}:"
+    return {prefix + key: value for key, value in items}
 
 
 def scoped_rules(
-    rules: dict[str, str],
+    rules: Mapping[str, str],
     channel: str | None = None,
     sender: str | None = None,
 ) -> dict[str, str]:
     """Apply optional channel/sender scope to policy rules."""
-    channel_text = (channel or "").strip()
-    sender_text = (sender or "").strip()
-    out: dict[str, str] = {}
-    for key, value in rules.items():
-        out[_scope_rule_key(key, channel_text or None, sender_text or None)] = value
-    return out
+    return _scoped_items(rules.items(), channel, sender)
 
 
 def _matching_scope_prefixes(channel: str | None, sender: str | None) -> tuple[str, ...]:
@@ -159,21 +174,21 @@ def apply_preset(
 ) -> dict[str, object]:
     """Apply a policy preset into config.tools.policy."""
     preset = get_preset(preset_name)
-    scoped = scoped_rules(preset.rules, channel=channel, sender=sender)
+    scoped = _scoped_items(preset.rules_items, channel, sender)
 
-    before = dict(config.tools.policy)
+    policy = config.tools.policy
+    # Diff only the keys being written, against the policy as it was before any replace.
+    changed = sum(1 for key, value in scoped.items() if policy.get(key) != value)
     if replace_scope:
         if channel:
             prefixes = _matching_scope_prefixes(channel, sender)
-            config.tools.policy = {
-                key: value
-                for key, value in config.tools.policy.items()
-                if not any(key.startswith(prefix) for prefix in prefixes)
-            }
+            for key in [key for key in policy if key.startswith(prefixes)]:
+                del policy[key]
         else:
             config.tools.policy = {}
+            policy = config.tools.policy
 
-    config.tools.policy.update(scoped)
+    policy.update(scoped)
 
     if set_defaults:
         if preset.approval_mode:
@@ -181,10 +196,9 @@ def apply_preset(
         if preset.restrict_to_workspace is not None:
             config.tools.restrict_to_workspace = bool(preset.restrict_to_workspace)
         current_risky = set(config.tools.risky_tools)
-        current_risky.update(PERSONAL_ASK_TOOLS)
-        config.tools.risky_tools = sorted(current_risky)
+        if not PERSONAL_ASK_TOOLS <= current_risky:
+            config.tools.risky_tools = sorted(current_risky | PERSONAL_ASK_TOOLS)
 
-    changed = sum(1 for key, value in scoped.items() if before.get(key) != value)
     return {
         "preset": preset.name,
         "description": preset.description,
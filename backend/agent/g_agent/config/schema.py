@@ -7,6 +7,32 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from g_agent.utils.helpers import get_data_path
 
+# Substrings in a model name that hint at its provider (checked after explicit prefixes).
+_MODEL_KEYWORD_HINTS: dict[str, str] = {
+    "openrouter": "openrouter",
+    "deepseek": "deepseek",
+    "anthropic": "anthropic",
+    "claude": "anthropic",
+    "openai": "openai",
+    "gpt": "openai",
+    "gemini": "gemini",
+    "zhipu": "zhipu",
+    "glm": "zhipu",
+    "zai": "zhipu",
+    "groq": "groq",
+    "moonshot": "moonshot",
+    "kimi": "moonshot",
+    "minimax": "minimax",
+    "abab": "minimax",
+    "dashscope": "dashscope",
+    "qwen": "dashscope",
+    "tongyi": "dashscope",
+    "aihubmix": "aihubmix",
+    "vllm": "vllm",
+    "hosted_vllm": "vllm",
+    "proxy": "proxy",
+}
+
 
 def _default_workspace() -> str:
     """Default workspace under active data directory."""
@@ -211,6 +237,7 @@ class GoogleWorkspaceConfig(BaseModel):
     client_secret: str = ""
     refresh_token: str = ""
     access_token: str = ""
+    access_token_expires_at_ms: int = 0  # 0 = unknown (tokens saved before expiry tracking)
     calendar_id: str = "primary"
 
 
@@ -415,31 +442,7 @@ class Config(BaseSettings):
         if lowered.startswith(("vllm/", "hosted_vllm/")):
             hints.append("vllm")
 
-        keyword_hints = {
-            "openrouter": "openrouter",
-            "deepseek": "deepseek",
-            "anthropic": "anthropic",
-            "claude": "anthropic",
-            "openai": "openai",
-            "gpt": "openai",
-            "gemini": "gemini",
-            "zhipu": "zhipu",
-            "glm": "zhipu",
-            "zai": "zhipu",
-            "groq": "groq",
-            "moonshot": "moonshot",
-            "kimi": "moonshot",
-            "minimax": "minimax",
-            "abab": "minimax",
-            "dashscope": "dashscope",
-            "qwen": "dashscope",
-            "tongyi": "dashscope",
-            "aihubmix": "aihubmix",
-            "vllm": "vllm",
-            "hosted_vllm": "vllm",
-            "proxy": "proxy",
-        }
-        for keyword, provider_name in keyword_hints.items():
+        for keyword, provider_name in _MODEL_KEYWORD_HINTS.items():
             if keyword in lowered and provider_name not in hints:
                 hints.append(provider_name)
         return tuple(hints)
@@ -641,8 +644,11 @@ class Config(BaseSettings):
         route = self.resolve_model_route(model)
         if route.api_key:
             return route.api_key
-        # Fallback: return first available key
-        for provider in [
+        return self.fallback_api_key()
+
+    def fallback_api_key(self) -> str | None:
+        """First configured provider key, for callers whose resolved route has no key."""
+        for provider in (
             self.providers.openrouter,
             self.providers.deepseek,
             self.providers.anthropic,
@@ -653,7 +659,7 @@ class Config(BaseSettings):
             self.providers.minimax,
             self.providers.vllm,
             self.providers.groq,
-        ]:
+        ):
             if provider.api_key:
                 return provider.api_key
         return None
@@ -1,16 +1,17 @@
 """Cron service for scheduling agent tasks."""
 
 import asyncio
-import json
 import time
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Coroutine
+from typing import Any, Callable, Collection, Coroutine, Iterator
 
 from loguru import logger
 
 from g_agent.cron.types import CronJob, CronJobState, CronPayload, CronSchedule, CronStore
+from g_agent.utils.helpers import json_dumps_pretty, json_loads, write_bytes_atomic
 
 
 def _now_ms() -> int:
@@ -53,17 +54,32 @@ class CronService:
         self.store_path = store_path
         self.on_job = on_job  # Callback to execute job, returns response text
         self._store: CronStore | None = None
+        self._store_stamp: tuple[int, int] | None = None
+        self._batch_depth = 0
+        self._batch_dirty = False
         self._timer_task: asyncio.Task | None = None
         self._running = False
 
+    def _read_stamp(self) -> tuple[int, int] | None:
+        """Return (mtime_ns, size) of the store file, or None when it is missing."""
+        try:
+            stat = self.store_path.stat()
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
     def _load_store(self) -> CronStore:
-        """Load jobs from disk."""
-        if self._store:
+        """Load jobs from disk, re-parsing only when the file changed since the last load/save."""
+        if self._store is not None and self._batch_depth:
+            return self._store  # unsaved batch edits must not be replaced by a reload
+        stamp = self._read_stamp()
+        if self._store is not None and stamp == self._store_stamp:
             return self._store
 
-        if self.store_path.exists():
+        self._store_stamp = stamp
+        if stamp is not None:
             try:
-                data = json.loads(self.store_path.read_text())
+                data = json_loads(self.store_path.read_bytes())
                 jobs = []
                 for j in data.get("jobs", []):
                     jobs.append(
@@ -106,9 +122,12 @@ class CronService:
         return self._store
 
     def _save_store(self) -> None:
-        """Save jobs to disk."""
+        """Save jobs to disk (deferred to the end of an open `batch()`)."""
         if not self._store:
             return
+        if self._batch_depth:
+            self._batch_dirty = True
+            return
 
         self.store_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -147,7 +166,9 @@ class CronService:
             ],
         }
 
-        self.store_path.write_text(json.dumps(data, indent=2))
+        # Write-then-rename so a crash mid-save never leaves a truncated store.
+        write_bytes_atomic(self.store_path, json_dumps_pretty(data))
+        self._store_stamp = self._read_stamp()
 
     async def start(self) -> None:
         """Start the cron service."""
@@ -206,20 +227,22 @@ class CronService:
 
     async def _on_timer(self) -> None:
         """Handle timer tick - run due jobs."""
-        if not self._store:
-            return
-
+        store = self._load_store()
         now = _now_ms()
         due_jobs = [
             j
-            for j in self._store.jobs
+            for j in store.jobs
             if j.enabled and j.state.next_run_at_ms and now >= j.state.next_run_at_ms
         ]
 
         for job in due_jobs:
             await self._execute_job(job)
+            # Persist each outcome before the next job runs: a reload picked up while a
+            # later job runs must not revive finished jobs or lose their next run time.
+            self._save_store()
 
-        self._save_store()
+        if not due_jobs:
+            self._save_store()
         self._arm_timer()
 
     async def _execute_job(self, job: CronJob) -> None:
@@ -240,13 +263,24 @@ class CronService:
             job.state.last_error = str(e)
             logger.error(f"Cron: job '{job.name}' failed: {e}")
 
+        # Another process may have changed jobs.json while the job ran: reload (stamp-gated)
+        # and record the outcome on the live copy so its edits are kept by the next save.
+        store = self._load_store()
+        live = next((j for j in store.jobs if j.id == job.id), None)
+        if live is None:
+            return
+        if live is not job:
+            live.state.last_status = job.state.last_status
+            live.state.last_error = job.state.last_error
+            job = live
+
         job.state.last_run_at_ms = start_ms
         job.updated_at_ms = _now_ms()
 
         # Handle one-shot jobs
         if job.schedule.kind == "at":
             if job.delete_after_run:
-                self._store.jobs = [j for j in self._store.jobs if j.id != job.id]
+                store.jobs = [j for j in store.jobs if j.id != job.id]
             else:
                 job.enabled = False
                 job.state.next_run_at_ms = None
@@ -256,6 +290,18 @@ class CronService:
 
     # ========== Public API ==========
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group several add/remove/enable calls into a single store write."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_dirty:
+                self._batch_dirty = False
+                self._save_store()
+
     def list_jobs(self, include_disabled: bool = False) -> list[CronJob]:
         """List all jobs."""
         store = self._load_store()
@@ -316,6 +362,24 @@ class CronService:
 
         return removed
 
+    def count_jobs_by_name(self, names: Collection[str]) -> int:
+        """Count jobs (enabled or not) whose name is in `names`."""
+        return sum(1 for j in self._load_store().jobs if j.name in names)
+
+    def remove_jobs_by_name(self, names: Collection[str]) -> int:
+        """Remove every job whose name is in `names`, saving the store once."""
+        store = self._load_store()
+        before = len(store.jobs)
+        store.jobs = [j for j in store.jobs if j.name not in names]
+        removed = before - len(store.jobs)
+
+        if removed:
+            self._save_store()
+            self._arm_timer()
+            logger.info(f"Cron: removed {removed} job(s) by name")
+
+        return removed
+
     def enable_job(self, job_id: str, enabled: bool = True) -> CronJob | None:
         """Enable or disable a job."""
         store = self._load_store()
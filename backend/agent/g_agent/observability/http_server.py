@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from urllib.parse import parse_qs, urlsplit
 
 from g_agent.observability.metrics import MetricsStore
+from g_agent.utils.helpers import json_dumps_pretty
 
 
 class MetricsHttpServer:
@@ -66,19 +66,18 @@ class MetricsHttpServer:
         return "prometheus"
 
     def _render_payload(self, *, hours: int, output_format: str) -> tuple[str, str]:
+        # Scrapers poll often; reuse the last snapshot while the events file is unchanged.
+        snapshot = self.store.snapshot_cached(hours=hours)
         if output_format == "prometheus":
             return self.store.prometheus_text(
-                hours=hours
+                hours=hours, snapshot=snapshot
             ), "text/plain; version=0.0.4; charset=utf-8"
         if output_format == "dashboard_json":
-            payload = self.store.dashboard_summary(hours=hours)
-            return json.dumps(
-                payload, ensure_ascii=False, indent=2
-            ) + "\n", "application/json; charset=utf-8"
-        payload = self.store.snapshot(hours=hours)
-        return json.dumps(
-            payload, ensure_ascii=False, indent=2
-        ) + "\n", "application/json; charset=utf-8"
+            payload = self.store.dashboard_summary(hours=hours, snapshot=snapshot)
+        else:
+            payload = snapshot
+        text = json_dumps_pretty(payload, ensure_ascii=False).decode("utf-8") + "\n"
+        return text, "application/json; charset=utf-8"
 
     def _http_response(
         self, status: int, body: str, content_type: str = "text/plain; charset=utf-8"
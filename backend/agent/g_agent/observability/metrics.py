@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import gzip
+import heapq
 import json
+import os
+import time
+from collections import Counter
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
-from g_agent.utils.helpers import ensure_dir
+from g_agent.utils.helpers import ensure_dir, json_dumps_pretty, json_loads
 
 
 def _now_utc() -> datetime:
@@ -25,7 +30,9 @@ def _parse_iso(value: str | None) -> datetime | None:
     try:
         parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
         if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=timezone.utc)
+            return parsed.replace(tzinfo=timezone.utc)
+        if parsed.tzinfo is timezone.utc:
+            return parsed  # What _to_iso writes; skip the no-op conversion.
         return parsed.astimezone(timezone.utc)
     except ValueError:
         return None
@@ -40,9 +47,34 @@ def _pct(numerator: int, denominator: int) -> float:
 def _p95(values: list[float]) -> float:
     if not values:
         return 0.0
-    data = sorted(float(v) for v in values)
-    index = int(0.95 * (len(data) - 1))
-    return round(data[index], 2)
+    # The nearest-rank p95 is the k-th largest sample, so only the top ~5% needs ordering.
+    rank = len(values) - int(0.95 * (len(values) - 1))
+    return round(heapq.nlargest(rank, map(float, values))[-1], 2)
+
+
+def _parse_event_lines(lines: list[bytes]) -> list[tuple[datetime | None, dict[str, Any]]]:
+    parsed: list[tuple[datetime | None, dict[str, Any]]] = []
+    append = parsed.append
+    # Events are written in bursts that share a second-resolution timestamp, so
+    # consecutive lines usually repeat the previous "ts" and can reuse its parse.
+    last_raw_ts: Any = None
+    last_ts: datetime | None = None
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line:
+            continue
+        try:
+            event = json_loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if not isinstance(event, dict):
+            continue
+        raw_ts = event.get("ts", "")
+        if raw_ts != last_raw_ts:
+            last_raw_ts = raw_ts
+            last_ts = _parse_iso(str(raw_ts))
+        append((last_ts, event))
+    return parsed
 
 
 def _escape_label(value: str) -> str:
@@ -50,6 +82,15 @@ def _escape_label(value: str) -> str:
     return text.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
 
 
+TOP_TOOLS_LIMIT = 10
+TAIL_CHUNK_BYTES = 64 * 1024
+
+EXPORT_FORMAT_BY_SUFFIX: dict[str, str] = {
+    ".prom": "prometheus",
+    ".djson": "dashboard_json",
+    ".json": "json",
+}
+
 DEFAULT_ALERT_THRESHOLDS: dict[str, float] = {
     "llm_success_rate_min": 95.0,
     "tool_success_rate_min": 95.0,
@@ -67,6 +108,16 @@ class MetricsStore:
     def __init__(self, events_path: Path):
         self.events_path = events_path
         ensure_dir(events_path.parent)
+        # Incremental scan state: complete lines parsed so far, with their timestamps,
+        # plus the file identity and byte offset they were read up to.
+        self._scan_file: tuple[int, int] | None = None
+        self._scan_offset = 0
+        self._scanned: list[tuple[datetime | None, dict[str, Any]]] = []
+        # Widest window requested so far and the cutoff below which `_scanned` was pruned.
+        self._scan_window: timedelta | None = timedelta(0)
+        self._scan_floor: datetime | None = None
+        # Last snapshot_cached result: ((hours, file stamp), monotonic time built, snapshot).
+        self._cached_snapshot: tuple[tuple[Any, ...], float, dict[str, Any]] | None = None
 
     def _append(self, payload: dict[str, Any]) -> bool:
         record = dict(payload)
@@ -140,7 +191,7 @@ class MetricsStore:
         name: str,
         payload_kind: str,
         success: bool,
-        latency_ms: float,
+        latency_ms: int | float,
         delivered: bool = False,
         proactive: bool = False,
         error: str = "",
@@ -151,7 +202,10 @@ class MetricsStore:
                 "name": (name or "").strip(),
                 "payload_kind": (payload_kind or "").strip(),
                 "success": bool(success),
-                "latency_ms": round(float(latency_ms), 2),
+                # Whole milliseconds stay integers so rows don't grow a ".0".
+                "latency_ms": (
+                    latency_ms if isinstance(latency_ms, int) else round(float(latency_ms), 2)
+                ),
                 "delivered": bool(delivered),
                 "proactive": bool(proactive),
                 "error": (error or "").strip()[:500],
@@ -159,68 +213,178 @@ class MetricsStore:
         )
 
     def _iter_events(self, since: datetime | None = None) -> list[dict[str, Any]]:
-        items: list[dict[str, Any]] = []
+        """Return parsed events, reading only bytes appended since the previous call.
+
+        The scan restarts from the top when the file is replaced (as `prune_events`
+        does) or shrinks; a trailing line without its newline is parsed but not
+        cached, so a half-written record is picked up whole on the next call.
+        Cached events older than the widest window requested so far are dropped,
+        so memory follows the query window rather than the file's whole history.
+        """
+        now = _now_utc()
+        if since is None:
+            self._scan_window = None
+        elif self._scan_window is not None:
+            self._scan_window = max(self._scan_window, now - since)
+        # Events below the floor were pruned; a wider window has to rescan them.
+        rescan = self._scan_floor is not None and (since is None or since < self._scan_floor)
         try:
-            if not self.events_path.exists():
-                return []
-            for raw_line in self.events_path.read_text(encoding="utf-8").splitlines():
-                line = raw_line.strip()
-                if not line:
-                    continue
-                try:
-                    event = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                if not isinstance(event, dict):
-                    continue
-                if since is not None:
-                    ts = _parse_iso(str(event.get("ts", "")))
-                    if ts is None or ts < since:
-                        continue
-                items.append(event)
+            with self.events_path.open("rb") as handle:
+                stat = os.fstat(handle.fileno())
+                file_id = (stat.st_dev, stat.st_ino)
+                if rescan or file_id != self._scan_file or stat.st_size < self._scan_offset:
+                    self._scan_file = file_id
+                    self._scan_offset = 0
+                    self._scanned = []
+                    self._scan_floor = None
+                handle.seek(self._scan_offset)
+                data = handle.read()
         except OSError:
             return []
-        return items
+
+        complete, newline, partial = data.rpartition(b"\n")
+        if newline:
+            self._scan_offset += len(complete) + 1
+            self._scanned.extend(_parse_event_lines(complete.split(b"\n")))
+            if self._scan_window is not None:
+                floor = now - self._scan_window
+                first_ts = self._scanned[0][0] if self._scanned else floor
+                if first_ts is None or first_ts < floor:
+                    self._scanned = [
+                        item for item in self._scanned if item[0] is not None and item[0] >= floor
+                    ]
+                self._scan_floor = floor
+        scanned = self._scanned + _parse_event_lines([partial]) if partial else self._scanned
+
+        if since is None:
+            return [event for _, event in scanned]
+        return [event for ts, event in scanned if ts is not None and ts >= since]
+
+    def _iter_events_tail(
+        self,
+        since: datetime,
+        chunk_size: int = TAIL_CHUNK_BYTES,
+    ) -> list[dict[str, Any]]:
+        """Read events newer than `since` by scanning the file backwards from its end.
+
+        Events are appended in time order, so the scan stops at the first event
+        older than `since` and bytes read scale with the window, not the history.
+        """
+        newest_first: list[dict[str, Any]] = []
+
+        def take(raw_line: bytes) -> bool:
+            line = raw_line.strip()
+            if not line:
+                return True
+            try:
+                event = json_loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                return True
+            if not isinstance(event, dict):
+                return True
+            ts = _parse_iso(str(event.get("ts", "")))
+            if ts is None:
+                return True
+            if ts < since:
+                return False
+            newest_first.append(event)
+            return True
+
+        try:
+            with self.events_path.open("rb") as handle:
+                position = handle.seek(0, os.SEEK_END)
+                carry = b""
+                while position > 0:
+                    read_size = min(chunk_size, position)
+                    position -= read_size
+                    handle.seek(position)
+                    lines = (handle.read(read_size) + carry).split(b"\n")
+                    # The first piece may be the tail of a line that starts in an earlier block.
+                    carry = lines.pop(0)
+                    for raw_line in reversed(lines):
+                        if not take(raw_line):
+                            return newest_first[::-1]
+                take(carry)
+        except OSError:
+            return []
+        return newest_first[::-1]
 
     def snapshot(self, hours: int = 24) -> dict[str, Any]:
         """Build aggregated metrics snapshot for the given window."""
         window_hours = max(1, int(hours))
         since = _now_utc() - timedelta(hours=window_hours)
-        events = self._iter_events(since=since)
-
-        llm_events = [e for e in events if e.get("type") == "llm_call"]
-        tool_events = [e for e in events if e.get("type") == "tool_call"]
-        recall_events = [e for e in events if e.get("type") == "memory_recall"]
-        cron_events = [e for e in events if e.get("type") == "cron_run"]
-
-        llm_success = sum(1 for e in llm_events if bool(e.get("success")))
-        tool_success = sum(1 for e in tool_events if bool(e.get("success")))
-        cron_success = sum(1 for e in cron_events if bool(e.get("success")))
-        recall_hit = sum(1 for e in recall_events if bool(e.get("hit")))
-
-        tool_stats: dict[str, dict[str, int]] = {}
-        for item in tool_events:
-            name = str(item.get("tool", "")).strip() or "unknown"
-            bucket = tool_stats.setdefault(name, {"calls": 0, "errors": 0})
-            bucket["calls"] += 1
-            if not bool(item.get("success")):
-                bucket["errors"] += 1
+        return self._summarize(self._iter_events(since=since), window_hours)
 
-        top_tools = [
-            {"tool": tool, "calls": data["calls"], "errors": data["errors"]}
-            for tool, data in sorted(
-                tool_stats.items(),
-                key=lambda pair: (pair[1]["calls"], -pair[1]["errors"], pair[0]),
-                reverse=True,
-            )[:10]
-        ]
+    def snapshot_cached(self, hours: int = 24, max_age_s: float = 5.0) -> dict[str, Any]:
+        """Like `snapshot`, but reuse the previous result while the events file is unchanged.
 
-        llm_latencies = [float(e.get("latency_ms", 0.0) or 0.0) for e in llm_events]
-        tool_latencies = [float(e.get("latency_ms", 0.0) or 0.0) for e in tool_events]
-        cron_latencies = [float(e.get("latency_ms", 0.0) or 0.0) for e in cron_events]
+        A reused snapshot is at most `max_age_s` old, which bounds how far the window
+        start can drift. Treat the returned dict as read-only; it may be shared.
+        """
+        window_hours = max(1, int(hours))
+        try:
+            stat = self.events_path.stat()
+            stamp = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        except OSError:
+            stamp = (0, 0, 0)
+        key = (window_hours, stamp)
+        now = time.monotonic()
+        cached = self._cached_snapshot
+        if cached is not None and cached[0] == key and now - cached[1] < max_age_s:
+            return cached[2]
+        snapshot = self.snapshot(hours=window_hours)
+        self._cached_snapshot = (key, now, snapshot)
+        return snapshot
+
+    def snapshot_tail(self, hours: int = 24) -> dict[str, Any]:
+        """Like `snapshot`, but only reads the tail of the events file covering the window."""
+        window_hours = max(1, int(hours))
+        since = _now_utc() - timedelta(hours=window_hours)
+        return self._summarize(self._iter_events_tail(since), window_hours)
+
+    def _summarize(self, events: list[dict[str, Any]], window_hours: int) -> dict[str, Any]:
+        llm_latencies: list[float] = []
+        tool_latencies: list[float] = []
+        cron_latencies: list[float] = []
+        llm_success = tool_success = cron_success = proactive_cron = 0
+        recall_queries = recall_hit = total_hits = 0
+        tool_calls: Counter[str] = Counter()
+        tool_errors: Counter[str] = Counter()
+
+        # One pass over the window; each event only touches its own section's tallies.
+        for event in events:
+            kind = event.get("type")
+            if kind == "tool_call":
+                name = str(event.get("tool", "")).strip() or "unknown"
+                tool_calls[name] += 1
+                if bool(event.get("success")):
+                    tool_success += 1
+                else:
+                    tool_errors[name] += 1
+                tool_latencies.append(float(event.get("latency_ms", 0.0) or 0.0))
+            elif kind == "llm_call":
+                llm_success += bool(event.get("success"))
+                llm_latencies.append(float(event.get("latency_ms", 0.0) or 0.0))
+            elif kind == "memory_recall":
+                recall_queries += 1
+                recall_hit += bool(event.get("hit"))
+                total_hits += int(event.get("hits", 0) or 0)
+            elif kind == "cron_run":
+                cron_success += bool(event.get("success"))
+                proactive_cron += bool(event.get("proactive"))
+                cron_latencies.append(float(event.get("latency_ms", 0.0) or 0.0))
 
-        total_hits = sum(int(e.get("hits", 0) or 0) for e in recall_events)
-        proactive_cron = sum(1 for e in cron_events if bool(e.get("proactive")))
+        top_tools = [
+            {"tool": tool, "calls": tool_calls[tool], "errors": tool_errors[tool]}
+            for tool in heapq.nlargest(
+                TOP_TOOLS_LIMIT,
+                tool_calls,
+                key=lambda name: (tool_calls[name], -tool_errors[name], name),
+            )
+        ]
+        llm_calls = len(llm_latencies)
+        tool_calls_total = len(tool_latencies)
+        cron_runs = len(cron_latencies)
 
         return {
             "window_hours": window_hours,
@@ -228,39 +392,45 @@ class MetricsStore:
             "events_file": str(self.events_path),
             "totals": {"events": len(events)},
             "llm": {
-                "calls": len(llm_events),
+                "calls": llm_calls,
                 "success": llm_success,
-                "errors": len(llm_events) - llm_success,
-                "success_rate": _pct(llm_success, len(llm_events)),
+                "errors": llm_calls - llm_success,
+                "success_rate": _pct(llm_success, llm_calls),
                 "latency_ms_p95": _p95(llm_latencies),
             },
             "tools": {
-                "calls": len(tool_events),
+                "calls": tool_calls_total,
                 "success": tool_success,
-                "errors": len(tool_events) - tool_success,
-                "success_rate": _pct(tool_success, len(tool_events)),
+                "errors": tool_calls_total - tool_success,
+                "success_rate": _pct(tool_success, tool_calls_total),
                 "latency_ms_p95": _p95(tool_latencies),
                 "top_tools": top_tools,
             },
             "recall": {
-                "queries": len(recall_events),
+                "queries": recall_queries,
                 "hit_queries": recall_hit,
-                "hit_rate": _pct(recall_hit, len(recall_events)),
-                "avg_hits": round(total_hits / len(recall_events), 2) if recall_events else 0.0,
+                "hit_rate": _pct(recall_hit, recall_queries),
+                "avg_hits": round(total_hits / recall_queries, 2) if recall_queries else 0.0,
             },
             "cron": {
-                "runs": len(cron_events),
+                "runs": cron_runs,
                 "success": cron_success,
-                "errors": len(cron_events) - cron_success,
-                "success_rate": _pct(cron_success, len(cron_events)),
+                "errors": cron_runs - cron_success,
+                "success_rate": _pct(cron_success, cron_runs),
                 "latency_ms_p95": _p95(cron_latencies),
                 "proactive_runs": proactive_cron,
             },
         }
 
-    def dashboard_summary(self, hours: int = 24, top_n_tools: int = 5) -> dict[str, Any]:
+    def dashboard_summary(
+        self,
+        hours: int = 24,
+        top_n_tools: int = 5,
+        *,
+        snapshot: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         """Flatten snapshot into dashboard/scraper-friendly fields."""
-        snapshot = self.snapshot(hours=hours)
+        snapshot = snapshot or self.snapshot(hours=hours)
         llm = snapshot["llm"]
         tools = snapshot["tools"]
         recall = snapshot["recall"]
@@ -311,9 +481,9 @@ class MetricsStore:
         summary["alerts_brief"] = alert_compact["brief"]
         return summary
 
-    def prometheus_text(self, hours: int = 24) -> str:
+    def prometheus_text(self, hours: int = 24, *, snapshot: dict[str, Any] | None = None) -> str:
         """Render snapshot as Prometheus text exposition format."""
-        snapshot = self.snapshot(hours=hours)
+        snapshot = snapshot or self.snapshot(hours=hours)
         llm = snapshot["llm"]
         tools = snapshot["tools"]
         recall = snapshot["recall"]
@@ -568,7 +738,7 @@ class MetricsStore:
                     continue
                 result["raw_lines"] += 1
                 try:
-                    event = json.loads(line)
+                    event = json_loads(line)
                 except json.JSONDecodeError:
                     result["parse_errors"] += 1
                     continue
@@ -614,53 +784,59 @@ class MetricsStore:
             return result
         return result
 
+    def _snapshot_json_text(
+        self, hours: int = 24, *, snapshot: dict[str, Any] | None = None
+    ) -> str:
+        payload = snapshot or self.snapshot(hours=hours)
+        return json_dumps_pretty(payload, ensure_ascii=False).decode("utf-8") + "\n"
+
+    def _dashboard_json_text(
+        self, hours: int = 24, *, snapshot: dict[str, Any] | None = None
+    ) -> str:
+        summary = self.dashboard_summary(hours=hours, snapshot=snapshot)
+        return json_dumps_pretty(summary, ensure_ascii=False).decode("utf-8") + "\n"
+
     def export_snapshot(
         self,
         output_path: Path,
         *,
         hours: int = 24,
         output_format: str = "auto",
+        snapshot: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Export metrics snapshot to a file for shipping/scraping."""
+        """Export metrics snapshot to a file for shipping/scraping.
+
+        A trailing `.gz` gzip-compresses the output; the format is then detected
+        from the name without it (e.g. `metrics.prom.gz` is Prometheus text).
+        Pass `snapshot` to export one the caller already built for `hours`.
+        """
         path = Path(output_path).expanduser()
         ensure_dir(path.parent)
+        compress = path.suffix.lower() == ".gz"
+        format_path = path.with_suffix("") if compress else path
 
         fmt = (output_format or "auto").strip().lower()
         if fmt == "auto":
-            suffix = path.suffix.lower()
-            filename = path.name.lower()
-            if suffix == ".prom":
-                fmt = "prometheus"
-            elif filename.endswith(".dashboard.json") or suffix == ".djson":
+            if format_path.name.lower().endswith(".dashboard.json"):
                 fmt = "dashboard_json"
             else:
-                fmt = "json"
-
-        if fmt == "prometheus":
-            content = self.prometheus_text(hours=hours)
-        elif fmt == "dashboard_json":
-            content = (
-                json.dumps(
-                    self.dashboard_summary(hours=hours),
-                    indent=2,
-                    ensure_ascii=False,
-                )
-                + "\n"
-            )
-        elif fmt == "json":
-            content = (
-                json.dumps(
-                    self.snapshot(hours=hours),
-                    indent=2,
-                    ensure_ascii=False,
-                )
-                + "\n"
-            )
-        else:
+                fmt = EXPORT_FORMAT_BY_SUFFIX.get(format_path.suffix.lower(), "json")
+
+        renderers = {
+            "prometheus": self.prometheus_text,
+            "dashboard_json": self._dashboard_json_text,
+            "json": self._snapshot_json_text,
+        }
+        renderer = renderers.get(fmt)
+        if renderer is None:
             return {"ok": False, "error": f"Unknown output format: {output_format}"}
+        data = renderer(hours=hours, snapshot=snapshot).encode("utf-8")
+        if compress:
+            # Level 1: snapshots are small and repetitive, so extra effort buys little.
+            data = gzip.compress(data, compresslevel=1)
 
         try:
-            path.write_text(content, encoding="utf-8")
+            path.write_bytes(data)
         except OSError as e:
             return {"ok": False, "error": str(e)}
 
@@ -668,5 +844,6 @@ class MetricsStore:
             "ok": True,
             "path": str(path),
             "format": fmt,
-            "bytes": len(content.encode("utf-8")),
+            "bytes": len(data),
+            "compressed": compress,
         }
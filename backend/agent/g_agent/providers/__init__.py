@@ -1,8 +1,11 @@
 """LLM provider abstraction module."""
 
 from g_agent.providers.base import LLMProvider, LLMResponse
-from g_agent.providers.factory import build_provider, collect_provider_factories, has_provider_factory
-from g_agent.providers.litellm_provider import LiteLLMProvider
+from g_agent.providers.factory import (
+    build_provider,
+    collect_provider_factories,
+    has_provider_factory,
+)
 
 __all__ = [
     "LLMProvider",
@@ -12,3 +15,12 @@ __all__ = [
     "has_provider_factory",
     "build_provider",
 ]
+
+
+def __getattr__(name: str):
+    # Resolved on first access so importing the package does not import litellm.
+    if name == "LiteLLMProvider":
+        from g_agent.providers.litellm_provider import LiteLLMProvider
+
+        return LiteLLMProvider
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,7 +9,6 @@ from g_agent.config.schema import Config, LLMRoute
 from g_agent.plugins.base import PluginContext
 from g_agent.plugins.loader import register_provider_plugins
 from g_agent.providers.base import LLMProvider
-from g_agent.providers.litellm_provider import LiteLLMProvider
 
 ProviderFactory = Callable[[LLMRoute, Config], LLMProvider]
 
@@ -51,6 +50,9 @@ def build_provider(
         if builder is not None:
             return builder(route, config)
 
+    # litellm takes over a second to import; only pay for it when it is the provider.
+    from g_agent.providers.litellm_provider import LiteLLMProvider
+
     provider_cfg = config.get_provider(route.model)
     return LiteLLMProvider(
         api_key=route.api_key,
@@ -1,8 +1,20 @@
 """Utility functions for Galyarder Agent."""
 
+import contextlib
+import json
 import os
+import stat
+import tempfile
 from datetime import datetime
 from pathlib import Path
+from typing import Any
+
+try:
+    import orjson as _orjson
+    from orjson import loads as _fast_json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    _orjson = None
+    _fast_json_loads = None
 
 PRIMARY_DATA_DIR = ".g-agent"
 DATA_DIR_ENV_VAR = "G_AGENT_DATA_DIR"
@@ -14,6 +26,57 @@ def ensure_dir(path: Path) -> Path:
     return path
 
 
+def json_loads(data: str | bytes) -> Any:
+    """Decode JSON, using orjson when installed and stdlib json otherwise.
+
+    Both paths raise a `json.JSONDecodeError` subclass on malformed input.
+    """
+    if _fast_json_loads is not None:
+        return _fast_json_loads(data)
+    return json.loads(data)
+
+
+def json_dumps_pretty(data: Any, *, ensure_ascii: bool = True) -> bytes:
+    """Encode JSON as 2-space indented UTF-8, using orjson when installed.
+
+    ``ensure_ascii`` matches stdlib json: output that orjson would write with raw
+    non-ASCII text goes through stdlib json instead. The two encoders are not
+    byte-identical in general (float formatting, NaN/Infinity), so only compare
+    output against bytes produced by this same function.
+    """
+    if _orjson is not None:
+        # Non-string keys are stringified the same way stdlib json does it.
+        out = _orjson.dumps(data, option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS)
+        if not ensure_ascii or out.isascii():
+            return out
+    return json.dumps(data, indent=2, ensure_ascii=ensure_ascii).encode("utf-8")
+
+
+def write_bytes_atomic(path: Path, data: bytes, mode: int | None = None) -> None:
+    """Replace ``path`` with ``data`` through a unique temp file in the same directory.
+
+    The temp file is created 0600 and, unless ``mode`` is given, takes over the
+    permission bits of the file it replaces, so a locked-down file stays locked
+    down. It is removed if the write fails.
+    """
+    if mode is None:
+        try:
+            mode = stat.S_IMODE(path.stat().st_mode)
+        except OSError:
+            pass
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            if mode is not None:
+                os.fchmod(f.fileno(), mode)
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
 def get_data_path() -> Path:
     """Get the g-agent data directory (default: ~/.g-agent)."""
     override = os.getenv(DATA_DIR_ENV_VAR, "").strip()
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import asyncio
+import os
 import subprocess
+import sys
 from pathlib import Path
 
+import pytest
+
 from g_agent.cli.commands import (
     _bridge_build_id_path,
     _bridge_needs_rebuild,
     _bridge_source_signature,
     _get_bridge_dir,
+    _run_streamed,
+    _stream_subprocess,
+    _sync_tree,
 )
 
 
@@ -65,20 +73,13 @@ def test_get_bridge_dir_rebuilds_when_source_signature_changes(tmp_path: Path, m
 
     calls: list[tuple[str, ...]] = []
 
-    def fake_run(
-        cmd: list[str],
-        cwd: Path | None = None,
-        check: bool = False,
-        capture_output: bool = False,
-        text: bool = False,
-    ) -> subprocess.CompletedProcess:
-        del check, capture_output, text
+    def fake_run_streamed(cmd: list[str], *, cwd: Path, label: str) -> None:
+        del label
         calls.append(tuple(cmd))
-        if cmd == ["npm", "run", "build"] and cwd is not None:
+        if cmd == ["npm", "run", "build"]:
             _write(Path(cwd) / "dist" / "index.js", "console.log('built');")
-        return subprocess.CompletedProcess(cmd, 0)
 
-    monkeypatch.setattr("subprocess.run", fake_run)
+    monkeypatch.setattr("g_agent.cli.commands._run_streamed", fake_run_streamed)
 
     first = _get_bridge_dir()
     assert first == data_dir / "bridge"
@@ -93,3 +94,54 @@ def test_get_bridge_dir_rebuilds_when_source_signature_changes(tmp_path: Path, m
     third = _get_bridge_dir()
     assert third == first
     assert calls == [("npm", "install"), ("npm", "run", "build")]
+
+
+def test_sync_tree_copies_only_changed_files_and_prunes_stale(tmp_path: Path):
+    source = tmp_path / "bridge-src"
+    target = tmp_path / "bridge"
+    _create_bridge_source(source)
+    _write(source / "node_modules" / "dep" / "index.js", "module.exports = 1;")
+
+    assert _sync_tree(source, target, skip=frozenset({"node_modules", "dist"})) == 5
+    assert not (target / "node_modules").exists()
+
+    _write(target / "node_modules" / "dep" / "index.js", "installed")
+    _write(target / "src" / "removed.ts", "stale")
+    _write(source / "src" / "server.ts", "export const server = 'changed!';")
+
+    assert _sync_tree(source, target, skip=frozenset({"node_modules", "dist"})) == 1
+    synced = (target / "src" / "server.ts").read_text(encoding="utf-8")
+    assert synced == "export const server = 'changed!';"
+    assert not (target / "src" / "removed.ts").exists()
+    assert (target / "node_modules" / "dep" / "index.js").read_text(encoding="utf-8") == "installed"
+
+
+def test_run_streamed_keeps_output_tail_on_failure(tmp_path: Path):
+    script = "import sys\nfor i in range(100): print(f'line {i}')\nsys.exit(3)"
+
+    with pytest.raises(subprocess.CalledProcessError) as exc_info:
+        _run_streamed([sys.executable, "-c", script], cwd=tmp_path, label="fail", tail_lines=5)
+
+    assert exc_info.value.returncode == 3
+    assert exc_info.value.output.splitlines() == [f"line {i}" for i in range(95, 100)]
+
+
+def test_stream_subprocess_terminates_child_when_cancelled(tmp_path: Path):
+    pid_file = tmp_path / "child.pid"
+    script = (
+        f"import os, time\nopen({str(pid_file)!r}, 'w').write(str(os.getpid()))\ntime.sleep(30)"
+    )
+
+    async def _cancel_after_start() -> None:
+        task = asyncio.create_task(
+            _stream_subprocess([sys.executable, "-c", script], cwd=tmp_path, label="slow")
+        )
+        while not pid_file.exists() or not pid_file.read_text():
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(asyncio.wait_for(_cancel_after_start(), timeout=10))
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(pid_file.read_text()), 0)
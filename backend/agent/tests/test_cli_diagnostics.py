@@ -0,0 +1,378 @@
+import io
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from g_agent.agent.memory import MemoryStore
+from g_agent.cli.commands import (
+    _bridge_endpoint,
+    _check_results_table,
+    _detect_memory_issues,
+    _dir_entry_names,
+    _emit_json,
+    _emit_tsv,
+    _httpx_proxy_kwarg,
+    _is_proactive_job_name,
+    _print_check_summary,
+    app,
+)
+from g_agent.config.loader import load_config, save_config
+from g_agent.config.schema import Config
+
+runner = CliRunner()
+
+
+def _prepare_workspace(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.setenv("G_AGENT_DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setenv("COLUMNS", "400")
+    config = Config()
+    config.agents.defaults.workspace = str(tmp_path / "workspace")
+    save_config(config)
+    return tmp_path / "workspace"
+
+
+def test_dir_entry_names_lists_directory_and_tolerates_missing(tmp_path: Path):
+    (tmp_path / "MEMORY.md").write_text("# Memory\n", encoding="utf-8")
+    (tmp_path / "FACTS.md").write_text("# Facts\n", encoding="utf-8")
+
+    assert _dir_entry_names(tmp_path) == {"MEMORY.md", "FACTS.md"}
+    assert _dir_entry_names(tmp_path / "missing") == set()
+
+
+def test_detect_memory_issues_matches_sequential_detectors(tmp_path: Path):
+    fixture = Path(__file__).resolve().parent / "fixtures" / "memory_conflicts.md"
+    store = MemoryStore(tmp_path)
+    store.write_long_term(fixture.read_text(encoding="utf-8"))
+    store.profile_file.write_text("# Profile\n\n- timezone: UTC\n", encoding="utf-8")
+    store.summaries_file.write_text("# Summaries\n\n- editor: vim\n", encoding="utf-8")
+
+    drifts, conflicts = _detect_memory_issues(store, limit=50)
+
+    assert conflicts
+    assert drifts == store.detect_summary_fact_drift(limit=50)
+    assert conflicts == store.detect_cross_scope_fact_conflicts(limit=50)
+    assert len(store._load_fact_index()) == 7
+
+
+def test_check_results_table_marks_levels_and_blank_fixes():
+    table = _check_results_table(
+        "Doctor",
+        [
+            ("Config", "pass", "ok", ""),
+            ("Workspace", "warn", "missing", "Run: g-agent onboard"),
+            ("Probe", "unknown", "odd", ""),
+        ],
+    )
+
+    assert table.row_count == 3
+    assert list(table.columns[1].cells) == [
+        "[green]PASS[/green]",
+        "[yellow]WARN[/yellow]",
+        "[red]FAIL[/red]",
+    ]
+    assert list(table.columns[3].cells) == ["-", "Run: g-agent onboard", "-"]
+
+
+def test_print_check_summary_tallies_levels(capsys):
+    fail_count = _print_check_summary(
+        [
+            ("a", "pass", "", ""),
+            ("b", "warn", "", ""),
+            ("c", "fail", "", ""),
+            ("d", "fail", "", ""),
+            ("e", "pass", "", ""),
+        ]
+    )
+
+    assert fail_count == 2
+    assert "2 pass, 1 warn, 2 fail" in capsys.readouterr().out
+
+
+def test_print_check_summary_renders_table_with_title(capsys):
+    fail_count = _print_check_summary(
+        [("config", "pass", "ok", ""), ("bridge", "fail", "down", "Start it")],
+        title="Unit Doctor",
+    )
+
+    out = capsys.readouterr().out
+    assert fail_count == 1
+    assert out.index("Unit Doctor") < out.index("bridge") < out.index("1 pass, 0 warn, 1 fail")
+
+
+def test_is_proactive_job_name_covers_builtins_and_prefix():
+    assert _is_proactive_job_name("daily-digest")
+    assert _is_proactive_job_name("calendar-watch")
+    assert _is_proactive_job_name("pd-standup")
+    assert not _is_proactive_job_name("daily-digest-copy")
+    assert not _is_proactive_job_name("user-reminder")
+
+
+def test_bridge_endpoint_defaults_port_by_scheme():
+    assert _bridge_endpoint("ws://localhost:3001") == ("localhost", 3001)
+    assert _bridge_endpoint("ws://bridge.local") == ("bridge.local", 80)
+    assert _bridge_endpoint("wss://bridge.example.com/path") == ("bridge.example.com", 443)
+    for bad in ("http://localhost:3001", "ws://", "localhost:3001", "ws://host:notaport"):
+        with pytest.raises(ValueError):
+            _bridge_endpoint(bad)
+
+
+def test_httpx_proxy_kwarg_follows_installed_signature(monkeypatch):
+    import httpx
+
+    class LegacyAsyncClient:
+        def __init__(self, *, timeout: float = 5.0, proxies: Any = None) -> None: ...
+
+    _httpx_proxy_kwarg.cache_clear()
+    assert _httpx_proxy_kwarg() in {"proxy", "proxies"}
+    monkeypatch.setattr(httpx, "AsyncClient", LegacyAsyncClient)
+    _httpx_proxy_kwarg.cache_clear()
+    try:
+        assert _httpx_proxy_kwarg() == "proxies"
+    finally:
+        _httpx_proxy_kwarg.cache_clear()
+
+
+def test_status_reports_memory_files_from_directory_listing(tmp_path: Path, monkeypatch):
+    workspace = _prepare_workspace(tmp_path, monkeypatch)
+    memory_dir = workspace / "memory"
+    memory_dir.mkdir(parents=True)
+    (memory_dir / "MEMORY.md").write_text("# Long-term Memory\n", encoding="utf-8")
+
+    result = runner.invoke(app, ["status"])
+
+    assert result.exit_code == 0
+    assert "Long-term memory: ✓" in result.stdout
+    assert "Lessons memory: not created yet" in result.stdout
+    assert "Metrics (24h): no data" in result.stdout
+    assert not (workspace / "state" / "metrics").exists()
+
+
+def test_feedback_appends_lesson_to_memory(tmp_path: Path, monkeypatch):
+    workspace = _prepare_workspace(tmp_path, monkeypatch)
+
+    result = runner.invoke(app, ["feedback", "Double-check timezone before scheduling"])
+
+    assert result.exit_code == 0
+    assert "Feedback saved" in result.stdout
+    assert "Double-check timezone" in (workspace / "memory" / "LESSONS.md").read_text()
+
+
+def test_status_and_metrics_print_markup_like_values_literally(tmp_path: Path, monkeypatch):
+    from g_agent.observability.metrics import MetricsStore
+
+    monkeypatch.setenv("G_AGENT_DATA_DIR", str(tmp_path / "data"))
+    monkeypatch.setenv("COLUMNS", "400")
+    workspace = tmp_path / "ws[bold]" / "red]x"
+    config = Config()
+    config.agents.defaults.workspace = str(workspace)
+    config.agents.defaults.model = "vllm/[/oops]model"
+    save_config(config)
+    metrics = MetricsStore(workspace / "state" / "metrics" / "events.jsonl")
+    metrics.record_tool_call(tool="[/tool]", success=True, latency_ms=5)
+
+    status = runner.invoke(app, ["status"])
+    report = runner.invoke(app, ["metrics"])
+
+    assert status.exit_code == 0
+    assert f"Workspace: {workspace}" in status.stdout
+    assert "[/oops]model" in status.stdout
+    assert report.exit_code == 0
+    assert "  - [/tool]: 1 call(s)" in report.stdout
+
+
+def test_metrics_json_output_is_plain_parseable_json(tmp_path: Path, monkeypatch):
+    _prepare_workspace(tmp_path, monkeypatch)
+
+    result = runner.invoke(app, ["metrics", "--json"])
+
+    assert result.exit_code == 0
+    payload = json.loads(result.stdout)
+    assert payload["totals"]["events"] == 0
+    assert "alerts" in payload
+
+
+def test_metrics_export_reuses_the_printed_snapshot(tmp_path: Path, monkeypatch):
+    from g_agent.observability.metrics import MetricsStore
+
+    _prepare_workspace(tmp_path, monkeypatch)
+    builds: list[int] = []
+    original = MetricsStore.snapshot
+
+    def counting_snapshot(self, hours: int = 24) -> dict[str, Any]:
+        builds.append(hours)
+        return original(self, hours=hours)
+
+    monkeypatch.setattr(MetricsStore, "snapshot", counting_snapshot)
+    export_path = tmp_path / "out" / "metrics.prom"
+
+    result = runner.invoke(app, ["metrics", "--dashboard-json", "--export", str(export_path)])
+
+    assert result.exit_code == 0
+    assert builds == [24]
+    assert "g_agent_events_total 0" in export_path.read_text(encoding="utf-8")
+    assert '"events_total": 0' in result.stdout
+    assert "Metrics exported" in result.stdout
+
+
+def test_emit_json_writes_utf8_bytes_or_falls_back_to_text(monkeypatch):
+    payload = {"tool": "búsqueda", "calls": 2}
+    expected = json.dumps(payload, indent=2, ensure_ascii=False) + "\n"
+
+    raw = io.BytesIO()
+    stdout = io.TextIOWrapper(raw, encoding="utf-8")
+    stdout.write("before\n")
+    monkeypatch.setattr(sys, "stdout", stdout)
+    _emit_json(payload)
+    assert raw.getvalue().decode("utf-8") == "before\n" + expected
+
+    latin = io.BytesIO()
+    monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(latin, encoding="latin-1"))
+    _emit_json(payload)
+    assert latin.getvalue().decode("latin-1") == expected
+
+
+def test_security_audit_piped_output_is_tab_separated(tmp_path: Path, monkeypatch):
+    _prepare_workspace(tmp_path, monkeypatch)
+
+    result = runner.invoke(app, ["security-audit"])
+
+    assert result.exit_code == 0
+    rows = [line.split("\t") for line in result.stdout.splitlines() if "\t" in line]
+    assert rows
+    assert all(len(row) == 4 for row in rows)
+    assert {row[1] for row in rows} <= {"PASS", "WARN", "FAIL"}
+    assert "Summary: pass=" in result.stdout
+
+
+def test_emit_tsv_escapes_separators_inside_fields(capsys):
+    _emit_tsv([("a\tb", "line1\nline2\r", "C:\\tmp"), ("x", "y", "z")])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines == ["a\\tb\tline1\\nline2\\r\tC:\\\\tmp", "x\ty\tz"]
+
+
+def test_security_fix_piped_output_uses_uppercase_status(tmp_path: Path, monkeypatch):
+    _prepare_workspace(tmp_path, monkeypatch)
+
+    result = runner.invoke(app, ["security-fix"])
+
+    assert result.exit_code == 0
+    rows = [line.split("\t") for line in result.stdout.splitlines() if "\t" in line]
+    assert rows
+    assert all(len(row) == 3 for row in rows)
+    assert all(row[1] == row[1].upper() for row in rows)
+
+
+def test_doctor_offline_reports_probe_rows_in_order(tmp_path: Path, monkeypatch):
+    _prepare_workspace(tmp_path, monkeypatch)
+
+    result = runner.invoke(app, ["doctor", "--no-network"])
+
+    assert result.exit_code == 0
+    output = result.stdout
+    positions = [
+        output.index(label)
+        for label in ("vLLM /models", "Telegram channel", "WhatsApp channel", "Brave Search API")
+    ]
+    assert positions == sorted(positions)
+    assert "Summary:" in output
+
+
+def test_doctor_memory_checks_use_directory_listing(tmp_path: Path, monkeypatch):
+    workspace = _prepare_workspace(tmp_path, monkeypatch)
+    (workspace / "memory").mkdir(parents=True)
+    (workspace / "memory" / "PROFILE.md").write_text("# Profile\n", encoding="utf-8")
+    (workspace / "calendar").mkdir()
+
+    result = runner.invoke(app, ["doctor", "--no-network"])
+
+    assert result.exit_code == 0
+    lines = {line.split("│")[1].strip(): line for line in result.stdout.splitlines() if "│" in line}
+    assert "PASS" in lines["Profile memory"]
+    assert "PASS" in lines["Calendar integration"]
+    assert "WARN" in lines["Lessons memory"]
+
+
+class _CountingTelegramResponse:
+    status_code = 200
+
+    def __init__(self) -> None:
+        self.json_calls = 0
+
+    def json(self) -> dict[str, Any]:
+        self.json_calls += 1
+        return {"ok": True, "result": {"username": "galyarder_bot"}}
+
+
+def test_doctor_telegram_probe_parses_response_once(tmp_path: Path, monkeypatch):
+    _prepare_workspace(tmp_path, monkeypatch)
+    config = load_config()
+    config.channels.telegram.enabled = True
+    config.channels.telegram.token = "123:abc"
+    save_config(config)
+    response = _CountingTelegramResponse()
+
+    class _FakeAsyncClient:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            pass
+
+        async def __aenter__(self) -> "_FakeAsyncClient":
+            return self
+
+        async def __aexit__(self, *exc: Any) -> bool:
+            return False
+
+        async def get(self, url: str, **kwargs: Any) -> _CountingTelegramResponse:
+            assert url.endswith("/bot123:abc/getMe")
+            return response
+
+    monkeypatch.setattr("httpx.AsyncClient", _FakeAsyncClient)
+
+    result = runner.invoke(app, ["doctor"])
+
+    lines = {line.split("│")[1].strip(): line for line in result.stdout.splitlines() if "│" in line}
+    assert "@galyarder_bot" in lines["Telegram API"]
+    assert response.json_calls == 1
+
+
+def test_doctor_google_probe_shares_probe_client(tmp_path: Path, monkeypatch):
+    _prepare_workspace(tmp_path, monkeypatch)
+    config = load_config()
+    config.integrations.google.access_token = "ya29.token"
+    save_config(config)
+    built: list["_FakeAsyncClient"] = []
+
+    class _FakeResponse:
+        status_code = 200
+        text = ""
+
+        def json(self) -> dict[str, Any]:
+            return {"emailAddress": "me@example.com"}
+
+    class _FakeAsyncClient:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            self.requests: list[str] = []
+            built.append(self)
+
+        async def __aenter__(self) -> "_FakeAsyncClient":
+            return self
+
+        async def __aexit__(self, *exc: Any) -> bool:
+            return False
+
+        async def request(self, method: str, url: str, **kwargs: Any) -> _FakeResponse:
+            self.requests.append(url)
+            return _FakeResponse()
+
+    monkeypatch.setattr("httpx.AsyncClient", _FakeAsyncClient)
+
+    result = runner.invoke(app, ["doctor"])
+
+    lines = {line.split("│")[1].strip(): line for line in result.stdout.splitlines() if "│" in line}
+    assert "reachable (access token)" in lines["Google API network"]
+    assert len(built) == 1
+    assert built[0].requests == ["https://gmail.googleapis.com/gmail/v1/users/me/profile"]
@@ -0,0 +1,74 @@
+import asyncio
+import sys
+import types
+
+import pytest
+
+from g_agent.cli.commands import _calendar_events_url, _run_event_loop, _run_sibling_tasks
+
+
+def test_run_sibling_tasks_cancels_siblings_and_unwraps_error():
+    cancelled: list[str] = []
+
+    async def _hang() -> None:
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.append("hang")
+            raise
+
+    async def _fail() -> None:
+        await asyncio.sleep(0)
+        raise OSError("address already in use")
+
+    with pytest.raises(OSError, match="address already in use"):
+        asyncio.run(asyncio.wait_for(_run_sibling_tasks(_hang(), _fail()), timeout=5))
+
+    assert cancelled == ["hang"]
+
+
+def test_run_sibling_tasks_waits_for_all_on_success():
+    finished: list[int] = []
+
+    async def _work(value: int) -> None:
+        await asyncio.sleep(0)
+        finished.append(value)
+
+    asyncio.run(_run_sibling_tasks(_work(1), _work(2)))
+
+    assert sorted(finished) == [1, 2]
+
+
+def test_calendar_events_url_quotes_id_and_defaults_to_primary():
+    assert _calendar_events_url("team@group.calendar.google.com") == (
+        "https://www.googleapis.com/calendar/v3/calendars/team%40group.calendar.google.com/events"
+    )
+    assert _calendar_events_url("").endswith("/calendars/primary/events")
+    assert _calendar_events_url("primary") is _calendar_events_url("primary")
+
+
+def test_run_event_loop_falls_back_without_uvloop(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+
+    async def _loop_class() -> str:
+        return type(asyncio.get_running_loop()).__name__
+
+    assert "uvloop" not in _run_event_loop(_loop_class()).lower()
+
+
+def test_run_event_loop_uses_uvloop_factory_when_available(monkeypatch):
+    created: list[asyncio.AbstractEventLoop] = []
+
+    def _new_event_loop() -> asyncio.AbstractEventLoop:
+        loop = asyncio.new_event_loop()
+        created.append(loop)
+        return loop
+
+    monkeypatch.setitem(
+        sys.modules, "uvloop", types.SimpleNamespace(new_event_loop=_new_event_loop)
+    )
+
+    async def _current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    assert _run_event_loop(_current_loop()) is created[0]
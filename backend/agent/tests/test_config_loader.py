@@ -0,0 +1,140 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from g_agent.config.loader import load_config, save_config
+from g_agent.config.schema import Config
+
+
+def test_load_config_returns_independent_copies(tmp_path: Path):
+    path = tmp_path / "config.json"
+    config = Config()
+    config.agents.defaults.model = "gemini/gemini-2.5-flash"
+    save_config(config, path)
+
+    first = load_config(path)
+    first.agents.defaults.model = "mutated"
+    second = load_config(path)
+
+    assert second.agents.defaults.model == "gemini/gemini-2.5-flash"
+    assert second is not first
+
+
+def test_load_config_picks_up_saved_and_external_changes(tmp_path: Path):
+    path = tmp_path / "config.json"
+    config = Config()
+    config.channels.telegram.token = "111:aaa"
+    save_config(config, path)
+    assert load_config(path).channels.telegram.token == "111:aaa"
+
+    # Same-size rewrite through save_config must not serve the stale entry.
+    config.channels.telegram.token = "222:bbb"
+    save_config(config, path)
+    assert load_config(path).channels.telegram.token == "222:bbb"
+
+    data = json.loads(path.read_text())
+    data["channels"]["telegram"]["token"] = "333:ccc-external"
+    path.write_text(json.dumps(data))
+    assert load_config(path).channels.telegram.token == "333:ccc-external"
+
+
+def test_load_config_missing_file_returns_defaults(tmp_path: Path):
+    assert load_config(tmp_path / "missing.json") == Config()
+
+
+def test_save_config_skips_unchanged_write(tmp_path: Path):
+    path = tmp_path / "config.json"
+    config = Config()
+    config.channels.telegram.token = "111:aaa"
+    save_config(config, path)
+    before = path.stat().st_mtime_ns
+    os.utime(path, ns=(before - 10_000_000_000, before - 10_000_000_000))
+    stamped = path.stat().st_mtime_ns
+
+    save_config(load_config(path), path)
+    assert path.stat().st_mtime_ns == stamped
+
+    config.channels.telegram.token = "222:bbb"
+    save_config(config, path)
+    assert path.stat().st_mtime_ns != stamped
+    assert load_config(path).channels.telegram.token == "222:bbb"
+    assert not (tmp_path / "config.json.tmp").exists()
+
+
+def test_save_config_keeps_existing_file_mode(tmp_path: Path):
+    path = tmp_path / "config.json"
+    path.write_text("{}")
+    path.chmod(0o600)
+    config = Config()
+    config.channels.telegram.token = "111:aaa"
+
+    save_config(config, path)
+
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert load_config(path).channels.telegram.token == "111:aaa"
+    assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+
+
+def test_save_config_removes_temp_file_when_write_fails(tmp_path: Path, monkeypatch):
+    path = tmp_path / "config.json"
+
+    def _fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", _fail_replace)
+    with pytest.raises(OSError):
+        save_config(Config(), path)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_save_config_writes_same_bytes_as_stdlib_json(tmp_path: Path):
+    from g_agent.config.loader import convert_to_camel
+
+    path = tmp_path / "config.json"
+    config = Config()
+    config.agents.defaults.workspace = "~/työtila"
+    save_config(config, path)
+
+    expected = json.dumps(convert_to_camel(config.model_dump()), indent=2)
+    assert path.read_bytes() == expected.encode("utf-8")
+
+
+def test_save_config_primes_cache_for_following_load(tmp_path: Path, monkeypatch):
+    import g_agent.config.loader as loader
+
+    path = tmp_path / "config.json"
+    config = Config()
+    config.channels.telegram.token = "111:aaa"
+    save_config(config, path)
+
+    def _no_parse(data: bytes) -> None:
+        raise AssertionError("load after save should not re-parse")
+
+    monkeypatch.setattr(loader, "json_loads", _no_parse)
+    loaded = load_config(path)
+
+    assert loaded == config
+    assert loaded is not config
+
+
+def test_save_config_does_not_prime_cache_for_legacy_model(tmp_path: Path):
+    path = tmp_path / "config.json"
+    config = Config()
+    config.agents.defaults.model = "claude-opus-4-5"
+    save_config(config, path)
+
+    assert load_config(path).agents.defaults.model == "claude-opus-4-6-thinking"
+
+
+def test_config_package_resolves_exports_lazily():
+    import g_agent.config as config_pkg
+    from g_agent.config import loader, schema
+
+    assert config_pkg.Config is schema.Config
+    assert config_pkg.load_config is loader.load_config
+    assert config_pkg.get_config_path is loader.get_config_path
+    with pytest.raises(AttributeError):
+        config_pkg.not_an_export
@@ -1,3 +1,5 @@
+import asyncio
+import json
 from pathlib import Path
 
 from g_agent.cron.service import CronService
@@ -20,3 +22,277 @@ def test_add_job_preserves_payload_kind(tmp_path: Path):
 
     jobs = service.list_jobs(include_disabled=True)
     assert jobs and jobs[0].payload.kind == "system_event"
+
+
+def test_service_reuses_parsed_store_until_file_changes(tmp_path: Path, monkeypatch):
+    store_path = tmp_path / "jobs.json"
+    gateway = CronService(store_path)
+    gateway.add_job(name="a", schedule=CronSchedule(kind="every", every_ms=60000), message="a")
+
+    reads: list[Path] = []
+    original_read = Path.read_bytes
+
+    def counting_read(self: Path) -> bytes:
+        reads.append(self)
+        return original_read(self)
+
+    monkeypatch.setattr(Path, "read_bytes", counting_read)
+    assert [j.name for j in gateway.list_jobs()] == ["a"]
+    assert gateway.status()["jobs"] == 1
+    assert reads == []
+
+    CronService(store_path).add_job(
+        name="b", schedule=CronSchedule(kind="every", every_ms=60000), message="b"
+    )
+    reads.clear()
+    assert sorted(j.name for j in gateway.list_jobs()) == ["a", "b"]
+    assert reads == [store_path]
+
+
+def test_job_outcome_survives_store_reload_during_run(tmp_path: Path):
+    store_path = tmp_path / "jobs.json"
+    service = CronService(store_path)
+    job = service.add_job(
+        name="a", schedule=CronSchedule(kind="every", every_ms=60000), message="a"
+    )
+
+    async def on_job(_job) -> None:
+        # Another process touches the store while the job is running.
+        CronService(store_path).add_job(
+            name="b", schedule=CronSchedule(kind="every", every_ms=60000), message="b"
+        )
+        service.list_jobs()
+
+    service.on_job = on_job
+    assert asyncio.run(service.run_job(job.id)) is True
+
+    saved = {j.name: j for j in CronService(store_path).list_jobs()}
+    assert set(saved) == {"a", "b"}
+    assert saved["a"].state.last_status == "ok"
+    assert saved["a"].state.last_run_at_ms is not None
+
+
+def test_timer_tick_keeps_finished_jobs_when_store_changes_mid_tick(tmp_path: Path):
+    store_path = tmp_path / "jobs.json"
+    service = CronService(store_path)
+    once = service.add_job(
+        name="once",
+        schedule=CronSchedule(kind="at", at_ms=1),
+        message="once",
+        delete_after_run=True,
+    )
+    every = service.add_job(
+        name="every", schedule=CronSchedule(kind="every", every_ms=60000), message="every"
+    )
+    for job in service.list_jobs():
+        job.state.next_run_at_ms = 1
+    service._save_store()
+    ran: list[str] = []
+
+    async def on_job(job) -> None:
+        ran.append(job.name)
+        if job.id == every.id:
+            # Another process edits the store while the second job is running.
+            CronService(store_path).add_job(
+                name="other", schedule=CronSchedule(kind="every", every_ms=60000), message="other"
+            )
+            service.list_jobs()
+
+    service.on_job = on_job
+    asyncio.run(service._on_timer())
+    asyncio.run(service._on_timer())
+
+    assert sorted(ran) == ["every", "once"]
+    saved = {j.name: j for j in CronService(store_path).list_jobs()}
+    assert set(saved) == {"every", "other"}
+    assert once.id not in {j.id for j in service.list_jobs()}
+    assert saved["every"].state.next_run_at_ms > 1
+
+
+def test_timer_tick_keeps_job_added_by_another_process_during_run(tmp_path: Path):
+    store_path = tmp_path / "jobs.json"
+    service = CronService(store_path)
+    job = service.add_job(
+        name="a", schedule=CronSchedule(kind="every", every_ms=60000), message="a"
+    )
+    job.state.next_run_at_ms = 1
+    service._save_store()
+
+    async def on_job(_job) -> None:
+        CronService(store_path).add_job(
+            name="b", schedule=CronSchedule(kind="every", every_ms=60000), message="b"
+        )
+
+    service.on_job = on_job
+    asyncio.run(service._on_timer())
+
+    saved = {j.name: j for j in CronService(store_path).list_jobs()}
+    assert set(saved) == {"a", "b"}
+    assert saved["a"].state.last_run_at_ms is not None
+    assert saved["a"].state.next_run_at_ms > 1
+
+
+def test_cron_list_formats_next_run_in_local_time(tmp_path: Path, monkeypatch):
+    import time
+
+    from typer.testing import CliRunner
+
+    from g_agent.cli.commands import app
+
+    monkeypatch.setenv("G_AGENT_DATA_DIR", str(tmp_path))
+    monkeypatch.setenv("COLUMNS", "200")
+    service = CronService(tmp_path / "cron" / "jobs.json")
+    for name in ("digest-a", "digest-b"):
+        service.add_job(
+            name=name, schedule=CronSchedule(kind="every", every_ms=3_600_000), message="hi"
+        )
+    expected = [
+        time.strftime("%Y-%m-%d %H:%M", time.localtime(job.state.next_run_at_ms / 1000))
+        for job in service.list_jobs()
+    ]
+
+    result = CliRunner().invoke(app, ["cron", "list"])
+
+    assert result.exit_code == 0
+    rows = [line for line in result.stdout.splitlines() if "digest-" in line]
+    assert [label in row for label, row in zip(expected, rows)] == [True, True]
+    assert "every 3600s" in result.stdout
+
+
+def test_schedule_labels_cover_each_kind():
+    from g_agent.cli.commands import _SCHEDULE_LABELS, _one_time_label
+
+    assert _SCHEDULE_LABELS["every"](CronSchedule(kind="every", every_ms=90_000)) == "every 90s"
+    assert _SCHEDULE_LABELS["cron"](CronSchedule(kind="cron", expr="0 9 * * *")) == "0 9 * * *"
+    assert _SCHEDULE_LABELS["at"](CronSchedule(kind="at", at_ms=1)) == "one-time"
+    assert _SCHEDULE_LABELS.get("unknown", _one_time_label)(CronSchedule(kind="at")) == "one-time"
+
+
+def test_cron_run_executes_job_and_reports_missing(tmp_path: Path, monkeypatch):
+    from typer.testing import CliRunner
+
+    from g_agent.cli.commands import app
+
+    monkeypatch.setenv("G_AGENT_DATA_DIR", str(tmp_path))
+    job = CronService(tmp_path / "cron" / "jobs.json").add_job(
+        name="digest", schedule=CronSchedule(kind="every", every_ms=3_600_000), message="hi"
+    )
+
+    ok = CliRunner().invoke(app, ["cron", "run", job.id])
+    missing = CliRunner().invoke(app, ["cron", "run", "nope"])
+
+    assert ok.exit_code == 0 and "Job executed" in ok.stdout
+    assert CronService(tmp_path / "cron" / "jobs.json").list_jobs()[0].state.last_status == "ok"
+    assert missing.exit_code != 0
+
+
+def test_remove_jobs_by_name_saves_store_once(tmp_path: Path, monkeypatch):
+    service = CronService(tmp_path / "jobs.json")
+    for name in ("daily-digest", "weekly-lessons-distill", "keep-me", "calendar-watch"):
+        service.add_job(
+            name=name, schedule=CronSchedule(kind="every", every_ms=60000), message=name
+        )
+
+    saves: list[int] = []
+    original_save = service._save_store
+    monkeypatch.setattr(service, "_save_store", lambda: (saves.append(1), original_save()))
+
+    removed = service.remove_jobs_by_name(
+        {"daily-digest", "weekly-lessons-distill", "calendar-watch"}
+    )
+
+    assert removed == 3
+    assert saves == [1]
+    assert [j.name for j in CronService(tmp_path / "jobs.json").list_jobs()] == ["keep-me"]
+    assert service.remove_jobs_by_name({"daily-digest"}) == 0
+    assert saves == [1]
+    assert [p.name for p in tmp_path.iterdir()] == ["jobs.json"]
+
+
+def test_save_store_keeps_existing_file_mode(tmp_path: Path):
+    store_path = tmp_path / "jobs.json"
+    service = CronService(store_path)
+    service.add_job(name="a", schedule=CronSchedule(kind="every", every_ms=60000), message="a")
+    store_path.chmod(0o600)
+
+    service.add_job(name="b", schedule=CronSchedule(kind="every", every_ms=60000), message="b")
+
+    assert store_path.stat().st_mode & 0o777 == 0o600
+    assert [p.name for p in tmp_path.iterdir()] == ["jobs.json"]
+
+
+def test_save_store_writes_same_bytes_as_stdlib_json(tmp_path: Path):
+    store_path = tmp_path / "jobs.json"
+    CronService(store_path).add_job(
+        name="päivä",
+        schedule=CronSchedule(kind="every", every_ms=60000),
+        message="Hyvää huomenta ☀",
+    )
+
+    raw = store_path.read_bytes()
+    assert raw == json.dumps(json.loads(raw), indent=2).encode("utf-8")
+
+
+def test_count_jobs_by_name_includes_disabled_jobs(tmp_path: Path):
+    service = CronService(tmp_path / "jobs.json")
+    for name in ("daily-digest", "keep-me", "calendar-watch"):
+        service.add_job(
+            name=name, schedule=CronSchedule(kind="every", every_ms=60000), message=name
+        )
+    digest = next(j for j in service.list_jobs() if j.name == "daily-digest")
+    service.enable_job(digest.id, enabled=False)
+
+    names = frozenset({"daily-digest", "weekly-lessons-distill", "calendar-watch"})
+    assert service.count_jobs_by_name(names) == 2
+    assert CronService(tmp_path / "jobs.json").count_jobs_by_name(names) == 2
+    assert service.count_jobs_by_name(set()) == 0
+
+
+def test_batch_defers_store_writes_until_exit(tmp_path: Path):
+    store_path = tmp_path / "jobs.json"
+    service = CronService(store_path)
+
+    with service.batch():
+        for name in ("a", "b", "c"):
+            service.add_job(
+                name=name, schedule=CronSchedule(kind="every", every_ms=60000), message=name
+            )
+        assert not store_path.exists()
+        assert len(service.list_jobs()) == 3
+
+    assert sorted(j.name for j in CronService(store_path).list_jobs()) == ["a", "b", "c"]
+
+
+def test_parse_lead_minutes_keeps_positive_whole_minutes():
+    from g_agent.cli.commands import _parse_lead_minutes
+
+    assert _parse_lead_minutes("10, 30,10,0") == [30, 10]
+    assert _parse_lead_minutes("-5, 1.5, soon, ²,") == []
+    assert _parse_lead_minutes("") == []
+
+
+def test_proactive_enable_adds_calendar_watch_only_when_delivering(tmp_path: Path, monkeypatch):
+    from typer.testing import CliRunner
+
+    from g_agent.cli.commands import app
+
+    monkeypatch.setenv("G_AGENT_DATA_DIR", str(tmp_path))
+    store_path = tmp_path / "cron" / "jobs.json"
+
+    skipped = CliRunner().invoke(app, ["proactive-enable"])
+    assert skipped.exit_code == 0
+    assert "Calendar watch skipped" in skipped.stdout
+    assert sorted(j.name for j in CronService(store_path).list_jobs()) == [
+        "daily-digest",
+        "weekly-lessons-distill",
+    ]
+
+    invalid = CliRunner().invoke(app, ["proactive-enable", "--deliver", "--channel", "telegram"])
+    assert invalid.exit_code == 1
+
+    delivered = CliRunner().invoke(
+        app, ["proactive-enable", "--deliver", "--channel", "telegram", "--to", "42"]
+    )
+    assert delivered.exit_code == 0
+    watch = [j for j in CronService(store_path).list_jobs() if j.name == "calendar-watch"]
+    assert len(watch) == 1 and watch[0].payload.to == "42"
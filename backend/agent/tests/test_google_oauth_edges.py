@@ -1,7 +1,22 @@
 import asyncio
+from pathlib import Path
 from typing import Any
+from urllib.parse import urlencode
 
-from g_agent.agent.tools.google_workspace import GoogleWorkspaceClient
+import httpx
+import pytest
+from typer.testing import CliRunner
+
+from g_agent.agent.tools.google_workspace import _MAX_CONCURRENT_REQUESTS, GoogleWorkspaceClient
+from g_agent.cli.commands import (
+    _GOOGLE_DEFAULT_SCOPES,
+    _google_send,
+    _read_google_profile_cache,
+    _write_google_profile_cache,
+    app,
+)
+from g_agent.config.loader import load_config, save_config
+from g_agent.config.schema import Config
 
 
 class _FakeResponse:
@@ -135,3 +150,328 @@ def test_google_request_reports_scope_drift_with_guidance(monkeypatch):
     assert "auth-url" in data.get("error", "")
     assert len(factory.post_calls) == 1
     assert len(factory.request_calls) == 1
+
+
+def test_google_request_reuses_injected_http_client(monkeypatch):
+    def _fail_if_built(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("per-call AsyncClient should not be built")
+
+    monkeypatch.setattr("g_agent.agent.tools.google_workspace.httpx.AsyncClient", _fail_if_built)
+    factory = _FakeAsyncClientFactory(
+        post_responses=[
+            _FakeResponse(200, {"access_token": "fresh-token", "expires_in": 3600}),
+        ],
+        request_responses=[
+            _FakeResponse(200, {"emailAddress": "me@example.com"}),
+            _FakeResponse(200, {"items": []}),
+        ],
+    )
+    shared = _FakeAsyncClient(factory)
+    client = GoogleWorkspaceClient(
+        client_id="cid",
+        client_secret="csecret",
+        refresh_token="refresh",
+        http_client=shared,
+    )
+
+    async def _run() -> list[tuple[bool, dict[str, Any]]]:
+        return [
+            await client.request("GET", "https://gmail.googleapis.com/gmail/v1/users/me/profile"),
+            await client.request(
+                "GET", "https://www.googleapis.com/calendar/v3/calendars/primary/events"
+            ),
+        ]
+
+    first, second = asyncio.run(_run())
+
+    assert first == (True, {"emailAddress": "me@example.com"})
+    assert second == (True, {"items": []})
+    assert len(factory.post_calls) == 1
+    assert len(factory.request_calls) == 2
+
+
+def test_google_requests_share_a_concurrency_cap():
+    in_flight = 0
+    peak = 0
+
+    class _SlowClient:
+        async def request(self, **kwargs: Any) -> _FakeResponse:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _FakeResponse(200, {"ok": True})
+
+    shared = _SlowClient()
+    clients = [GoogleWorkspaceClient(access_token=f"tok-{i}", http_client=shared) for i in range(2)]
+
+    async def _run() -> list[tuple[bool, dict[str, Any]]]:
+        return await asyncio.gather(
+            *(clients[i % 2].request("GET", "https://example.test") for i in range(12))
+        )
+
+    results = asyncio.run(_run())
+
+    assert all(ok for ok, _ in results)
+    assert peak == _MAX_CONCURRENT_REQUESTS
+
+
+class _FakeVerifyClient:
+    instances: list["_FakeVerifyClient"] = []
+
+    def __init__(self, responses: dict[str, list[_FakeResponse]], **kwargs: Any):
+        self.responses = responses
+        self.calls: list[tuple[str, dict[str, str]]] = []
+        _FakeVerifyClient.instances.append(self)
+
+    async def __aenter__(self) -> "_FakeVerifyClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    async def post(self, url: str, data: dict[str, Any] | None = None) -> _FakeResponse:
+        self.calls.append(("POST", {}))
+        return self.responses["POST"].pop(0)
+
+    async def get(self, url: str, headers: dict[str, str] | None = None) -> _FakeResponse:
+        self.calls.append(("GET", headers or {}))
+        return self.responses["GET"].pop(0)
+
+
+def _run_google_verify(
+    tmp_path: Path,
+    monkeypatch,
+    responses: dict[str, list[_FakeResponse]],
+    access_token: str = "",
+    expires_at_ms: int = 0,
+):
+    monkeypatch.setenv("G_AGENT_DATA_DIR", str(tmp_path / "data"))
+    config = Config()
+    config.integrations.google.client_id = "cid"
+    config.integrations.google.client_secret = "csecret"
+    config.integrations.google.refresh_token = "refresh"
+    config.integrations.google.access_token = access_token
+    config.integrations.google.access_token_expires_at_ms = expires_at_ms
+    save_config(config)
+    _FakeVerifyClient.instances.clear()
+    monkeypatch.setattr(
+        "httpx.AsyncClient", lambda **kwargs: _FakeVerifyClient(responses, **kwargs)
+    )
+    return CliRunner().invoke(app, ["google", "verify"])
+
+
+def test_google_verify_uses_stored_token_without_refreshing(tmp_path: Path, monkeypatch):
+    result = _run_google_verify(
+        tmp_path,
+        monkeypatch,
+        {
+            "POST": [],
+            "GET": [_FakeResponse(200, {"emailAddress": "me@example.com", "messagesTotal": 3})],
+        },
+        access_token="stored-token",
+    )
+
+    assert result.exit_code == 0
+    assert "me@example.com" in result.stdout
+    assert len(_FakeVerifyClient.instances) == 1
+    assert _FakeVerifyClient.instances[0].calls == [
+        ("GET", {"Authorization": "Bearer stored-token"})
+    ]
+    assert load_config().integrations.google.access_token == "stored-token"
+
+
+def test_google_verify_refreshes_upfront_when_token_known_expired(tmp_path: Path, monkeypatch):
+    result = _run_google_verify(
+        tmp_path,
+        monkeypatch,
+        {
+            "POST": [_FakeResponse(200, {"access_token": "fresh-token", "expires_in": 3599})],
+            "GET": [_FakeResponse(200, {"emailAddress": "me@example.com"})],
+        },
+        access_token="stored-token",
+        expires_at_ms=1,
+    )
+
+    assert result.exit_code == 0
+    calls = _FakeVerifyClient.instances[0].calls
+    assert calls == [("POST", {}), ("GET", {"Authorization": "Bearer fresh-token"})]
+    saved = load_config().integrations.google
+    assert saved.access_token == "fresh-token"
+    assert saved.access_token_expires_at_ms > 1
+
+
+def test_google_verify_retries_401_with_refreshed_token(tmp_path: Path, monkeypatch):
+    result = _run_google_verify(
+        tmp_path,
+        monkeypatch,
+        {
+            "POST": [_FakeResponse(200, {"access_token": "fresh-token"})],
+            "GET": [
+                _FakeResponse(401, {}),
+                _FakeResponse(200, {"emailAddress": "me@example.com", "messagesTotal": 3}),
+            ],
+        },
+        access_token="stale-token",
+    )
+
+    assert result.exit_code == 0
+    assert len(_FakeVerifyClient.instances) == 1
+    calls = _FakeVerifyClient.instances[0].calls
+    assert len(calls) == 3
+    assert calls[-1] == ("GET", {"Authorization": "Bearer fresh-token"})
+
+
+def test_google_verify_without_stored_token_refreshes_first(tmp_path: Path, monkeypatch):
+    result = _run_google_verify(
+        tmp_path,
+        monkeypatch,
+        {
+            "POST": [_FakeResponse(200, {"access_token": "fresh-token"})],
+            "GET": [_FakeResponse(200, {"emailAddress": "me@example.com"})],
+        },
+    )
+
+    assert result.exit_code == 0
+    calls = _FakeVerifyClient.instances[0].calls
+    assert calls == [("POST", {}), ("GET", {"Authorization": "Bearer fresh-token"})]
+
+
+def test_google_auth_url_matches_urlencode(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("G_AGENT_DATA_DIR", str(tmp_path / "data"))
+    config = Config()
+    config.integrations.google.client_id = "abc 123.apps.googleusercontent.com"
+    save_config(config)
+
+    result = CliRunner().invoke(
+        app, ["google", "auth-url", "--redirect-uri", "http://localhost:8080/cb"]
+    )
+
+    assert result.exit_code == 0
+    expected = "https://accounts.google.com/o/oauth2/v2/auth?" + urlencode(
+        {
+            "client_id": "abc 123.apps.googleusercontent.com",
+            "redirect_uri": "http://localhost:8080/cb",
+            "response_type": "code",
+            "access_type": "offline",
+            "prompt": "consent",
+            "scope": _GOOGLE_DEFAULT_SCOPES,
+        }
+    )
+    assert expected in result.output.replace("\n", "")
+
+
+def test_google_send_retries_transient_failures_within_budget(monkeypatch):
+    delays: list[float] = []
+
+    async def _no_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(asyncio, "sleep", _no_sleep)
+
+    def _sender(outcomes: list[Any]):
+        calls: list[int] = []
+
+        async def send() -> _FakeResponse:
+            calls.append(1)
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return outcome
+
+        return send, calls
+
+    send, calls = _sender([httpx.ConnectError("down"), _FakeResponse(503), _FakeResponse(200)])
+    assert asyncio.run(_google_send(send)).status_code == 200
+    assert len(calls) == 3
+    assert len(delays) == 2 and all(0 <= d <= 8.0 for d in delays)
+
+    send, calls = _sender([_FakeResponse(503), _FakeResponse(503), _FakeResponse(503)])
+    assert asyncio.run(_google_send(send)).status_code == 503
+    assert len(calls) == 3
+
+    send, calls = _sender([_FakeResponse(503), _FakeResponse(200)])
+    assert asyncio.run(_google_send(send, replay_safe=False)).status_code == 503
+    assert len(calls) == 1
+
+    send, calls = _sender([httpx.ReadTimeout("slow"), _FakeResponse(200)])
+    with pytest.raises(httpx.ReadTimeout):
+        asyncio.run(_google_send(send, replay_safe=False))
+
+
+def test_google_status_renders_shared_cells_without_markup_in_values(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("G_AGENT_DATA_DIR", str(tmp_path / "data"))
+    config = Config()
+    config.integrations.google.client_id = "cid"
+    config.integrations.google.client_secret = "csecret"
+    config.integrations.google.calendar_id = "team[bold]cal"
+    save_config(config)
+
+    runner = CliRunner()
+    outputs = [runner.invoke(app, ["google", "status"]).output for _ in range(2)]
+
+    assert outputs[0] == outputs[1]
+    assert "- Client credentials: ✓" in outputs[0]
+    assert "- Refresh token: missing" in outputs[0]
+    assert "- Calendar ID: team[bold]cal" in outputs[0]
+
+
+def test_google_verify_serves_recent_profile_from_cache(tmp_path: Path, monkeypatch):
+    profile = {"emailAddress": "me@example.com", "messagesTotal": 3}
+    responses = {"POST": [], "GET": [_FakeResponse(200, profile), _FakeResponse(200, profile)]}
+    first = _run_google_verify(tmp_path, monkeypatch, responses, access_token="stored-token")
+    assert first.exit_code == 0
+
+    second = CliRunner().invoke(app, ["google", "verify"])
+    assert second.exit_code == 0
+    assert "me@example.com" in second.stdout and "cached" in second.stdout
+    assert len(_FakeVerifyClient.instances) == 1
+
+    third = CliRunner().invoke(app, ["google", "verify", "--no-cache"])
+    assert third.exit_code == 0
+    assert "cached" not in third.stdout
+    assert len(_FakeVerifyClient.instances) == 2
+
+    CliRunner().invoke(app, ["google", "clear"])
+    assert "cached" not in CliRunner().invoke(app, ["google", "verify"]).stdout
+
+
+def test_google_verify_persists_refreshed_token_once_even_on_failure(tmp_path: Path, monkeypatch):
+    import g_agent.config.loader as loader
+
+    saves: list[str] = []
+    original_save = loader.save_config
+
+    def counting_save(config: Config, config_path: Path | None = None) -> None:
+        saves.append(config.integrations.google.access_token)
+        original_save(config, config_path)
+
+    monkeypatch.setattr(loader, "save_config", counting_save)
+    result = _run_google_verify(
+        tmp_path,
+        monkeypatch,
+        {
+            "POST": [_FakeResponse(200, {"access_token": "fresh-token"})],
+            "GET": [_FakeResponse(401, {}), _FakeResponse(403, {})],
+        },
+        access_token="stale-token",
+    )
+
+    assert result.exit_code == 1
+    assert saves == ["fresh-token"]
+    assert load_config().integrations.google.access_token == "fresh-token"
+
+
+def test_google_profile_cache_is_private_to_owner(tmp_path: Path):
+    path = tmp_path / "cache" / "google_profile.json"
+    path.parent.mkdir()
+    path.write_text("{}")
+    path.chmod(0o644)
+    profile = {"emailAddress": "owner@example.com", "messagesTotal": 3}
+
+    _write_google_profile_cache(path, "key-1", profile)
+
+    assert path.stat().st_mode & 0o777 == 0o600
+    assert _read_google_profile_cache(path, "key-1") == profile
+    assert _read_google_profile_cache(path, "key-2") is None
@@ -209,3 +209,20 @@ def test_suppress_debug_info(make_provider, mock_litellm):
     """litellm.suppress_debug_info must be True after init."""
     make_provider(api_key="test-key", default_model="test-model")
     assert mock_litellm.suppress_debug_info is True
+
+
+def test_agent_loop_import_does_not_import_litellm():
+    """litellm is only imported once a LiteLLMProvider is actually needed."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys\n"
+        "import g_agent.agent.loop, g_agent.providers\n"
+        "assert 'litellm' not in sys.modules, 'litellm imported eagerly'\n"
+        "from g_agent.providers import LiteLLMProvider\n"
+        "assert LiteLLMProvider.__name__ == 'LiteLLMProvider'\n"
+    )
+    env = {**os.environ, "LITELLM_LOCAL_MODEL_COST_MAP": "True"}
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+    assert result.returncode == 0, result.stderr
@@ -1,5 +1,6 @@
 import asyncio
 import json
+import os
 from pathlib import Path
 
 from g_agent.agent.memory import MemoryStore
@@ -219,3 +220,18 @@ def test_detect_summary_fact_drift_ignores_semantically_equivalent_value(tmp_pat
 
     drifts = store.detect_summary_fact_drift()
     assert drifts == []
+
+
+def test_memory_writes_replace_files_whole(tmp_path: Path, monkeypatch):
+    store = MemoryStore(tmp_path)
+    store.write_long_term("# Long-term Memory\n\n- first\n")
+    before = sorted(p.name for p in store.memory_dir.iterdir())
+
+    def _fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", _fail_replace)
+    assert store._safe_write(store.memory_file, "# Long-term Memory\n\n- second\n") is False
+
+    assert store.read_long_term() == "# Long-term Memory\n\n- first\n"
+    assert sorted(p.name for p in store.memory_dir.iterdir()) == before
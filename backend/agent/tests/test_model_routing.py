@@ -227,6 +227,26 @@ def test_auto_mode_honors_explicit_model_prefix():
     assert route.provider == "gemini"
 
 
+
+def test_keyless_route_falls_back_to_first_configured_key():
+    cfg = Config.model_validate(
+        {
+            "agents": {"defaults": {"model": "qwen-max", "routing": {"mode": "proxy"}}},
+            "providers": {
+                "vllm": {"api_base": "http://127.0.0.1:8317/v1"},
+                "gemini": {"api_key": "gsk-live"},
+                "groq": {"api_key": "gsk-groq"},
+            },
+        }
+    )
+    route = cfg.resolve_model_route()
+    assert route.provider == "vllm"
+    assert route.api_key is None
+    assert cfg.fallback_api_key() == "gsk-live"
+    assert cfg.get_api_key() == "gsk-live"
+    assert cfg._model_provider_hints("Kimi-gpt-mix") == ("openai", "moonshot")
+
+
 # ── Failover tests (unchanged) ────────────────────────────────────────────
 
 
@@ -1,5 +1,8 @@
 import asyncio
+import gzip
 import json
+import random
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
@@ -8,7 +11,7 @@ from g_agent.agent.memory import MemoryStore
 from g_agent.agent.tools.base import Tool
 from g_agent.agent.tools.integrations import RecallTool
 from g_agent.bus.queue import MessageBus
-from g_agent.observability.metrics import MetricsStore
+from g_agent.observability.metrics import MetricsStore, _p95
 from g_agent.providers.base import LLMProvider, LLMResponse
 
 
@@ -72,6 +75,82 @@ def test_metrics_store_snapshot(tmp_path: Path):
     assert snap["tools"]["top_tools"][0]["tool"] == "web_search"
 
 
+def test_cron_run_keeps_integer_latency_compact(tmp_path: Path):
+    events_path = tmp_path / "events.jsonl"
+    store = MetricsStore(events_path)
+    store.record_cron_run(
+        name="daily-digest", payload_kind="agent_turn", success=True, latency_ms=1234
+    )
+    store.record_cron_run(
+        name="daily-digest", payload_kind="agent_turn", success=True, latency_ms=5.678
+    )
+
+    rows = [json.loads(line) for line in events_path.read_text(encoding="utf-8").splitlines()]
+    assert '"latency_ms": 1234,' in events_path.read_text(encoding="utf-8")
+    assert [row["latency_ms"] for row in rows] == [1234, 5.68]
+    assert store.snapshot(hours=24)["cron"]["runs"] == 2
+
+
+def test_metrics_snapshot_top_tools_order_and_limit(tmp_path: Path):
+    store = MetricsStore(tmp_path / "events.jsonl")
+    for index in range(12):
+        store.record_tool_call(tool=f"tool_{index:02d}", success=True, latency_ms=10)
+    store.record_tool_call(tool="tool_00", success=True, latency_ms=10)
+    store.record_tool_call(tool="tool_01", success=False, latency_ms=10)
+    store.record_tool_call(tool="tool_02", success=True, latency_ms=10)
+
+    top_tools = store.snapshot(hours=24)["tools"]["top_tools"]
+
+    assert len(top_tools) == 10
+    assert [item["tool"] for item in top_tools[:3]] == ["tool_02", "tool_00", "tool_01"]
+    assert top_tools[2] == {"tool": "tool_01", "calls": 2, "errors": 1}
+    assert top_tools[3]["tool"] == "tool_11"
+
+
+def test_metrics_snapshot_tail_matches_full_scan(tmp_path: Path):
+    events_path = tmp_path / "events.jsonl"
+    old_ts = (datetime.now(timezone.utc) - timedelta(hours=48)).replace(microsecond=0).isoformat()
+    with events_path.open("w", encoding="utf-8") as handle:
+        for index in range(50):
+            handle.write(
+                json.dumps(
+                    {"type": "tool_call", "tool": f"old_{index}", "success": True, "ts": old_ts}
+                )
+                + "\n"
+            )
+    store = MetricsStore(events_path)
+    for index in range(30):
+        store.record_tool_call(tool=f"tool_{index % 4}", success=index % 5 != 0, latency_ms=index)
+    store.record_llm_call(model="gemini", success=True, latency_ms=900)
+
+    full = store.snapshot(hours=24)
+    tail_events = store._iter_events_tail(
+        datetime.now(timezone.utc) - timedelta(hours=24),
+        chunk_size=97,
+    )
+    tail = store.snapshot_tail(hours=24)
+
+    assert len(tail_events) == 31
+    assert tail_events[0]["tool"] == "tool_0"
+    assert tail["totals"] == full["totals"] == {"events": 31}
+    assert tail["tools"] == full["tools"]
+    assert tail["llm"] == full["llm"]
+
+
+def test_metrics_snapshot_skips_malformed_lines(tmp_path: Path):
+    events_path = tmp_path / "events.jsonl"
+    store = MetricsStore(events_path)
+    store.record_tool_call(tool="exec", success=True, latency_ms=5)
+    with events_path.open("ab") as handle:
+        handle.write(b"{not json}\n\xff\xfe\n[1, 2]\n")
+    store.record_tool_call(tool="exec", success=False, latency_ms=7)
+
+    for snapshot in (store.snapshot(hours=24), store.snapshot_tail(hours=24)):
+        assert snapshot["totals"] == {"events": 2}
+        assert snapshot["tools"]["calls"] == 2
+        assert snapshot["tools"]["errors"] == 1
+
+
 def test_agent_and_recall_record_metrics(tmp_path: Path, monkeypatch):
     monkeypatch.setenv("G_AGENT_DATA_DIR", str(tmp_path / "data"))
     provider = DummyProvider()
@@ -165,6 +244,24 @@ def test_metrics_store_dashboard_and_export(tmp_path: Path):
     assert 'g_agent_top_tool_calls{tool="web_search\\"prod\\""} 1' in prom_text
 
 
+def test_metrics_store_export_gzip_keeps_inner_format(tmp_path: Path):
+    store = MetricsStore(tmp_path / "events.jsonl")
+    store.record_llm_call(model="gemini-3", success=True, latency_ms=450)
+
+    prom_path = tmp_path / "exports" / "metrics.prom.gz"
+    result = store.export_snapshot(prom_path, hours=24)
+    assert result["ok"] is True
+    assert result["format"] == "prometheus"
+    assert result["compressed"] is True
+    assert result["bytes"] == prom_path.stat().st_size
+    assert "g_agent_llm_calls_total 1" in gzip.decompress(prom_path.read_bytes()).decode("utf-8")
+
+    dashboard_path = tmp_path / "exports" / "metrics.dashboard.json.gz"
+    result = store.export_snapshot(dashboard_path, hours=24)
+    assert result["format"] == "dashboard_json"
+    assert json.loads(gzip.decompress(dashboard_path.read_bytes()))["llm_calls"] == 1
+
+
 def test_metrics_store_export_rejects_unknown_format(tmp_path: Path):
     store = MetricsStore(tmp_path / "events.jsonl")
     result = store.export_snapshot(
@@ -174,3 +271,120 @@ def test_metrics_store_export_rejects_unknown_format(tmp_path: Path):
     )
     assert result["ok"] is False
     assert "Unknown output format" in result["error"]
+
+
+def test_metrics_snapshot_scans_only_appended_bytes(tmp_path: Path):
+    events_path = tmp_path / "events.jsonl"
+    store = MetricsStore(events_path)
+    assert store.snapshot(hours=24)["totals"] == {"events": 0}
+
+    store.record_tool_call(tool="exec", success=True, latency_ms=5)
+    with events_path.open("ab") as handle:
+        handle.write(b'{"type": "tool_call", "tool": "exec"')
+    assert store.snapshot(hours=24)["tools"]["calls"] == 1
+    assert store._scan_offset == events_path.read_bytes().rindex(b"\n") + 1
+
+    with events_path.open("ab") as handle:
+        now = datetime.now(timezone.utc).isoformat()
+        handle.write(f', "success": false, "ts": "{now}"}}\n'.encode())
+    snap = store.snapshot(hours=24)
+    assert snap["tools"]["calls"] == 2
+    assert snap["tools"]["errors"] == 1
+    assert store._scan_offset == events_path.stat().st_size
+
+    old_ts = (datetime.now(timezone.utc) - timedelta(hours=48)).isoformat()
+    events_path.write_text(
+        json.dumps({"type": "llm_call", "success": True, "ts": old_ts}) + "\n", encoding="utf-8"
+    )
+    store.record_llm_call(model="gemini", success=True, latency_ms=10)
+    assert store.prune_events(keep_hours=24)["removed_by_age"] == 1
+    snap = store.snapshot(hours=24)
+    assert snap["totals"] == {"events": 1}
+    assert snap["llm"]["calls"] == 1
+
+
+def test_metrics_scan_cache_drops_events_outside_requested_windows(tmp_path: Path):
+    events_path = tmp_path / "events.jsonl"
+    old_ts = (datetime.now(timezone.utc) - timedelta(hours=30)).isoformat()
+    events_path.write_text(
+        json.dumps({"type": "llm_call", "success": True, "ts": old_ts}) + "\n", encoding="utf-8"
+    )
+    store = MetricsStore(events_path)
+    store.record_llm_call(model="gemini", success=True, latency_ms=10)
+
+    assert store.snapshot(hours=24)["llm"]["calls"] == 1
+    assert len(store._scanned) == 1
+
+    # A wider window than any seen before rescans the events pruned earlier.
+    assert store.snapshot(hours=48)["llm"]["calls"] == 2
+    assert len(store._scanned) == 2
+    assert store.snapshot(hours=24)["llm"]["calls"] == 1
+
+
+def test_p95_matches_nearest_rank_over_sorted_samples():
+    rng = random.Random(7)
+    for size in (1, 2, 19, 20, 21, 100, 1001):
+        values = [rng.uniform(0, 5000) for _ in range(size)]
+        expected = sorted(values)[int(0.95 * (size - 1))]
+        assert _p95(values) == round(expected, 2)
+    assert _p95([]) == 0.0
+    assert _p95([3, 1, 2]) == 2.0
+
+
+def test_metrics_json_export_matches_stdlib_encoding(tmp_path: Path):
+    store = MetricsStore(tmp_path / "events.jsonl")
+    store.record_tool_call(tool="búsqueda", success=True, latency_ms=12.5)
+
+    exported = store.export_snapshot(tmp_path / "snap.json", hours=24)
+    assert exported["ok"] is True
+    text = (tmp_path / "snap.json").read_text(encoding="utf-8")
+    payload = json.loads(text)
+    assert payload["tools"]["top_tools"][0]["tool"] == "búsqueda"
+    assert text == json.dumps(payload, indent=2, ensure_ascii=False) + "\n"
+
+
+def test_metrics_snapshot_cached_reuses_result_until_file_changes(tmp_path: Path, monkeypatch):
+    store = MetricsStore(tmp_path / "events.jsonl")
+    store.record_tool_call(tool="exec", success=True, latency_ms=5)
+    builds: list[int] = []
+    original = store.snapshot
+    monkeypatch.setattr(
+        store, "snapshot", lambda hours=24: (builds.append(hours), original(hours))[1]
+    )
+
+    first = store.snapshot_cached(hours=24)
+    assert store.snapshot_cached(hours=24) is first
+    assert builds == [24]
+
+    store.snapshot_cached(hours=6)
+    assert builds == [24, 6]
+
+    store.record_tool_call(tool="exec", success=False, latency_ms=7)
+    assert store.snapshot_cached(hours=24)["tools"]["calls"] == 2
+    assert builds == [24, 6, 24]
+
+    assert store.snapshot_cached(hours=24, max_age_s=0)["tools"]["calls"] == 2
+    assert builds == [24, 6, 24, 24]
+    assert "g_agent_tool_calls_total 2" in store.prometheus_text(snapshot=store.snapshot_cached())
+
+
+def test_metrics_timestamps_parse_per_line_even_when_repeated(tmp_path: Path):
+    events_path = tmp_path / "events.jsonl"
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    stale = (now - timedelta(hours=30)).isoformat()
+    rows = [
+        {"type": "llm_call", "success": True, "ts": now.isoformat()},
+        {"type": "llm_call", "success": True, "ts": now.isoformat()},
+        {"type": "llm_call", "success": True},
+        {"type": "llm_call", "success": True, "ts": stale},
+        {"type": "llm_call", "success": True, "ts": stale},
+        {"type": "llm_call", "success": True, "ts": now.isoformat().replace("+00:00", "Z")},
+        {
+            "type": "llm_call",
+            "success": True,
+            "ts": (now + timedelta(hours=2)).astimezone(timezone(timedelta(hours=2))).isoformat(),
+        },
+    ]
+    events_path.write_text("".join(json.dumps(row) + "\n" for row in rows), encoding="utf-8")
+
+    assert MetricsStore(events_path).snapshot(hours=24)["llm"]["calls"] == 4
@@ -104,3 +104,24 @@ def test_onboard_workspace_files_not_overwritten(tmp_path, monkeypatch):
 
     # Custom AGENTS.md should survive
     assert agents_md.read_text() == custom_content
+
+
+def test_onboard_workspace_templates_created_once(tmp_path, monkeypatch):
+    data_dir = tmp_path / "g-agent"
+    data_dir.mkdir()
+    monkeypatch.setattr("g_agent.config.loader.get_data_path", lambda: data_dir)
+    monkeypatch.setattr("g_agent.utils.helpers.get_data_path", lambda: data_dir)
+
+    first = runner.invoke(app, ["onboard"])
+    assert first.exit_code == 0
+    assert "Created AGENTS.md" in first.stdout
+    assert "Created memory/PROJECTS.md" in first.stdout
+
+    workspace = data_dir / "workspace"
+    assert (workspace / "skills").is_dir()
+    assert (workspace / "memory" / "FACTS.md").read_text().startswith("# Fact Index")
+
+    second = runner.invoke(app, ["onboard"])
+    assert second.exit_code == 0
+    assert "Created AGENTS.md" not in second.stdout
+    assert "Created memory/" not in second.stdout
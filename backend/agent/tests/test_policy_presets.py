@@ -1,3 +1,5 @@
+import pytest
+
 from g_agent.agent.loop import AgentLoop
 from g_agent.config.presets import apply_preset
 from g_agent.config.schema import Config
@@ -69,3 +71,84 @@ def test_policy_resolver_matches_sender_identity_variants():
         loop._resolve_tool_policy("web_search", "whatsapp", "081234567890@s.whatsapp.net")
         == "ask"
     )
+
+
+def test_policy_status_groups_rules_by_scope_in_key_order(tmp_path, monkeypatch):
+    from typer.testing import CliRunner
+
+    from g_agent.cli.commands import app
+    from g_agent.config.loader import save_config
+
+    monkeypatch.setenv("G_AGENT_DATA_DIR", str(tmp_path))
+    monkeypatch.setenv("COLUMNS", "200")
+    config = Config()
+    config.tools.policy = {
+        "telegram:42:exec": "deny",
+        "web_search": "allow",
+        "exec": "ask",
+        "telegram:*:exec": "ask",
+    }
+    save_config(config)
+
+    result = CliRunner().invoke(app, ["policy", "status"])
+
+    assert result.exit_code == 0
+    global_part, scoped_part = result.stdout.split("Scoped Policy Rules")
+    assert global_part.index("exec") < global_part.index("web_search")
+    assert "telegram" not in global_part
+    assert scoped_part.index("telegram:*:exec") < scoped_part.index("telegram:42:exec")
+
+
+def test_preset_rules_are_read_only_and_scoped_without_mutation():
+    from g_agent.config.presets import get_preset, scoped_rules
+
+    preset = get_preset("personal_full")
+    with pytest.raises(TypeError):
+        preset.rules["exec"] = "allow"  # type: ignore[index]
+    assert preset.rules_items == tuple(preset.rules.items())
+
+    assert scoped_rules(preset.rules) == dict(preset.rules)
+    scoped = scoped_rules({"*": "deny", "exec": "ask"}, channel=" telegram ", sender="42")
+    assert scoped == {"telegram:42:*": "deny", "telegram:42:exec": "ask"}
+    assert scoped_rules({"*": "deny", "exec": "ask"}, channel="telegram") == {
+        "telegram:*:*": "deny",
+        "telegram:*:exec": "ask",
+    }
+
+
+def test_apply_preset_counts_changes_against_policy_before_replace():
+    config = Config()
+    config.tools.policy = {"telegram:42:*": "deny", "telegram:42:exec": "allow"}
+
+    first = apply_preset(
+        config, "guest_readonly", channel="telegram", sender="42", replace_scope=True
+    )
+    second = apply_preset(
+        config, "guest_readonly", channel="telegram", sender="42", replace_scope=True
+    )
+
+    assert first["changed_rules"] == first["applied_rules"] - 1
+    assert "telegram:42:exec" not in config.tools.policy
+    assert second["changed_rules"] == 0
+
+
+def test_get_preset_normalizes_name_and_lists_valid_names_on_miss():
+    from g_agent.config.presets import get_preset
+
+    assert get_preset("  Guest_ReadOnly ").name == "guest_readonly"
+    for bad in ("nope", ""):
+        with pytest.raises(ValueError, match="Valid: guest_limited, guest_readonly, personal_full"):
+            get_preset(bad)
+
+
+def test_apply_preset_keeps_risky_tools_when_already_covered():
+    from g_agent.config.presets import PERSONAL_ASK_TOOLS
+
+    config = Config()
+    config.tools.risky_tools = ["zz_custom", *sorted(PERSONAL_ASK_TOOLS)]
+    apply_preset(config, "personal_full")
+    assert config.tools.risky_tools[0] == "zz_custom"
+
+    config.tools.risky_tools = ["zz_custom", "exec"]
+    apply_preset(config, "personal_full")
+    assert config.tools.risky_tools == sorted({"zz_custom", *PERSONAL_ASK_TOOLS})